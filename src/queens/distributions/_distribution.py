@@ -29,11 +29,12 @@ class Distribution(abc.ABC):
     """Base class for probability distributions."""
 
     @abstractmethod
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
         """
 
     @abstractmethod
@@ -116,11 +117,12 @@ class Continuous(Distribution):
         """
 
     @abstractmethod
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
         """
 
     @abstractmethod
@@ -231,11 +233,12 @@ class Discrete(Distribution):
         self.mean, self.covariance = self._compute_mean_and_covariance()
 
     @abstractmethod
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
         """
 
     @abstractmethod
@@ -78,16 +78,17 @@ class Beta(Continuous):
         cdf = self.scipy_beta.cdf(x).reshape(-1)
         return cdf
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
 
         Returns:
             samples (np.ndarray): drawn samples from the distribution
         """
-        samples = self.scipy_beta.rvs(size=num_draws).reshape(-1, 1)
+        samples = self.scipy_beta.rvs(size=num_draws, random_state=rng).reshape(-1, 1)
         return samples
 
     def logpdf(self, x):
@@ -17,12 +17,12 @@
 Disclaimer: Most of our iterators are not able to handle categorical distributions.
 """
 
-import itertools
 import logging
 
 import numpy as np
 
 from queens.distributions._distribution import Distribution
+from queens.utils.alias_table import AliasTable
 from queens.utils.logger_settings import log_init_args
 
 _logger = logging.getLogger(__name__)
@@ -31,9 +31,13 @@ _logger = logging.getLogger(__name__)
 class Categorical(Distribution):
     """General categorical distribution.
 
+    Samples are drawn with an alias table and categories are looked up by a hash map.
+
     Attributes:
         probabilities (np.ndarray): Probabilities associated with the categories
         categories (np.ndarray): Categories
+        alias_table (AliasTable): Alias table to draw the indices of the categories
+        category_indices (dict): Index of each category
     """
 
     @log_init_args
@@ -61,29 +65,31 @@ class Categorical(Distribution):
 
         self.probabilities = probabilities
         self.categories = categories
+        self.alias_table = AliasTable(probabilities)
+        self.category_indices = {category: i for i, category in enumerate(categories)}
+
+    def export_dict(self):
+        """Create a dict of the distribution.
+
+        Returns:
+            export_dict (dict): Dict containing distribution information
+        """
+        export_dict = super().export_dict()
+        export_dict.pop("alias_table")
+        export_dict.pop("category_indices")
+        return export_dict
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
 
         Returns:
             np.ndarray: Samples of the categorical distribution
         """
-        samples_per_category = np.random.multinomial(num_draws, self.probabilities)
-        samples = (
-            [
-                [self.categories[category]] * repetitions
-                for category, repetitions in enumerate(samples_per_category)
-                if repetitions
-            ],
-        )
-        samples = np.array(
-            list(itertools.chain.from_iterable(*samples)),
-            dtype=object,
-        )
-        np.random.shuffle(samples)
+        samples = self.categories[self.alias_table.draw(num_draws, rng=rng)]
         return samples.reshape(-1, 1)
 
     def logpdf(self, x):
@@ -106,5 +112,10 @@ class Categorical(Distribution):
         Returns:
             np.ndarray: pmf
         """
-        index = np.array([np.argwhere(self.categories == xi) for xi in x]).flatten()
+        try:
+            index = [self.category_indices[xi] for xi in np.array(x, dtype=object).flatten()]
+        except KeyError as error:
+            raise ValueError(
+                f"At least one event is not part of the categories {self.categories}"
+            ) from error
         return self.probabilities[index]
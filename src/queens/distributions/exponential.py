@@ -18,6 +18,7 @@ import numpy as np
 
 from queens.distributions._distribution import Continuous
 from queens.utils.logger_settings import log_init_args
+from queens.utils.random_generator import get_random_generator
 
 
 class Exponential(Continuous):
@@ -71,16 +72,19 @@ class Exponential(Continuous):
         cdf = np.where(condition, np.prod(1 - np.exp(-self.rate * x), axis=1), 0)
         return cdf
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
 
         Returns:
             samples (np.ndarray): Drawn samples from the distribution
         """
-        samples = np.random.exponential(scale=self.scale, size=(num_draws, self.dimension))
+        samples = get_random_generator(rng).exponential(
+            scale=self.scale, size=(num_draws, self.dimension)
+        )
         return samples
 
     def logpdf(self, x):
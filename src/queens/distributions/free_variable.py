@@ -38,7 +38,7 @@ class FreeVariable(Continuous):
         """Cumulative distribution function."""
         raise ValueError("cdf method is not supported for FreeVariable.")
 
-    def draw(self, _=1):
+    def draw(self, _=1, rng=None):
         """Draw samples."""
         raise ValueError("draw method is not supported for FreeVariable.")
 
@@ -66,16 +66,17 @@ class LogNormal(Continuous):
         """
         return self.normal_distribution.cdf(np.log(x))
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
 
         Returns:
             samples (np.ndarray): Drawn samples from the distribution
         """
-        return np.exp(self.normal_distribution.draw(num_draws=num_draws))
+        return np.exp(self.normal_distribution.draw(num_draws=num_draws, rng=rng))
 
     def logpdf(self, x):
         """Log of the probability density function.
@@ -20,6 +20,7 @@ from scipy.special import erf  # pylint:disable=no-name-in-module
 
 from queens.distributions._distribution import Continuous
 from queens.utils.logger_settings import log_init_args
+from queens.utils.random_generator import get_random_generator
 
 
 class MeanFieldNormal(Continuous):
@@ -78,18 +79,19 @@ class MeanFieldNormal(Continuous):
         cdf = np.prod(cdf, axis=1).reshape(x.shape[0], -1)
         return cdf
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
 
         Returns:
             samples (np.ndarray): Drawn samples from the distribution
         """
-        samples = np.random.randn(num_draws, self.dimension) * self.standard_deviation.reshape(
-            1, -1
-        ) + self.mean.reshape(1, -1)
+        samples = get_random_generator(rng).standard_normal(
+            (num_draws, self.dimension)
+        ) * self.standard_deviation.reshape(1, -1) + self.mean.reshape(1, -1)
 
         return samples
 
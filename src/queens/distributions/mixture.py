@@ -20,13 +20,28 @@ import numpy as np
 from scipy.special import logsumexp
 
 from queens.distributions._distribution import Continuous
+from queens.distributions.normal import Normal
 from queens.utils.logger_settings import log_init_args
+from queens.utils.random_generator import get_random_generator
 
 _logger = logging.getLogger(__name__)
 
 
 class Mixture(Continuous):
-    """Mixture models."""
+    """Mixture models.
+
+    If all components are normal distributions with dense covariances, their parameters are
+    stacked and all components are evaluated at once.
+
+    Attributes:
+        component_distributions (list): Component distributions of the mixture
+        weights (np.ndarray): Weights of the mixture
+        number_of_components (int): Number of components
+        log_weights (np.ndarray): Logarithm of the weights
+        stacked_normal_components (dict): Stacked means, precisions and logpdf constants of the
+                                          normal components (*None* if not all components are
+                                          normal)
+    """
 
     @log_init_args
     def __init__(self, weights, component_distributions):
@@ -58,6 +73,68 @@ class Mixture(Continuous):
 
         mean, covariance = self._compute_mean_and_covariance(weights, component_distributions)
         super().__init__(mean, covariance, component_distributions[0].dimension)
+        self.log_weights = np.log(weights)
+        self.stacked_normal_components = self._stack_normal_components(component_distributions)
+
+    @staticmethod
+    def _stack_normal_components(component_distributions):
+        """Stack the parameters of normal components.
+
+        Args:
+            component_distributions (list): Components of the mixture
+
+        Returns:
+            dict: Stacked means, precisions and logpdf constants or *None* if not all components
+            are normal distributions with dense covariance
+        """
+        if not all(
+            isinstance(component, Normal) and component.covariance_structure == "dense"
+            for component in component_distributions
+        ):
+            return None
+        return {
+            "mean": np.array([component.mean for component in component_distributions]),
+            "precision": np.array([component.precision for component in component_distributions]),
+            "logpdf_const": np.array(
+                [component.logpdf_const for component in component_distributions]
+            ),
+        }
+
+    def component_logpdfs(self, x, gradients=False):
+        """Evaluate the log pdf of all components.
+
+        Args:
+            x (np.ndarray): Positions at which the log pdfs are evaluated
+            gradients (bool, opt): Also evaluate the gradients of the log pdfs
+
+        Returns:
+            logpdfs (np.ndarray): Log pdf of each component (number of samples x number of
+                                  components)
+            grad_logpdfs (np.ndarray): Gradients of the log pdfs (number of samples x number of
+                                       components x dimension), *None* if not requested
+        """
+        x = x.reshape(-1, self.dimension)
+        grad_logpdfs = None
+        if self.stacked_normal_components is not None:
+            dist = x[:, np.newaxis, :] - self.stacked_normal_components["mean"]
+            precision_dist = np.einsum(
+                "kij,nkj->nki", self.stacked_normal_components["precision"], dist
+            )
+            logpdfs = self.stacked_normal_components["logpdf_const"] - 0.5 * np.sum(
+                dist * precision_dist, axis=2
+            )
+            if gradients:
+                grad_logpdfs = -precision_dist
+        else:
+            logpdfs = np.column_stack(
+                [component.logpdf(x) for component in self.component_distributions]
+            )
+            if gradients:
+                grad_logpdfs = np.stack(
+                    [component.grad_logpdf(x) for component in self.component_distributions],
+                    axis=1,
+                )
+        return logpdfs, grad_logpdfs
 
     @staticmethod
     def _compute_mean_and_covariance(weights, component_distributions):
@@ -79,7 +156,7 @@ class Mixture(Continuous):
         covariance -= np.outer(mean, mean)
         return mean, covariance
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw *num_draw* samples from the variational distribution.
 
         Uses a two step process:
@@ -88,21 +165,23 @@ class Mixture(Continuous):
 
         Args:
             num_draws (int): Number of samples to draw
+            rng (np.random.Generator, optional): Random number generator
 
         Returns:
             samples (np.ndarray): Row wise samples of the variational distribution
         """
-        components = np.random.multinomial(num_draws, self.weights)
+        rng = get_random_generator(rng)
+        components = rng.multinomial(num_draws, self.weights)
         samples = []
         for component, num_draw_component in enumerate(components):
-            sample = self.component_distributions[component].draw(num_draw_component)
+            sample = self.component_distributions[component].draw(num_draw_component, rng=rng)
             samples.append(sample)
         samples = np.concatenate(samples, axis=0)
 
         # Strictly speaking this is not necessary, however, without it, if you only select x
         # samples, so `samples[:x]`, most samples would originate from the first components and this
         # would be biased
-        np.random.shuffle(samples)
+        rng.shuffle(samples)
 
         return samples
 
@@ -126,13 +205,8 @@ class Mixture(Continuous):
         Args:
             x (np.ndarray): Positions at which the log pdf is evaluated
         """
-        log_weights = np.log(self.weights)
-        weighted_logpdf = []
-        for log_weight, component in zip(log_weights, self.component_distributions, strict=True):
-            weighted_logpdf.append(log_weight + component.logpdf(x))
-
-        logpdf = logsumexp(weighted_logpdf, axis=0).flatten()
-
+        logpdfs, _ = self.component_logpdfs(x)
+        logpdf = logsumexp(self.log_weights + logpdfs, axis=1)
         return logpdf
 
     def pdf(self, x):
@@ -149,15 +223,10 @@ class Mixture(Continuous):
         Args:
             x (np.ndarray): Positions at which the gradient of log pdf is evaluated
         """
-        responsibilities = self.responsibilities(x)
-
-        grad_logpdf = 0
-        for responsibility, component in zip(
-            responsibilities.T, self.component_distributions, strict=True
-        ):
-            grad_logpdf += responsibility.reshape(-1, 1) * component.grad_logpdf(x)
-
-        return np.array(grad_logpdf).reshape(len(x), -1)
+        logpdfs, grad_logpdfs = self.component_logpdfs(x, gradients=True)
+        responsibilities = self._responsibilities_from_logpdfs(logpdfs)
+        grad_logpdf = np.sum(responsibilities[:, :, np.newaxis] * grad_logpdfs, axis=1)
+        return grad_logpdf
 
     def ppf(self, _):
         """Percent point function (inverse of cdf — quantiles).
@@ -182,24 +251,21 @@ class Mixture(Continuous):
         Returns:
             np.ndarray: responsibilities (number of samples x number of component)
         """
-        log_weights = np.log(self.weights)
-        inv_log_responsibility = []
-        for log_weight_i, component_i in zip(
-            log_weights, self.component_distributions, strict=True
-        ):
-            data_component_i = []
-            for log_weight_j, component_j in zip(
-                log_weights, self.component_distributions, strict=True
-            ):
-                log_ratio = (
-                    -log_weight_i - component_i.logpdf(x) + log_weight_j + component_j.logpdf(x)
-                )
-                data_component_i.append(log_ratio)
-            inv_log_responsibility.append(data_component_i)
-        inv_log_responsibility = -logsumexp(  # pylint: disable=invalid-unary-operand-type
-            inv_log_responsibility, axis=1
-        )
-        return np.exp(inv_log_responsibility).T
+        logpdfs, _ = self.component_logpdfs(x)
+        return self._responsibilities_from_logpdfs(logpdfs)
+
+    def _responsibilities_from_logpdfs(self, logpdfs):
+        """Compute the responsibilities from the log pdfs of the components.
+
+        Args:
+            logpdfs (np.ndarray): Log pdf of each component (number of samples x number of
+                                  components)
+
+        Returns:
+            np.ndarray: responsibilities (number of samples x number of component)
+        """
+        weighted_logpdfs = self.log_weights + logpdfs
+        return np.exp(weighted_logpdfs - logsumexp(weighted_logpdfs, axis=1, keepdims=True))
 
     def export_dict(self):
         """Create a dict of the distribution.
@@ -209,6 +275,7 @@ class Mixture(Continuous):
         """
         dictionary = super().export_dict()
         dictionary.pop("component_distributions")
+        dictionary.pop("stacked_normal_components")
         for i, components in enumerate(self.component_distributions):
             dictionary.update({f"component_{i}": components.export_dict()})
         return dictionary
@@ -19,6 +19,7 @@ from scipy.stats import multinomial
 
 from queens.distributions._distribution import Discrete
 from queens.utils.logger_settings import log_init_args
+from queens.utils.random_generator import get_random_generator
 
 
 class Multinomial(Discrete):
@@ -58,13 +59,16 @@ class Multinomial(Discrete):
         )
         return mean, covariance
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
         """
-        return np.random.multinomial(self.n_trials, self.probabilities, size=num_draws)
+        return get_random_generator(rng).multinomial(
+            self.n_trials, self.probabilities, size=num_draws
+        )
 
     def logpdf(self, x):
         """Log of the probability mass function.
@@ -21,37 +21,80 @@ import scipy.stats
 from queens.distributions._distribution import Continuous
 from queens.utils.logger_settings import log_init_args
 from queens.utils.numpy_array import at_least_2d
-from queens.utils.numpy_linalg import safe_cholesky
+from queens.utils.random_generator import get_random_generator
+from queens.utils.structured_covariance import create_covariance
 
 
 class Normal(Continuous):
     """Normal distribution.
 
+    The covariance matrix is factorized once (and on every update). Besides dense covariance
+    matrices, diagonal, block-diagonal and Kronecker product covariances are supported, which
+    use structure-exploiting solves. For these, the dense covariance matrix is only assembled if
+    the *covariance* attribute is accessed.
+
     Attributes:
-        low_chol (np.ndarray): Lower-triangular Cholesky factor of covariance matrix.
-        precision (np.ndarray): Precision matrix corresponding to covariance matrix.
+        covariance_structure (str): Structure of the covariance matrix
+        structured_covariance (np.ndarray, list): Covariance in the representation of the
+                                                  covariance structure (*None* for dense
+                                                  covariance matrices)
+        covariance_operator (Covariance): Factorized covariance matrix
         logpdf_const (float): Constant for evaluation of log pdf.
     """
 
     @log_init_args
-    def __init__(self, mean, covariance):
+    def __init__(self, mean, covariance, covariance_structure="dense"):
         """Initialize normal distribution.
 
         Args:
             mean (array_like): mean of the distribution
-            covariance (array_like): covariance of the distribution
+            covariance (array_like, list): covariance of the distribution. Depending on the
+                                           *covariance_structure*: the covariance matrix
+                                           (*dense*), the variances (*diagonal*), the list of
+                                           diagonal blocks (*block_diagonal*) or the list of
+                                           factor matrices of the Kronecker product (*kronecker*)
+            covariance_structure (str, opt): Structure of the covariance matrix
         """
         mean = np.array(mean).reshape(-1)
-        covariance = at_least_2d(np.array(covariance))
+        structured_covariance = None
+        if covariance_structure == "dense":
+            covariance = at_least_2d(np.array(covariance))
+            self._check_covariance_matrix(covariance)
+            covariance_operator = create_covariance(covariance)
+        else:
+            covariance_operator = create_covariance(covariance, covariance_structure)
+            structured_covariance = covariance
+            covariance = None
+
+        dimension = covariance_operator.dimension
+        if mean.shape[0] != dimension:
+            raise ValueError(
+                f"Dimension of mean vector and covariance matrix do not match. "
+                f"Provided dimension of mean vector: {mean.shape[0]}. "
+                f"Provided dimension of covariance matrix: {dimension}. "
+            )
+
+        self._covariance = None
+        super().__init__(mean, covariance, dimension)
+        self.covariance_structure = covariance_structure
+        self.structured_covariance = structured_covariance
+        self.covariance_operator = covariance_operator
+        self.logpdf_const = self._calculate_logpdf_const(covariance_operator)
+        self._precision = None
 
-        # sanity checks
-        dimension = covariance.shape[0]
+    @staticmethod
+    def _check_covariance_matrix(covariance):
+        """Sanity checks of a dense covariance matrix.
+
+        Args:
+            covariance (np.ndarray): Covariance matrix
+        """
         if covariance.ndim != 2:
             raise ValueError(
                 f"Provided covariance is not a matrix. "
                 f"Provided covariance shape: {covariance.shape}"
             )
-        if dimension != covariance.shape[1]:
+        if covariance.shape[0] != covariance.shape[1]:
             raise ValueError(
                 "Provided covariance matrix is not quadratic. "
                 f"Provided covariance shape: {covariance.shape}"
@@ -60,18 +103,78 @@ class Normal(Continuous):
             raise ValueError(
                 "Provided covariance matrix is not symmetric. " f"Provided covariance: {covariance}"
             )
-        if mean.shape[0] != dimension:
-            raise ValueError(
-                f"Dimension of mean vector and covariance matrix do not match. "
-                f"Provided dimension of mean vector: {mean.shape[0]}. "
-                f"Provided dimension of covariance matrix: {dimension}. "
-            )
 
-        low_chol, precision, logpdf_const = self._calculate_distribution_parameters(covariance)
-        super().__init__(mean, covariance, dimension)
-        self.low_chol = low_chol
-        self.precision = precision
-        self.logpdf_const = logpdf_const
+    @property
+    def covariance(self):
+        """Dense covariance matrix.
+
+        For structured covariances, the dense matrix is only assembled on demand and cached.
+
+        Returns:
+            np.ndarray: Dense covariance matrix
+        """
+        if self._covariance is None:
+            self._covariance = self.covariance_operator.to_dense()
+        return self._covariance
+
+    @covariance.setter
+    def covariance(self, covariance):
+        """Set the dense covariance matrix.
+
+        Args:
+            covariance (np.ndarray): Dense covariance matrix or *None* to assemble it on demand
+        """
+        self._covariance = covariance
+
+    @property
+    def low_chol(self):
+        """Lower-triangular Cholesky factor of the covariance matrix.
+
+        Returns:
+            np.ndarray: Dense lower-triangular Cholesky factor
+        """
+        return self.covariance_operator.cholesky_to_dense()
+
+    @property
+    def precision(self):
+        """Precision matrix corresponding to the covariance matrix.
+
+        The dense precision matrix is only computed on demand and cached. The evaluation of the
+        distribution does not depend on it.
+
+        Returns:
+            np.ndarray: Dense precision matrix
+        """
+        if self._precision is None:
+            self._precision = self.covariance_operator.precision_to_dense()
+        return self._precision
+
+    def export_dict(self):
+        """Create a dict of the distribution.
+
+        Dense matrices (covariance, Cholesky factor and precision matrix) are only exported for
+        dense covariances. Otherwise, the structured representation of the covariance is exported.
+
+        Returns:
+            export_dict (dict): Dict containing distribution information
+        """
+        export_dict = {"type": self.__class__.__name__, "mean": self.mean}
+        if self.covariance_structure == "dense":
+            export_dict.update(
+                {
+                    "covariance": self.covariance,
+                    "dimension": self.dimension,
+                    "low_chol": self.low_chol,
+                    "precision": self.precision,
+                }
+            )
+        else:
+            export_dict["structured_covariance"] = self.structured_covariance
+            export_dict["dimension"] = self.dimension
+        export_dict.update(
+            {"logpdf_const": self.logpdf_const, "covariance_structure": self.covariance_structure}
+        )
+        return export_dict
 
     def cdf(self, x):
         """Cumulative distribution function.
@@ -83,21 +186,24 @@ class Normal(Continuous):
             cdf (np.ndarray): cdf at evaluated positions
         """
         cdf = scipy.stats.multivariate_normal.cdf(
-            x.reshape(-1, self.dimension), mean=self.mean, cov=self.covariance
+            x.reshape(-1, self.dimension),
+            mean=self.mean,
+            cov=self.covariance_operator.to_dense(),
         ).reshape(-1)
         return cdf
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
 
         Returns:
             samples (np.ndarray): Drawn samples from the distribution
         """
-        uncorrelated_vector = np.random.randn(self.dimension, num_draws)
-        samples = self.mean + np.dot(self.low_chol, uncorrelated_vector).T
+        uncorrelated_vector = get_random_generator(rng).standard_normal((self.dimension, num_draws))
+        samples = self.mean + self.covariance_operator.cholesky_matmul(uncorrelated_vector.T)
         return samples
 
     def logpdf(self, x):
@@ -110,7 +216,7 @@ class Normal(Continuous):
             logpdf (np.ndarray): log pdf at evaluated positions
         """
         dist = x.reshape(-1, self.dimension) - self.mean
-        logpdf = self.logpdf_const - 0.5 * (np.dot(dist, self.precision) * dist).sum(axis=1)
+        logpdf = self.logpdf_const - 0.5 * self.covariance_operator.quadratic_form(dist)
         return logpdf
 
     def grad_logpdf(self, x):
@@ -123,7 +229,7 @@ class Normal(Continuous):
             grad_logpdf (np.ndarray): Gradient of the log pdf evaluated at positions
         """
         x = x.reshape(-1, self.dimension)
-        grad_logpdf = np.dot(self.mean.reshape(1, -1) - x, self.precision)
+        grad_logpdf = self.covariance_operator.solve(self.mean.reshape(1, -1) - x)
         return grad_logpdf
 
     def pdf(self, x):
@@ -149,7 +255,7 @@ class Normal(Continuous):
         """
         self.check_1d()
         ppf = scipy.stats.norm.ppf(
-            quantiles, loc=self.mean, scale=self.covariance ** (1 / 2)
+            quantiles, loc=self.mean, scale=self.covariance_operator.to_dense() ** (1 / 2)
         ).reshape(-1)
         return ppf
 
@@ -157,33 +263,31 @@ class Normal(Continuous):
         """Update covariance and dependent distribution parameters.
 
         Args:
-            covariance (np.ndarray): Covariance matrix
+            covariance (np.ndarray, list): Covariance in the representation of the covariance
+                                           structure of the distribution
         """
-        low_chol, precision, logpdf_const = self._calculate_distribution_parameters(covariance)
-        self.covariance = covariance
-        self.low_chol = low_chol
-        self.precision = precision
-        self.logpdf_const = logpdf_const
+        covariance_operator = create_covariance(covariance, self.covariance_structure)
+        if self.covariance_structure == "dense":
+            self.covariance = covariance
+        else:
+            self.structured_covariance = covariance
+            self.covariance = None
+        self.covariance_operator = covariance_operator
+        self.logpdf_const = self._calculate_logpdf_const(covariance_operator)
+        self._precision = None
 
     @staticmethod
-    def _calculate_distribution_parameters(covariance):
-        """Calculate covariance dependent distribution parameters.
+    def _calculate_logpdf_const(covariance_operator):
+        """Calculate the constant for the evaluation of the log pdf.
 
         Args:
-            covariance (np.ndarray): Covariance matrix
+            covariance_operator (Covariance): Factorized covariance matrix
 
         Returns:
-            low_chol (np.ndarray): lower-triangular Cholesky factor of covariance matrix
-            precision (np.ndarray): Precision matrix corresponding to covariance matrix
             logpdf_const (float): Constant for evaluation of log pdf
         """
-        dimension = covariance.shape[0]
-        low_chol = safe_cholesky(covariance)
-
-        # precision matrix Q and determinant of cov matrix
-        chol_inv = np.linalg.inv(low_chol)
-        precision = np.dot(chol_inv.T, chol_inv)
-
-        # constant needed for pdf
-        logpdf_const = -1 / 2 * (np.log(2.0 * np.pi) * dimension + np.linalg.slogdet(covariance)[1])
-        return low_chol, precision, logpdf_const
+        return (
+            -1
+            / 2
+            * (np.log(2.0 * np.pi) * covariance_operator.dimension + covariance_operator.logdet)
+        )
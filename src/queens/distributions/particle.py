@@ -14,12 +14,12 @@
 #
 """Discrete particle distribution."""
 
-import itertools
 import logging
 
 import numpy as np
 
 from queens.distributions._distribution import Discrete
+from queens.utils.alias_table import AliasTable
 
 _logger = logging.getLogger(__name__)
 
@@ -36,6 +36,10 @@ class Particle(Discrete):
     This class can be used directly, but is also used as parent class for other 1d discrete
     distributions as the computation of expectations is done in the same fashion.
 
+    Samples are drawn with an alias table and events are looked up by a binary search (1d) or a
+    hash map (multivariate). Both are built on first use, such that the costs of drawing and
+    evaluating do not scale with the number of events.
+
     Attributes:
         mean (np.ndarray): Mean of the distribution
         covariance (np.ndarray): Covariance of the distribution
@@ -44,6 +48,19 @@ class Particle(Discrete):
         sample_space (np.ndarray): Samples, i.e. possible outcomes of sampling the distribution
     """
 
+    def __init__(self, probabilities, sample_space, dimension=None):
+        """Initialize the particle distribution.
+
+        Args:
+            probabilities (np.ndarray): Probabilities associated to all the events in the sample
+                                        space
+            sample_space (np.ndarray): Samples, i.e. possible outcomes of sampling the distribution
+            dimension (int): Dimension of a sample event
+        """
+        super().__init__(probabilities, sample_space, dimension)
+        self._alias_table = None
+        self._event_indices = None
+
     def _compute_mean_and_covariance(self):
         """Compute the mean value and covariance of the mixture model.
 
@@ -61,6 +78,17 @@ class Particle(Discrete):
         )
         return mean, covariance
 
+    def export_dict(self):
+        """Create a dict of the distribution.
+
+        Returns:
+            export_dict (dict): Dict containing distribution information
+        """
+        export_dict = super().export_dict()
+        export_dict.pop("_alias_table")
+        export_dict.pop("_event_indices")
+        return export_dict
+
     def cdf(self, x):
         """Cumulative distribution function.
 
@@ -74,25 +102,48 @@ class Particle(Discrete):
         closest_sample_event = np.searchsorted(self.sample_space.flatten(), x.flatten())
         return np.array([np.sum(self.probabilities[: (idx + 1)]) for idx in closest_sample_event])
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
+
+        Returns:
+            np.ndarray: Drawn sample events
         """
-        samples_per_event = np.random.multinomial(num_draws, self.probabilities)
-        samples = (
-            [
-                [self.sample_space[sample_event]] * repetitions
-                for sample_event, repetitions in enumerate(samples_per_event)
-                if repetitions
-            ],
-        )
-        samples = np.array(
-            list(itertools.chain.from_iterable(*samples)),
-        )
-        np.random.shuffle(samples)
-        return samples.reshape(-1, 1)
+        if self._alias_table is None:
+            self._alias_table = AliasTable(self.probabilities)
+        return self.sample_space[self._alias_table.draw(num_draws, rng=rng)]
+
+    def event_index(self, x):
+        """Get the indices of events in the sample space.
+
+        Args:
+            x (np.ndarray): Events
+
+        Returns:
+            np.ndarray: Indices of the events in the sample space
+        """
+        x = np.array(x).reshape(-1, self.dimension)
+        if self.dimension == 1:
+            # the sample space of 1d distributions is sorted
+            events = self.sample_space[:, 0]
+            index = np.searchsorted(events, x[:, 0]).clip(max=len(events) - 1)
+            is_event = events[index] == x[:, 0]
+        else:
+            if self._event_indices is None:
+                self._event_indices = {
+                    tuple(event): i for i, event in enumerate(self.sample_space.tolist())
+                }
+            index = np.array([self._event_indices.get(tuple(xi), -1) for xi in x.tolist()])
+            is_event = index >= 0
+
+        if not np.all(is_event):
+            raise ValueError(
+                f"At least one event is not part of the sample space {self.sample_space}"
+            )
+        return index
 
     def logpdf(self, x):
         """Log of the probability mass function.
@@ -108,14 +159,7 @@ class Particle(Discrete):
         Args:
             x (np.ndarray): Positions at which the pdf is evaluated
         """
-        index = np.array([(self.sample_space == xi).all(axis=1).nonzero()[0] for xi in x]).flatten()
-
-        if len(index) != len(x):
-            raise ValueError(
-                f"At least one event is not part of the sample space {self.sample_space}"
-            )
-
-        return self.probabilities[index]
+        return self.probabilities[self.event_index(x)]
 
     def ppf(self, quantiles):
         """Percent point function (inverse of cdf-quantiles).
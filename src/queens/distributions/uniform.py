@@ -20,6 +20,7 @@ import scipy.stats
 
 from queens.distributions._distribution import Continuous
 from queens.utils.logger_settings import log_init_args
+from queens.utils.random_generator import get_random_generator
 
 
 class Uniform(Continuous):
@@ -78,16 +79,17 @@ class Uniform(Continuous):
         )
         return cdf
 
-    def draw(self, num_draws=1):
+    def draw(self, num_draws=1, rng=None):
         """Draw samples.
 
         Args:
             num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
 
         Returns:
             samples (np.ndarray): Drawn samples from the distribution
         """
-        samples = np.random.uniform(
+        samples = get_random_generator(rng).uniform(
             low=self.lower_bound, high=self.upper_bound, size=(num_draws, self.dimension)
         )
         return samples
@@ -21,6 +21,8 @@ import numpy as np
 from queens.iterators._iterator import Iterator
 from queens.utils.logger_settings import log_init_args
 from queens.utils.process_outputs import write_results
+from queens.utils.quasi_monte_carlo import draw_rqmc_samples, rqmc_mean_and_standard_error
+from queens.utils.random_generator import spawn_random_generators, spawn_seed_sequences
 
 _logger = logging.getLogger(__name__)
 
@@ -48,6 +50,10 @@ class ControlVariates(Iterator):
 
     The implementation is based on chapter 9.3 in [1] and uses one control variate.
 
+    The samples can also be drawn from scrambled low-discrepancy sequences (randomized quasi-Monte
+    Carlo). With several independent randomizations, the standard deviation of the estimator is
+    additionally estimated from the spread of the randomizations (``std_rqmc``).
+
     References:
         [1] D. P. Kroese, Z. I. Botev, and T. Taimre. "Handbook of Monte Carlo Methods". Wiley,
             2011.
@@ -73,6 +79,9 @@ class ControlVariates(Iterator):
                        * ``sample_ratio`` (float): Ratio of number of samples on control variate to
                                                    number of samples on main model. Is only part of
                                                    output if use_optimal_num_samples is True.
+                       * ``std_rqmc`` (float): Standard deviation of the cross-model estimator
+                                               estimated from the randomizations. Is only part of
+                                               output for several randomizations.
 
         num_samples_cv (int): Number of samples to use for computing the expectation
                               of the control variate if this expectation is unknown.
@@ -84,6 +93,12 @@ class ControlVariates(Iterator):
         cost_model (float): Cost of evaluating the model.
         cost_cv (float): Cost of evaluating the control variate.
         variance_cv_mean_estimator (float): Variance of the control variate mean estimator.
+        qmc_sequence (str, None): Low-discrepancy sequence ('sobol' or 'halton') of randomized
+                                  quasi-Monte Carlo sampling. None for pseudo-random sampling.
+        num_randomizations (int): Number of independent randomizations of the sequence.
+        randomization_ids (np.array, None): Randomization of each sample.
+        independent_streams (bool): If True, the pseudo-random samples are drawn from independent
+                                    random streams spawned from the seed.
     """
 
     @log_init_args
@@ -100,6 +115,9 @@ class ControlVariates(Iterator):
         use_optimal_num_samples=False,
         cost_model=None,
         cost_cv=None,
+        qmc_sequence=None,
+        num_randomizations=1,
+        independent_streams=False,
     ):
         """Initialize the control variates iterator.
 
@@ -120,6 +138,15 @@ class ControlVariates(Iterator):
                                                  control variates estimator is minimized.
             cost_model (float, opt): Cost of evaluating the model.
             cost_cv (float, opt): Cost of evaluating the control variate.
+            qmc_sequence (str, opt): Low-discrepancy sequence ('sobol' or 'halton') to draw the
+                                     samples from. By default, pseudo-random samples are drawn.
+            num_randomizations (int, opt): Number of independent randomizations of the sequence.
+                                           The samples are split evenly among them.
+            independent_streams (bool, opt): If True, the pseudo-random samples of the
+                                             cross-model estimator and of the control variate mean
+                                             are drawn from two independent random streams
+                                             spawned from the seed. Otherwise, they are drawn from
+                                             the globally seeded random state.
 
         Raises:
             ValueError: If model is None.
@@ -158,12 +185,41 @@ class ControlVariates(Iterator):
         self.cost_model = cost_model
         self.cost_cv = cost_cv
         self.variance_cv_mean_estimator = 0
+        self.qmc_sequence = qmc_sequence
+        self.num_randomizations = num_randomizations
+        self.randomization_ids = None
+        self.independent_streams = independent_streams
+
+    def _draw_samples(self, num_samples, stream):
+        """Draw pseudo-random or randomized quasi-Monte Carlo samples.
+
+        Args:
+            num_samples (int): Number of samples
+            stream (int): Random stream of the randomizations (0 for the cross-model estimator and
+                          1 for the control variate mean)
+
+        Returns:
+            samples (np.array): Samples
+            randomization_ids (np.array, None): Randomization of each sample
+        """
+        if self.qmc_sequence is None:
+            rng = None
+            if self.independent_streams:
+                rng = spawn_random_generators(self.seed, 2)[stream]
+            return self.parameters.draw_samples(num_samples, rng=rng), None
+        return draw_rqmc_samples(
+            self.parameters,
+            num_samples,
+            self.num_randomizations,
+            self.qmc_sequence,
+            spawn_seed_sequences(self.seed, 2)[stream],
+        )
 
     def pre_run(self):
         """Draw samples for the core run."""
         np.random.seed(self.seed)
 
-        self.samples = self.parameters.draw_samples(self.num_samples)
+        self.samples, self.randomization_ids = self._draw_samples(self.num_samples, 0)
 
     def core_run(self):
         """Core run of iterator.
@@ -210,12 +266,23 @@ class ControlVariates(Iterator):
                         "Optimal number of samples not possible for the chosen input models."
                     )
                 self.num_samples_cv = int(sample_ratio * self.num_samples)
+                if self.qmc_sequence is not None:
+                    # split the samples evenly among the randomizations
+                    self.num_samples_cv = int(
+                        np.ceil(self.num_samples_cv / self.num_randomizations)
+                        * self.num_randomizations
+                    )
 
             # Draw samples and estimate the mean of the control variate via naive monte carlo.
-            samples = self.parameters.draw_samples(self.num_samples_cv)
+            samples, randomization_ids = self._draw_samples(self.num_samples_cv, 1)
             results = self.control_variate.evaluate(samples)["result"]
             self.expectation_cv = results.mean()
             self.variance_cv_mean_estimator = results.var() / self.num_samples_cv
+            if self.qmc_sequence is not None and self.num_randomizations > 1:
+                _, standard_error = rqmc_mean_and_standard_error(
+                    results.reshape(-1), randomization_ids
+                )
+                self.variance_cv_mean_estimator = standard_error**2
 
         # Calculate coefficient that determines how much the control variate influences
         # the control variate mean estimator.
@@ -241,6 +308,14 @@ class ControlVariates(Iterator):
         if self.use_optimal_num_samples:
             self.output["sample_ratio"] = sample_ratio
 
+        if self.qmc_sequence is not None and self.num_randomizations > 1:
+            _, standard_error = rqmc_mean_and_standard_error(
+                output_model - cv_influence_coeff * output_cv, self.randomization_ids
+            )
+            self.output["std_rqmc"] = (
+                standard_error**2 + cv_influence_coeff**2 * self.variance_cv_mean_estimator
+            ) ** 0.5
+
     def post_run(self):
         """Write results to result file."""
         write_results(
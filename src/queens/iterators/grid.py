@@ -14,28 +14,41 @@
 #
 """Grid Iterator."""
 
+import logging
+
 import numpy as np
 
 from queens.iterators._iterator import Iterator
+from queens.utils.io import load_chunk_results, write_chunk_results
 from queens.utils.logger_settings import log_init_args
 from queens.utils.process_outputs import process_outputs, write_results
 from queens.visualization.grid_iterator_visualization import GridIteratorVisualization
 
+_logger = logging.getLogger(__name__)
+
 
 class Grid(Iterator):
     """Grid Iterator to enable meshgrid evaluations.
 
     Different axis scaling possible: as *linear*, *log10* or *ln*.
 
+    The grid points are generated lazily from their flat index. With a chunk size, the grid is
+    evaluated chunk by chunk and the results of each chunk are written to disk right away, such
+    that an interrupted run can be resumed.
+
     Attributes:
         grid_dict (dict): Dictionary containing grid information.
         result_description (dict):  Description of desired results.
-        samples (np.array):   Array with all samples.
+        samples (np.array):   Array with all samples (assembled in the post run).
         output (np.array):   Array with all model outputs.
         num_grid_points_per_axis (list):  List with number of grid points for each grid axis.
         num_parameters (int):   Number of parameters to be varied.
         scale_type (list): List with string entries denoting scaling type for each grid axis.
         visualization (GridIteratorVisualization): Visualization object for the grid iterator.
+        grid_point_list (list): Grid coordinates of each axis.
+        chunk_size (int, None): Number of grid points evaluated at once. None evaluates all grid
+                                points at once without writing chunks to disk.
+        resume (bool): If True, chunks with existing results on disk are not evaluated again.
     """
 
     @log_init_args
@@ -46,6 +59,8 @@ class Grid(Iterator):
         global_settings,
         result_description,
         grid_design,
+        chunk_size=None,
+        resume=False,
     ):
         """Initialize grid iterator.
 
@@ -56,6 +71,11 @@ class Grid(Iterator):
                                               and the output directory
             result_description (dict):  Description of desired results
             grid_design (dict): Dictionary containing grid information
+            chunk_size (int, opt): Number of grid points evaluated at once. The results of each
+                                   chunk are written to disk. By default, all grid points are
+                                   evaluated at once.
+            resume (bool, opt): If True, chunks with existing results on disk are loaded instead
+                                of evaluated.
         """
         super().__init__(model, parameters, global_settings)
         self.grid_dict = grid_design
@@ -65,6 +85,9 @@ class Grid(Iterator):
         self.num_grid_points_per_axis = []
         self.num_parameters = self.parameters.num_parameters
         self.scale_type = []
+        self.grid_point_list = []
+        self.chunk_size = chunk_size
+        self.resume = resume
 
         self.visualization = None
         if result_description.get("plotting_options"):
@@ -73,7 +96,7 @@ class Grid(Iterator):
             )
 
     def pre_run(self):
-        """Generate samples based on description in *grid_dict*."""
+        """Set up the grid axes based on description in *grid_dict*."""
         # Sanity check for random fields
         if self.parameters.random_field_flag:
             raise RuntimeError(
@@ -82,6 +105,8 @@ class Grid(Iterator):
 
         # pre-allocate empty list for filling up with vectors of grid points as elements
         grid_point_list = []
+        self.num_grid_points_per_axis = []
+        self.scale_type = []
 
         #  set up 1D arrays for each parameter (needs bounds and type of axis)
         for index, (parameter_name, parameter) in enumerate(self.parameters.dict.items()):
@@ -154,23 +179,87 @@ class Grid(Iterator):
                     " grid iterator (possible: 'FLOAT' or 'INT') "
                 )
 
-        grid_coords = np.meshgrid(*grid_point_list)
-        self.samples = np.empty(
-            [np.prod(self.num_grid_points_per_axis), self.num_parameters], dtype=object
+        self.grid_point_list = [axis.astype(float) for axis in grid_point_list]
+
+    @property
+    def num_grid_points(self):
+        """Total number of grid points.
+
+        Returns:
+            int: Number of grid points
+        """
+        return int(np.prod(self.num_grid_points_per_axis))
+
+    def grid_points(self, indices=None):
+        """Grid points at flat indices.
+
+        The points are ordered as the flattened *np.meshgrid* of the axes (Cartesian indexing).
+
+        Args:
+            indices (np.ndarray, opt): Flat indices of the grid points. Defaults to all points.
+
+        Returns:
+            np.ndarray: Grid points of shape (num_points, num_parameters)
+        """
+        if indices is None:
+            indices = np.arange(self.num_grid_points)
+
+        # np.meshgrid uses Cartesian indexing, i.e., the first two axes are swapped
+        shape = list(self.num_grid_points_per_axis)
+        if len(shape) > 1:
+            shape[0], shape[1] = shape[1], shape[0]
+        axis_indices = list(np.unravel_index(indices, shape))
+        if len(shape) > 1:
+            axis_indices[0], axis_indices[1] = axis_indices[1], axis_indices[0]
+
+        return np.column_stack(
+            [axis[axis_index] for axis, axis_index in zip(self.grid_point_list, axis_indices)]
         )
-        for i in range(self.num_parameters):
-            self.samples[:, i] = grid_coords[i].flatten()
 
     def core_run(self):
-        """Evaluate the meshgrid on model."""
-        self.output = self.model.evaluate(self.samples)
+        """Evaluate the grid on the model (chunk by chunk)."""
+        if self.chunk_size is None:
+            self.output = self.model.evaluate(self.grid_points())
+            return
+
+        chunk_outputs = []
+        for chunk_start in range(0, self.num_grid_points, self.chunk_size):
+            chunk_indices = np.arange(
+                chunk_start, min(chunk_start + self.chunk_size, self.num_grid_points)
+            )
+            chunk_outputs.append(
+                self._evaluate_chunk(chunk_start // self.chunk_size, chunk_indices)
+            )
+
+        self.output = {
+            key: np.concatenate([chunk_output[key] for chunk_output in chunk_outputs])
+            for key in chunk_outputs[0]
+        }
+
+    def _evaluate_chunk(self, chunk_id, chunk_indices):
+        """Evaluate a chunk of grid points and write its results to disk.
+
+        When resuming, existing results of the chunk are loaded if they belong to the same grid
+        points.
+
+        Args:
+            chunk_id (int): Number of the chunk
+            chunk_indices (np.ndarray): Flat indices of the grid points of the chunk
+
+        Returns:
+            dict: Model output of the chunk
+        """
+        samples = self.grid_points(chunk_indices)
+        chunk_file = self.global_settings.result_file(".npz", suffix=f"_grid_chunk_{chunk_id}")
+        if self.resume:
+            chunk_output = load_chunk_results(chunk_file, samples)
+            if chunk_output is not None:
+                return chunk_output
+        return write_chunk_results(chunk_file, samples, self.model.evaluate(samples))
 
     def post_run(self):
         """Analyze the results."""
-        # convert samples array (if provided) from general object to float for
-        # visualization
-        if self.samples is not None:
-            self.samples = self.samples.astype(float)
+        self.samples = self.grid_points()
 
         if self.result_description is not None:
             results = process_outputs(self.output, self.result_description, self.samples)
@@ -20,6 +20,7 @@ import numpy as np
 from pyDOE import lhs
 
 from queens.iterators._iterator import Iterator
+from queens.utils.latin_hypercube import optimized_latin_hypercube
 from queens.utils.logger_settings import log_init_args
 from queens.utils.process_outputs import process_outputs, write_results
 
@@ -29,10 +30,17 @@ _logger = logging.getLogger(__name__)
 class LatinHypercubeSampling(Iterator):
     """Basic LHS Iterator to enable Latin Hypercube sampling.
 
+    The designs are either created with pyDOE or with the native generator. The native generator
+    optimizes the design by exchanges of entries with incremental updates of the criterion (see
+    queens.utils.latin_hypercube). It stops early once the design no longer improves. An exchange
+    costs O(N·D) operations for the maximin criteria and O(D) for the correlation criterion, so for
+    large designs the maximin optimization is limited by *num_exchanges*.
+
     Attributes:
         seed (int): Seed for numpy random number generator.
         num_samples (int):    Number of samples to compute.
-        num_iterations (int): Number of optimization iterations of design.
+        num_iterations (int): Number of optimization iterations of the pyDOE design.
+        num_exchanges (int, None): Maximum number of proposed exchanges of the native generator.
         result_description (dict):  Description of desired results.
         criterion (str): Allowable values are:
 
@@ -40,6 +48,7 @@ class LatinHypercubeSampling(Iterator):
             *   *maximin* or *m*
             *   *centermaximin* or *cm*
             *   *correlation* or *corr*
+        generator (str): Generator of the design, "pydoe" or "native"
         samples (np.array):   Array with all samples.
         output (np.array):   Array with all model outputs.
     """
@@ -55,6 +64,8 @@ class LatinHypercubeSampling(Iterator):
         result_description=None,
         num_iterations=10,
         criterion="maximin",
+        generator="pydoe",
+        num_exchanges=None,
     ):
         """Initialise LHSiterator.
 
@@ -66,34 +77,57 @@ class LatinHypercubeSampling(Iterator):
             seed (int): Seed for numpy random number generator
             num_samples (int):    Number of samples to compute
             result_description (dict, opt):  Description of desired results
-            num_iterations (int): Number of optimization iterations of design
+            num_iterations (int): Number of optimization iterations of the pyDOE design
             criterion (str): Allowable values are "center" or "c", "maximin" or "m",
                              "centermaximin" or "cm", and "correlation" or "corr"
+            generator (str, opt): Generator of the design, "pydoe" or "native"
+            num_exchanges (int, opt): Maximum number of proposed exchanges of the native
+                                      generator. Defaults to ten times the number of entries of
+                                      the design.
         """
+        if generator not in ("pydoe", "native"):
+            raise ValueError(
+                f"Unknown generator '{generator}'. Valid generators are 'pydoe' and 'native'."
+            )
         super().__init__(model, parameters, global_settings)
         self.seed = seed
         self.num_samples = num_samples
         self.num_iterations = num_iterations
         self.result_description = result_description
         self.criterion = criterion
+        self.generator = generator
+        self.num_exchanges = num_exchanges
         self.samples = None
         self.output = None
 
     def pre_run(self):
         """Generate samples for subsequent LHS analysis."""
-        np.random.seed(self.seed)
-
         num_inputs = self.parameters.num_parameters
 
         _logger.info("Number of inputs: %s", num_inputs)
         _logger.info("Number of samples: %s", self.num_samples)
         _logger.info("Criterion: %s", self.criterion)
-        _logger.info("Number of iterations: %s", self.num_iterations)
+        _logger.info("Generator: %s", self.generator)
 
         # create latin hyper cube samples in unit hyper cube
-        hypercube_samples = lhs(
-            num_inputs, self.num_samples, criterion=self.criterion, iterations=self.num_iterations
-        )
+        if self.generator == "native":
+            _logger.info("Maximum number of exchanges: %s", self.num_exchanges)
+            hypercube_samples = optimized_latin_hypercube(
+                self.num_samples,
+                num_inputs,
+                criterion=self.criterion,
+                num_exchanges=self.num_exchanges,
+                rng=np.random.default_rng(self.seed),
+            )
+        else:
+            _logger.info("Number of iterations: %s", self.num_iterations)
+            np.random.seed(self.seed)
+            hypercube_samples = lhs(
+                num_inputs,
+                self.num_samples,
+                criterion=self.criterion,
+                iterations=self.num_iterations,
+            )
         # scale and transform samples according to the inverse cdf
         self.samples = self.parameters.inverse_cdf_transform(hypercube_samples)
 
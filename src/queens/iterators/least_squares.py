@@ -62,6 +62,7 @@ class LeastSquares(Optimization):
         jac_method="2-point",
         jac_rel_step=None,
         objective_and_jacobian=True,
+        max_precalculated_positions=None,
     ):
         """Initialize LeastSquares.
 
@@ -108,6 +109,9 @@ class LeastSquares(Optimization):
                                                 batching, but can lead to unnecessary evaluations of
                                                 the jacobian during line-search.
                                                 Default is true.
+            max_precalculated_positions (int, opt): Maximum number of stored precalculated
+                                                    positions. By default, all positions are
+                                                    stored.
         """
         super().__init__(
             model=model,
@@ -122,14 +126,22 @@ class LeastSquares(Optimization):
             jac_method=jac_method,
             jac_rel_step=jac_rel_step,
             objective_and_jacobian=objective_and_jacobian,
+            max_precalculated_positions=max_precalculated_positions,
         )
         self.algorithm = algorithm  # We don't want algorithm.upper() here
 
-    def core_run(self):
-        """Core run of LeastSquares iterator."""
-        self.solution = least_squares(
+    def _minimize(self, initial_guess):
+        """Run the least-squares optimization from an initial guess.
+
+        Args:
+            initial_guess (np.array): Start point of the optimization
+
+        Returns:
+            OptimizeResult: Solution of the optimization
+        """
+        return least_squares(
             self.objective,
-            self.initial_guess,
+            initial_guess,
             method=self.algorithm,
             jac=self.jacobian,
             bounds=self.bounds,
@@ -137,6 +149,18 @@ class LeastSquares(Optimization):
             verbose=int(self.verbose_output),
         )
 
+    @staticmethod
+    def _solution_objective(solution):
+        """Objective function value of a solution.
+
+        Args:
+            solution (OptimizeResult): Solution of the optimization
+
+        Returns:
+            float: Cost of the solution
+        """
+        return solution.cost
+
     def post_run(self):
         """Analyze the resulting optimum."""
         _logger.info("Optimality:\n\t%s", self.solution.optimality)
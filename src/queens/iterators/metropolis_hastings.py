@@ -35,6 +35,7 @@ from queens.utils import mcmc as mcmc_utils
 from queens.utils import sequential_monte_carlo as smc_utils
 from queens.utils.logger_settings import log_init_args
 from queens.utils.process_outputs import process_outputs, write_results
+from queens.utils.random_generator import spawn_random_generators
 
 _logger = logging.getLogger(__name__)
 
@@ -49,6 +50,23 @@ class MetropolisHastings(Iterator):
     The implemented version is a random walk Metropolis-Hastings
     algorithm.
 
+    If a surrogate of the log-likelihood is provided, delayed-acceptance Metropolis-Hastings [1]
+    is used: proposals are first screened with the surrogate and the model is only evaluated for
+    proposals passing this first stage. The second stage corrects for the surrogate error. The
+    surrogate is retrained every *surrogate_update_interval* steps on the most recent
+    *max_surrogate_training_size* model evaluations. Until it is trained for the first time,
+    standard Metropolis-Hastings steps are performed.
+
+    The chain targets the exact posterior only for a fixed surrogate, i.e., for the steps after
+    its last update. Per default, the surrogate is therefore frozen after the burn-in, such that
+    all retained samples are exact. If the surrogate is also adapted in the sampling phase
+    (*freeze_surrogate_after_burn_in=False*), the kernel depends on the history of the chain and
+    the samples are only approximately distributed according to the posterior.
+
+    References:
+        [1]: Christen, J. A., & Fox, C. (2005). Markov chain Monte Carlo using an approximation.
+             Journal of Computational and Graphical Statistics, 14(4), 795-810.
+
     Attributes:
         num_chains (int): Number of independent chains to run.
         num_samples (int): Number of samples to draw per chain.
@@ -68,8 +86,21 @@ class MetropolisHastings(Iterator):
         log_prior (np.array): Logarithms of the prior probabilities of the samples.
         log_posterior (np.array): Logarithms of the posterior probabilities of the samples.
         seed (int): Seed for random number generation.
+        rng (np.random.Generator, None): Random number generator of the chains. None if the
+                                         globally seeded random state is used.
         accepted (np.array): Number of accepted proposals per chain.
         accepted_interval (np.array): Number of proposals per chain in current tuning interval.
+        surrogate (Surrogate): Surrogate of the log-likelihood for delayed acceptance.
+        surrogate_update_interval (int): Retrain the surrogate every *surrogate_update_interval*-th
+                                         step.
+        max_surrogate_training_size (int, None): Maximum number of the most recent model
+                                                 evaluations the surrogate is trained on.
+        freeze_surrogate_after_burn_in (bool): Stop the adaptation of the surrogate after the
+                                               burn-in.
+        surrogate_frozen (bool): Whether the adaptation of the surrogate is stopped.
+        surrogate_x_train (list): Samples at which the model was evaluated.
+        surrogate_y_train (list): Corresponding log-likelihood values.
+        num_model_evaluations (int): Number of samples evaluated by the model.
     """
 
     @log_init_args
@@ -89,6 +120,11 @@ class MetropolisHastings(Iterator):
         num_chains=1,
         as_smc_rejuvenation_step=False,
         temper_type="bayes",
+        surrogate=None,
+        surrogate_update_interval=10,
+        max_surrogate_training_size=1000,
+        freeze_surrogate_after_burn_in=True,
+        independent_streams=False,
     ):
         """Initialize Metropolis-Hastings iterator.
 
@@ -111,6 +147,20 @@ class MetropolisHastings(Iterator):
                                              rejuvenation step for an SMC iterator or as the main
                                              iterator itself.
             temper_type (str): Temper type ('bayes' or 'generic')
+            surrogate (Surrogate, opt): Surrogate of the log-likelihood. If provided,
+                                        delayed-acceptance Metropolis-Hastings is used.
+            surrogate_update_interval (int, opt): Retrain the surrogate every
+                                                  *surrogate_update_interval*-th step.
+            max_surrogate_training_size (int, opt): Maximum number of the most recent model
+                                                    evaluations the surrogate is trained on. If
+                                                    None, all evaluations are used.
+            freeze_surrogate_after_burn_in (bool, opt): Stop the adaptation of the surrogate after
+                                                        the burn-in, such that the sampling phase
+                                                        targets the exact posterior.
+            independent_streams (bool, opt): If True, the initial samples, proposals and
+                                             acceptance decisions are drawn from an independent
+                                             random stream spawned from the seed. Otherwise, they
+                                             are drawn from the globally seeded random state.
         """
         super().__init__(model, parameters, global_settings)
 
@@ -152,10 +202,30 @@ class MetropolisHastings(Iterator):
         self.log_posterior = np.zeros((self.tot_num_samples, self.num_chains))
 
         self.seed = seed
+        self.rng = spawn_random_generators(seed, 1)[0] if independent_streams else None
 
         self.accepted = np.zeros(self.num_chains)
         self.accepted_interval = np.zeros(self.num_chains)
 
+        if (
+            surrogate is not None
+            and freeze_surrogate_after_burn_in
+            and num_burn_in < surrogate_update_interval
+        ):
+            raise ValueError(
+                "The surrogate is frozen after the burn-in and would never be trained. Provide at "
+                f"least surrogate_update_interval={surrogate_update_interval} burn-in steps or set "
+                "freeze_surrogate_after_burn_in=False."
+            )
+        self.surrogate = surrogate
+        self.surrogate_update_interval = surrogate_update_interval
+        self.max_surrogate_training_size = max_surrogate_training_size
+        self.freeze_surrogate_after_burn_in = freeze_surrogate_after_burn_in
+        self.surrogate_frozen = False
+        self.surrogate_x_train = []
+        self.surrogate_y_train = []
+        self.num_model_evaluations = 0
+
     def eval_log_prior(self, samples):
         """Evaluate natural logarithm of prior at samples of chains.
 
@@ -179,6 +249,56 @@ class MetropolisHastings(Iterator):
         log_likelihood = self.model.evaluate(samples)["result"]
         return log_likelihood
 
+    def eval_log_likelihood_and_record(self, samples):
+        """Evaluate the log-likelihood and store the evaluations as surrogate training data.
+
+        Args:
+            samples (np.array): Samples for which to evaluate the likelihood.
+
+        Returns:
+            np.array: Logarithms of the likelihood for each sample.
+        """
+        log_likelihood = self.eval_log_likelihood(samples)
+        self.num_model_evaluations += len(samples)
+        if self.surrogate is not None and not self.surrogate_frozen:
+            self.surrogate_x_train.append(np.array(samples))
+            self.surrogate_y_train.append(np.array(log_likelihood).reshape(-1, 1))
+        return log_likelihood
+
+    def eval_surrogate_log_likelihood(self, samples):
+        """Evaluate the surrogate of the log-likelihood.
+
+        Args:
+            samples (np.array): Samples for which to evaluate the surrogate.
+
+        Returns:
+            np.array: Approximated logarithms of the likelihood for each sample.
+        """
+        return self.surrogate.predict(samples)["result"].reshape(-1)
+
+    def update_surrogate(self):
+        """Retrain the surrogate on the most recent model evaluations.
+
+        Older evaluations are discarded, such that the training data is bounded.
+        """
+        x_train = np.concatenate(self.surrogate_x_train, axis=0)
+        y_train = np.concatenate(self.surrogate_y_train, axis=0)
+        if self.max_surrogate_training_size is not None:
+            x_train = x_train[-self.max_surrogate_training_size :]
+            y_train = y_train[-self.max_surrogate_training_size :]
+        self.surrogate_x_train = [x_train]
+        self.surrogate_y_train = [y_train]
+
+        self.surrogate.setup(x_train, y_train)
+        self.surrogate.train()
+        self.surrogate.is_trained = True
+
+    def freeze_surrogate(self):
+        """Stop the adaptation of the surrogate and discard its training data."""
+        self.surrogate_frozen = True
+        self.surrogate_x_train = []
+        self.surrogate_y_train = []
+
     def do_mh_step(self, step_id):
         """Metropolis (Hastings) step.
 
@@ -200,18 +320,25 @@ class MetropolisHastings(Iterator):
         cur_sample = self.chains[step_id - 1]
         # the scaling only holds for random walks
         delta_proposal = (
-            self.proposal_distribution.draw(num_draws=self.num_chains)
+            self.proposal_distribution.draw(num_draws=self.num_chains, rng=self.rng)
             * self.scale_covariance[:, np.newaxis]
         )
         proposal = cur_sample + delta_proposal
 
-        log_likelihood_prop = self.eval_log_likelihood(proposal)
         log_prior_prop = self.eval_log_prior(proposal)
+        if self.surrogate is not None and self.surrogate.is_trained:
+            log_likelihood_prop, log_accept_prob = self._delayed_acceptance_probability(
+                step_id, proposal, log_prior_prop
+            )
+            log_posterior_prop = self.temper(log_prior_prop, log_likelihood_prop, self.gamma)
+        else:
+            log_likelihood_prop = self.eval_log_likelihood_and_record(proposal)
+            log_posterior_prop = self.temper(log_prior_prop, log_likelihood_prop, self.gamma)
+            log_accept_prob = log_posterior_prop - self.log_posterior[step_id - 1]
 
-        log_posterior_prop = self.temper(log_prior_prop, log_likelihood_prop, self.gamma)
-        log_accept_prob = log_posterior_prop - self.log_posterior[step_id - 1]
-
-        new_sample, accepted = mcmc_utils.mh_select(log_accept_prob, cur_sample, proposal)
+        new_sample, accepted = mcmc_utils.mh_select(
+            log_accept_prob, cur_sample, proposal, rng=self.rng
+        )
         self.accepted += accepted
         self.accepted_interval += accepted
 
@@ -225,6 +352,57 @@ class MetropolisHastings(Iterator):
             accepted, log_posterior_prop, self.log_posterior[step_id - 1]
         )
 
+        if (
+            self.surrogate is not None
+            and not self.surrogate_frozen
+            and not step_id % self.surrogate_update_interval
+        ):
+            self.update_surrogate()
+
+    def _delayed_acceptance_probability(self, step_id, proposal, log_prior_prop):
+        """Screen proposals with the surrogate and evaluate the model for the passed ones.
+
+        Args:
+            step_id (int): Current step index for the MCMC run.
+            proposal (np.array): Proposed samples of the chains.
+            log_prior_prop (np.array): Logarithms of the prior of the proposals.
+
+        Returns:
+            log_likelihood_prop (np.array): Log-likelihood of the proposals (of the current
+                                            samples for proposals rejected in the first stage)
+            log_accept_prob (np.array): Logarithm of the acceptance probability of the second
+                                        stage (-inf for proposals rejected in the first stage)
+        """
+        cur_sample = self.chains[step_id - 1]
+        log_posterior_surrogate_cur = self.temper(
+            self.log_prior[step_id - 1],
+            self.eval_surrogate_log_likelihood(cur_sample),
+            self.gamma,
+        )
+        log_posterior_surrogate_prop = self.temper(
+            log_prior_prop, self.eval_surrogate_log_likelihood(proposal), self.gamma
+        )
+        log_accept_prob_surrogate = log_posterior_surrogate_prop - log_posterior_surrogate_cur
+        _, screened = mcmc_utils.mh_select(
+            log_accept_prob_surrogate, cur_sample, proposal, rng=self.rng
+        )
+
+        log_likelihood_prop = self.log_likelihood[step_id - 1].copy()
+        log_accept_prob = np.full(self.num_chains, -np.inf)
+        if np.any(screened):
+            log_likelihood_prop[screened] = np.array(
+                self.eval_log_likelihood_and_record(proposal[screened])
+            ).reshape(-1)
+            log_posterior_prop = self.temper(
+                log_prior_prop[screened], log_likelihood_prop[screened], self.gamma
+            )
+            log_accept_prob[screened] = (
+                log_posterior_prop
+                - self.log_posterior[step_id - 1][screened]
+                - log_accept_prob_surrogate[screened]
+            )
+        return log_likelihood_prop, log_accept_prob
+
     def pre_run(
         self,
         initial_samples=None,
@@ -248,8 +426,8 @@ class MetropolisHastings(Iterator):
             np.random.seed(self.seed)
 
             # draw initial sample from prior distribution
-            initial_samples = self.parameters.draw_samples(self.num_chains)
-            initial_log_like = self.eval_log_likelihood(initial_samples)
+            initial_samples = self.parameters.draw_samples(self.num_chains, rng=self.rng)
+            initial_log_like = self.eval_log_likelihood_and_record(initial_samples)
             initial_log_prior = self.eval_log_prior(initial_samples)
         else:
             # create random walk normal proposal
@@ -258,6 +436,14 @@ class MetropolisHastings(Iterator):
 
         self.gamma = gamma
 
+        if (
+            self.as_smc_rejuvenation_step
+            and self.surrogate is not None
+            and not self.surrogate_frozen
+        ):
+            self.surrogate_x_train.append(np.array(initial_samples))
+            self.surrogate_y_train.append(np.array(initial_log_like).reshape(-1, 1))
+
         self.chains[0] = initial_samples
         self.log_likelihood[0] = initial_log_like
         self.log_prior[0] = initial_log_prior
@@ -280,6 +466,8 @@ class MetropolisHastings(Iterator):
         if self.num_burn_in:
             burn_in_accept_rate = np.exp(np.log(self.accepted) - np.log(self.num_burn_in))
             _logger.info("Acceptance rate during burn in: %s", burn_in_accept_rate)
+        if self.surrogate is not None and self.freeze_surrogate_after_burn_in:
+            self.freeze_surrogate()
         # reset number of accepted samples
         self.accepted = np.zeros(self.num_chains)
         self.accepted_interval = 0
@@ -319,6 +507,7 @@ class MetropolisHastings(Iterator):
                     "log_likelihood": self.log_likelihood,
                     "log_prior": self.log_prior,
                     "log_posterior": self.log_posterior,
+                    "num_model_evaluations": self.num_model_evaluations,
                 },
                 self.result_description,
             )
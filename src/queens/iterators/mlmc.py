@@ -20,8 +20,12 @@ import numpy as np
 
 from queens.distributions.uniform_discrete import UniformDiscrete
 from queens.iterators._iterator import Iterator
+from queens.models.simulation import evaluate_concurrently, supports_concurrent_evaluation
 from queens.utils.logger_settings import log_init_args
+from queens.utils.metadata import get_job_run_times
 from queens.utils.process_outputs import write_results
+from queens.utils.quasi_monte_carlo import draw_rqmc_samples, rqmc_mean_and_standard_error
+from queens.utils.random_generator import spawn_random_generators, spawn_seed_sequences
 
 _logger = logging.getLogger(__name__)
 
@@ -36,6 +40,21 @@ class MLMC(Iterator):
     optimal ratio of samples between the estimators. The number of samples on the highest-fidelity
     model is set by the user.
 
+    Alternatively, a target root mean square error can be prescribed (continuation mode). Starting
+    from the initial number of samples, the number of samples on each estimator is then refined
+    iteratively until the standard deviation of the MLMC estimator reaches the target. The costs of
+    the models are measured from the metadata of their jobs. Only if no times are available, the
+    user-provided costs are used.
+
+    All estimators are evaluated concurrently: each model evaluates the samples of both estimators
+    it contributes to in a single batch, and the jobs of all models sharing a scheduler are
+    submitted at once.
+
+    The samples can also be drawn from scrambled low-discrepancy sequences (randomized quasi-Monte
+    Carlo). Each drawn batch of samples of an estimator is split evenly among independent
+    randomizations. With several randomizations, the standard deviation of the MLMC estimator is
+    additionally estimated from their spread.
+
     The multilevel Monte Carlo (MLMC) estimator is given by
     :math:`\hat{\mu}_\mathrm{MLMC} = \underbrace{\frac{1}{N_{0}} \sum_{i=1}^{N_{0}} f_{0}(x^{(0,
     i)})}_\textrm{estimator 0} + \sum_{l=1}^{L} \underbrace{\bigg \{ \frac{1}{N_{l}} \sum_{i=1}^{N_
@@ -72,6 +91,9 @@ class MLMC(Iterator):
                         * ``std_bootstrap`` (float): Bootstrap approximation of the calculated MLMC
                                                      estimator standard deviation. This value is not
                                                      computed if num_bootstrap_samples is 0.
+                        * ``std_rqmc`` (float): Standard deviation of the MLMC estimator estimated
+                                                from the randomizations. Only computed for several
+                                                randomizations.
 
         cost_estimators (list(float)): The relative cost of each estimator. The i-th
                                        entry of the list corresponds to the i-th estimator.
@@ -82,6 +104,17 @@ class MLMC(Iterator):
         num_bootstrap_samples (int): Number of resamples to use for bootstrap estimate of
                                      standard deviation of this estimator. If set to 0, the
                                      iterator won't compute a bootstrap estimate.
+        seed_sequence (np.random.SeedSequence, None): Root seed sequence of the independent random
+                                                      streams of the estimators. None if the
+                                                      globally seeded random state is used.
+        cost_models (list(float), None): User-provided relative cost of each model.
+        target_rmse (float, None): Target root mean square error of the continuation mode.
+        max_continuation_iterations (int): Maximum number of refinements in continuation mode.
+        model_run_times (list(list)): Measured run times of the jobs of each model.
+        qmc_sequence (str, None): Low-discrepancy sequence ('sobol' or 'halton') of randomized
+                                  quasi-Monte Carlo sampling. None for pseudo-random sampling.
+        num_randomizations (int): Number of independent randomizations of the sequence.
+        randomization_ids (list(np.array)): Randomization of each sample of each estimator.
     """
 
     @log_init_args
@@ -95,6 +128,11 @@ class MLMC(Iterator):
         cost_models=None,
         use_optimal_num_samples=False,
         num_bootstrap_samples=0,
+        independent_streams=False,
+        target_rmse=None,
+        max_continuation_iterations=10,
+        qmc_sequence=None,
+        num_randomizations=1,
     ):
         """Initialize the multilevel Monte Carlo iterator.
 
@@ -117,10 +155,26 @@ class MLMC(Iterator):
                                                    estimate of standard deviation of this
                                                    estimator. If set to 0, the iterator won't
                                                    compute a bootstrap estimate.
+            independent_streams (bool, optional): If True, the samples of each estimator are
+                                                  drawn from an independent random stream
+                                                  spawned from the seed. Otherwise, all samples
+                                                  are drawn from the globally seeded random state.
+            target_rmse (float, optional): If provided, the number of samples is refined until the
+                                           standard deviation of the MLMC estimator reaches this
+                                           target. num_samples are then the initial samples.
+            max_continuation_iterations (int, optional): Maximum number of refinements in
+                                                         continuation mode.
+            qmc_sequence (str, optional): Low-discrepancy sequence ('sobol' or 'halton') to draw
+                                          the samples from. By default, pseudo-random samples are
+                                          drawn.
+            num_randomizations (int, optional): Number of independent randomizations of the
+                                                sequence. The number of samples of each estimator
+                                                has to be divisible by it.
 
         Raises:
             ValueError: If num_samples and models are not of same length.
                         If models is not a list or num_samples is not a list.
+                        If both the optimal number of samples and a target RMSE are requested.
         """
         # Initialize parent iterator with no model.
         super().__init__(None, parameters, global_settings)
@@ -134,6 +188,9 @@ class MLMC(Iterator):
         if not len(num_samples) == len(models):
             raise ValueError("models and num_samples have to be lists of same size!")
 
+        if use_optimal_num_samples and target_rmse is not None:
+            raise ValueError("Use either the optimal number of samples or a target RMSE, not both.")
+
         if use_optimal_num_samples:
             if cost_models is None:
                 raise ValueError(
@@ -143,9 +200,7 @@ class MLMC(Iterator):
             # The cost of one sample evaluation of estimator i is the sum of the cost of model i
             # and model i-1, since both have to be evaluated to compute the expectation of the i-th
             # estimator.
-            self.cost_estimators = [cost_models[0]] + [
-                cost_models[i] + cost_models[i - 1] for i in range(1, len(cost_models))
-            ]
+            self.cost_estimators = self._cost_estimators(cost_models)
 
         self.seed = seed
         self.models = models
@@ -154,6 +209,16 @@ class MLMC(Iterator):
         self.output = None
         self.use_optimal_num_samples = use_optimal_num_samples
         self.num_bootstrap_samples = num_bootstrap_samples
+        self.seed_sequence = (
+            np.random.SeedSequence(seed) if independent_streams or qmc_sequence else None
+        )
+        self.cost_models = cost_models
+        self.target_rmse = target_rmse
+        self.max_continuation_iterations = max_continuation_iterations
+        self.model_run_times = [[] for _ in models]
+        self.qmc_sequence = qmc_sequence
+        self.num_randomizations = num_randomizations
+        self.randomization_ids = None
 
         # Test if number of samples is decreasing with increasing index.
         for i in range(1, len(self.num_samples)):
@@ -164,21 +229,61 @@ class MLMC(Iterator):
                 )
                 break
 
+    @staticmethod
+    def _cost_estimators(cost_models):
+        """Compute the cost of one sample of each estimator.
+
+        The cost of one sample evaluation of estimator i is the sum of the cost of model i and
+        model i-1, since both have to be evaluated to compute the expectation of the i-th estimator.
+
+        Args:
+            cost_models (list(float)): Cost of one evaluation of each model.
+
+        Returns:
+            list(float): Cost of one sample of each estimator.
+        """
+        return [cost_models[0]] + [
+            cost_models[i] + cost_models[i - 1] for i in range(1, len(cost_models))
+        ]
+
     def _draw_samples(self, num_samples):
         """Draw samples from the parameter space.
 
+        With independent streams, each call spawns new streams for all estimators, such that
+        initial and additional samples are reproducible independent of each other. Randomized
+        quasi-Monte Carlo samples are drawn from new randomizations in each call.
+
         Args:
             num_samples (list(int)): Number of samples to draw for each estimator.
 
         Returns:
             samples (list(np.array)): Drawn samples for each estimator.
+            randomization_ids (list(np.array, None)): Randomization of each sample of each
+                                                      estimator (None for pseudo-random samples).
         """
+        if self.qmc_sequence is not None:
+            samples, randomization_ids = [], []
+            for num, seed in zip(
+                num_samples, spawn_seed_sequences(self.seed_sequence, len(num_samples))
+            ):
+                estimator_samples, estimator_ids = draw_rqmc_samples(
+                    self.parameters, num, self.num_randomizations, self.qmc_sequence, seed
+                )
+                samples.append(estimator_samples)
+                randomization_ids.append(estimator_ids)
+            return samples, randomization_ids
+
+        if self.seed_sequence is None:
+            rngs = [None] * len(num_samples)
+        else:
+            rngs = spawn_random_generators(self.seed_sequence, len(num_samples))
+
         samples = []
 
-        for num in num_samples:
-            samples.append(self.parameters.draw_samples(num))
+        for num, rng in zip(num_samples, rngs):
+            samples.append(self.parameters.draw_samples(num, rng=rng))
 
-        return samples
+        return samples, [None] * len(num_samples)
 
     def _compute_estimator_statistics(self, results_estimators):
         """Computes mean and variance for each estimator.
@@ -215,26 +320,155 @@ class MLMC(Iterator):
 
         return np.array(mean_estimators), np.array(var_estimators), mean, std
 
+    def _evaluate_estimators(self, samples):
+        """Evaluate the estimators concurrently.
+
+        Model i is evaluated on the samples of estimator i and estimator i+1 in a single batch, and
+        all models are evaluated at the same time.
+
+        Args:
+            samples (list(np.array)): Samples of each estimator.
+
+        Returns:
+            list(np.array, None): Results of each estimator (None if it has no samples).
+        """
+        model_samples = [np.concatenate(samples[i : i + 2]) for i in range(len(samples))]
+        responses = evaluate_concurrently(self.models, model_samples)
+        self._record_run_times(model_samples)
+
+        results_estimators = []
+        for i, estimator_samples in enumerate(samples):
+            if len(estimator_samples) == 0:
+                results_estimators.append(None)
+                continue
+            result = responses[i]["result"][: len(estimator_samples)]
+            if i > 0:
+                result = result - responses[i - 1]["result"][len(samples[i - 1]) :]
+            results_estimators.append(result)
+
+        return results_estimators
+
+    def _record_run_times(self, model_samples):
+        """Record the run times of the last jobs of each simulation model.
+
+        Args:
+            model_samples (list(np.array)): Last evaluated samples of each model.
+        """
+        for i, (model, samples) in enumerate(zip(self.models, model_samples)):
+            if supports_concurrent_evaluation(model) and len(samples) > 0:
+                run_times = get_job_run_times(model.scheduler.experiment_dir, model.job_ids)
+                self.model_run_times[i].extend(run_times[~np.isnan(run_times)])
+
+    def _measured_cost_models(self):
+        """Cost of one evaluation of each model.
+
+        The cost is the mean run time of the jobs of a model. If no run times are available, the
+        user-provided costs are used.
+
+        Returns:
+            list(float): Cost of each model.
+
+        Raises:
+            ValueError: If neither run times nor user-provided costs are available.
+        """
+        if all(self.model_run_times):
+            return [np.mean(run_times) for run_times in self.model_run_times]
+        if self.cost_models is None:
+            raise ValueError(
+                "No run times of the models available in the job metadata. Provide cost_models."
+            )
+        _logger.info("No run times of the models available. Using the provided cost_models.")
+        return self.cost_models
+
+    def _add_samples(self, results_estimators, num_samples_additional):
+        """Draw and evaluate additional samples on each estimator.
+
+        Args:
+            results_estimators (list(np.array)): Results of each estimator.
+            num_samples_additional (np.array): Number of additional samples on each estimator.
+
+        Returns:
+            list(np.array): Updated results of each estimator.
+        """
+        if self.qmc_sequence is not None:
+            # split the samples evenly among the randomizations
+            num_samples_additional = (
+                np.ceil(num_samples_additional / self.num_randomizations).astype(int)
+                * self.num_randomizations
+            )
+        additional_samples, additional_ids = self._draw_samples(num_samples_additional)
+        additional_results = self._evaluate_estimators(additional_samples)
+        for i, result in enumerate(additional_results):
+            if result is not None:
+                results_estimators[i] = np.concatenate((results_estimators[i], result))
+                if additional_ids[i] is not None:
+                    self.randomization_ids[i] = np.concatenate(
+                        (self.randomization_ids[i], additional_ids[i])
+                    )
+
+        self.num_samples = self.num_samples + num_samples_additional
+        return results_estimators
+
+    def _run_continuation(self, results_estimators):
+        r"""Refine the number of samples until the target RMSE is reached.
+
+        In each iteration, the number of samples of estimator l is updated to
+        :math:`N_l = \lceil \epsilon^{-2} \sqrt{V_l / C_l} \sum_k \sqrt{V_k C_k} \rceil`, where
+        :math:`\epsilon` is the target RMSE, :math:`V_l` the variance and :math:`C_l` the measured
+        cost of estimator l.
+
+        Args:
+            results_estimators (list(np.array)): Results of each estimator.
+
+        Returns:
+            list(np.array): Results of each estimator.
+        """
+        for iteration in range(self.max_continuation_iterations):
+            _, var_estimators, _, std = self._compute_estimator_statistics(results_estimators)
+            if std <= self.target_rmse:
+                break
+
+            cost_estimators = np.array(self._cost_estimators(self._measured_cost_models()))
+            ideal_num_samples = np.ceil(
+                np.sqrt(var_estimators / cost_estimators)
+                * np.sum(np.sqrt(var_estimators * cost_estimators))
+                / self.target_rmse**2
+            )
+            num_samples_additional = np.maximum(
+                ideal_num_samples - np.array(self.num_samples), 0
+            ).astype(int)
+            if not num_samples_additional.any():
+                break
+
+            _logger.info(
+                "Continuation iteration %d: std %.3e, adding samples %s",
+                iteration,
+                std,
+                num_samples_additional,
+            )
+            results_estimators = self._add_samples(results_estimators, num_samples_additional)
+        else:
+            _logger.warning(
+                "Target RMSE not reached after %d continuation iterations.",
+                self.max_continuation_iterations,
+            )
+
+        self.cost_estimators = self._cost_estimators(self._measured_cost_models())
+        return results_estimators
+
     def pre_run(self):
         """Generate samples for subsequent MLMC analysis."""
         np.random.seed(self.seed)
 
-        self.samples = self._draw_samples(self.num_samples)
+        self.samples, self.randomization_ids = self._draw_samples(self.num_samples)
 
     def core_run(self):
         """Perform multilevel Monte Carlo analysis."""
         # List of all estimator results.
-        results_estimators = []
-
-        # Estimator 0
-        results_estimators.append(self.models[0].evaluate(self.samples[0])["result"])
+        results_estimators = self._evaluate_estimators(self.samples)
 
-        # Estimator 1,2,3 ... n
-        for i, samples in enumerate(self.samples[1:], 1):
-            results_estimators.append(
-                self.models[i].evaluate(samples)["result"]
-                - self.models[i - 1].evaluate(samples)["result"]
-            )
+        if self.target_rmse is not None:
+            results_estimators = self._run_continuation(results_estimators)
 
         mean_estimators, var_estimators, mean, std = self._compute_estimator_statistics(
             results_estimators
@@ -265,26 +499,8 @@ class MLMC(Iterator):
                 np.array(ideal_num_samples - self.num_samples), np.zeros(len(self.num_samples))
             ).astype(int)
 
-            additional_samples = self._draw_samples(num_samples_additional)
-
-            # Iteration on estimator 0
-            results_estimators[0] = np.concatenate(
-                (results_estimators[0], self.models[0].evaluate(additional_samples[0])["result"])
-            )
-
-            # Iteration on estimators 1,2,3 ... n
-            for i, samples in enumerate(additional_samples[1:], 1):
-                if num_samples_additional[i] > 0:
-                    results_estimators[i] = np.concatenate(
-                        (
-                            results_estimators[i],
-                            self.models[i].evaluate(samples)["result"]
-                            - self.models[i - 1].evaluate(samples)["result"],
-                        )
-                    )
-
             # Update num_samples with additional samples and update estimator statistics.
-            self.num_samples = self.num_samples + num_samples_additional
+            results_estimators = self._add_samples(results_estimators, num_samples_additional)
             mean_estimators, var_estimators, mean, std = self._compute_estimator_statistics(
                 results_estimators
             )
@@ -302,12 +518,30 @@ class MLMC(Iterator):
         if self.num_bootstrap_samples > 0:
             self.output["std_bootstrap"] = self._bootstrap(results_estimators)
 
+        if self.qmc_sequence is not None and self.num_randomizations > 1:
+            self.output["std_rqmc"] = self._rqmc_std(results_estimators)
+
     def post_run(self):
         """Write results to result file."""
         write_results(
             processed_results=self.output, file_path=self.global_settings.result_file(".pickle")
         )
 
+    def _rqmc_std(self, results_estimators):
+        """Standard deviation of the MLMC estimator from the randomizations.
+
+        Args:
+            results_estimators (list(np.array)): Results of each estimator.
+
+        Returns:
+            float: Standard deviation of the MLMC estimator.
+        """
+        var = 0
+        for result, randomization_ids in zip(results_estimators, self.randomization_ids):
+            _, standard_error = rqmc_mean_and_standard_error(result.reshape(-1), randomization_ids)
+            var += standard_error**2
+        return var**0.5
+
     def _bootstrap(self, results_estimators):
         """Bootstrapping standard deviation estimate.
 
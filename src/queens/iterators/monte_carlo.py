@@ -21,7 +21,9 @@ import numpy as np
 
 from queens.iterators._iterator import Iterator
 from queens.utils.logger_settings import log_init_args
+from queens.utils.online_statistics import OnlineMoments, QuantileSketch
 from queens.utils.process_outputs import process_outputs, write_results
+from queens.utils.quasi_monte_carlo import draw_rqmc_samples, rqmc_mean_and_standard_error
 
 _logger = logging.getLogger(__name__)
 
@@ -29,12 +31,37 @@ _logger = logging.getLogger(__name__)
 class MonteCarlo(Iterator):
     """Basic Monte Carlo Iterator to enable MC sampling.
 
+    With a chunk size, the samples are evaluated chunk by chunk (streaming mode). After each chunk,
+    the mean, variance and quantiles of the model output are updated online. The samples and
+    outputs of the chunk are written to disk together with the statistics so far, one file per
+    chunk. The evaluation stops early once the standard error or the relative
+    half-width of the confidence interval of the mean reaches its target for all output components.
+
+    With a quasi-Monte Carlo sequence, the samples are drawn from scrambled low-discrepancy
+    sequences (randomized quasi-Monte Carlo). The samples are split into independent
+    randomizations, whose spread provides the standard error of the mean. The streaming mode is
+    not available in this case, as the samples are ordered by randomization and an early stop
+    would only cover some of the randomizations.
+
     Attributes:
         seed  (int): Seed for random number generation.
         num_samples (int): Number of samples to compute.
         result_description (dict):  Description of desired results.
+        num_streams (int): Number of independent random streams to draw the samples from.
         samples (np.array):         Array with all samples.
         output (np.array):          Array with all model outputs.
+        chunk_size (int, None): Number of samples evaluated at once in streaming mode.
+        target_standard_error (float, None): Target standard error of the mean.
+        target_relative_half_width (float, None): Target half-width of the confidence interval of
+                                                  the mean relative to the mean.
+        confidence_level (float): Confidence level of the confidence interval.
+        quantiles (list, None): Probabilities of the quantiles estimated in streaming mode.
+        moments (OnlineMoments, None): Online moments of the model output.
+        quantile_sketch (QuantileSketch, None): Streaming quantile estimates of the model output.
+        qmc_sequence (str, None): Low-discrepancy sequence ('sobol' or 'halton') of randomized
+                                  quasi-Monte Carlo sampling. None for pseudo-random sampling.
+        num_randomizations (int): Number of independent randomizations of the sequence.
+        randomization_ids (np.array, None): Randomization of each sample.
     """
 
     @log_init_args
@@ -46,6 +73,14 @@ class MonteCarlo(Iterator):
         seed,
         num_samples,
         result_description=None,
+        num_streams=None,
+        chunk_size=None,
+        target_standard_error=None,
+        target_relative_half_width=None,
+        confidence_level=0.95,
+        quantiles=None,
+        qmc_sequence=None,
+        num_randomizations=1,
     ):
         """Initialise Monte Carlo iterator.
 
@@ -57,27 +92,168 @@ class MonteCarlo(Iterator):
             seed  (int):                Seed for random number generation
             num_samples (int):          Number of samples to compute
             result_description (dict, opt):  Description of desired results
+            num_streams (int, opt): Number of independent random streams spawned from the seed to
+                                    draw the samples chunk-wise. If not provided, the samples are
+                                    drawn from the globally seeded random state.
+            chunk_size (int, opt): Number of samples evaluated at once. If provided, the samples are
+                                   evaluated in streaming mode with num_samples as maximum number
+                                   of samples.
+            target_standard_error (float, opt): Stop once the standard error of the mean of all
+                                                output components is below this target.
+            target_relative_half_width (float, opt): Stop once the half-width of the confidence
+                                                     interval of the mean relative to the mean is
+                                                     below this target for all output components.
+            confidence_level (float, opt): Confidence level of the confidence interval.
+            quantiles (list, opt): Probabilities of the quantiles to estimate in streaming mode.
+            qmc_sequence (str, opt): Low-discrepancy sequence ('sobol' or 'halton') to draw the
+                                     samples from. By default, pseudo-random samples are drawn.
+            num_randomizations (int, opt): Number of independent randomizations of the sequence.
+                                           The samples are split evenly among them.
+
+        Raises:
+            ValueError: If a chunk size is combined with a quasi-Monte Carlo sequence.
         """
         super().__init__(model, parameters, global_settings)
+        if chunk_size is not None and qmc_sequence is not None:
+            raise ValueError(
+                "The streaming mode (chunk_size) is not supported for randomized quasi-Monte Carlo "
+                "sampling (qmc_sequence)."
+            )
         self.seed = seed
         self.num_samples = num_samples
         self.result_description = result_description
+        self.num_streams = num_streams
         self.samples = None
         self.output = None
+        self.chunk_size = chunk_size
+        self.target_standard_error = target_standard_error
+        self.target_relative_half_width = target_relative_half_width
+        self.confidence_level = confidence_level
+        self.quantiles = quantiles
+        self.moments = None
+        self.quantile_sketch = None
+        self.qmc_sequence = qmc_sequence
+        self.num_randomizations = num_randomizations
+        self.randomization_ids = None
 
     def pre_run(self):
         """Generate samples for subsequent MC analysis and update model."""
-        np.random.seed(self.seed)
-        self.samples = self.parameters.draw_samples(self.num_samples)
+        if self.qmc_sequence is not None:
+            self.samples, self.randomization_ids = draw_rqmc_samples(
+                self.parameters,
+                self.num_samples,
+                self.num_randomizations,
+                self.qmc_sequence,
+                self.seed,
+            )
+        elif self.num_streams is None:
+            np.random.seed(self.seed)
+            self.samples = self.parameters.draw_samples(self.num_samples)
+        else:
+            self.samples = self.parameters.draw_samples_from_streams(
+                self.num_samples, self.seed, self.num_streams
+            )
 
     def core_run(self):
         """Run Monte Carlo Analysis on model."""
-        self.output = self.model.evaluate(self.samples)
+        if self.chunk_size is None:
+            self.output = self.model.evaluate(self.samples)
+        else:
+            self._run_streaming()
+
+    def _run_streaming(self):
+        """Evaluate the samples chunk by chunk until the target precision is reached."""
+        self.moments = OnlineMoments()
+        self.quantile_sketch = QuantileSketch() if self.quantiles is not None else None
+        chunk_outputs = []
+        num_evaluated = 0
+        for chunk_id, chunk_start in enumerate(range(0, self.num_samples, self.chunk_size)):
+            chunk_samples = self.samples[chunk_start : chunk_start + self.chunk_size]
+            chunk_output = self.model.evaluate(chunk_samples)
+            chunk_outputs.append(chunk_output)
+            num_evaluated += len(chunk_samples)
+
+            self.moments.update(chunk_output["result"])
+            if self.quantile_sketch is not None:
+                self.quantile_sketch.update(chunk_output["result"])
+
+            # only the new chunk is written, such that the cost per chunk does not grow
+            write_results(
+                {
+                    "input_data": chunk_samples,
+                    "raw_output_data": chunk_output,
+                    "streaming_statistics": self.streaming_statistics(),
+                },
+                self.global_settings.result_file(".pickle", suffix=f"_partial_chunk_{chunk_id}"),
+            )
+
+            if self._precision_reached():
+                _logger.info("Target precision reached after %d samples.", num_evaluated)
+                break
+
+        self.samples = self.samples[:num_evaluated]
+        self.output = {
+            key: np.concatenate([chunk_output[key] for chunk_output in chunk_outputs])
+            for key in chunk_outputs[-1]
+            if chunk_outputs[-1][key] is not None
+        }
+
+    def _precision_reached(self):
+        """Check if the target precision of the mean is reached.
+
+        Returns:
+            bool: True if any target is reached for all output components
+        """
+        if self.moments.num_samples < 2:
+            return False
+        if self.target_standard_error is not None and np.all(
+            self.moments.standard_error <= self.target_standard_error
+        ):
+            return True
+        return self.target_relative_half_width is not None and bool(
+            np.all(
+                self.moments.relative_half_width(self.confidence_level)
+                <= self.target_relative_half_width
+            )
+        )
+
+    def rqmc_statistics(self):
+        """Mean and standard error estimated from the randomizations of the sequence.
+
+        Returns:
+            dict: Mean and standard error of the model output
+        """
+        mean, standard_error = rqmc_mean_and_standard_error(
+            self.output["result"], self.randomization_ids[: len(self.output["result"])]
+        )
+        return {"mean": mean, "standard_error": standard_error}
+
+    def streaming_statistics(self):
+        """Statistics of the model output computed online in streaming mode.
+
+        Returns:
+            dict: Number of samples, mean, variance, standard error, relative half-width of the
+                  confidence interval and quantiles of the model output
+        """
+        statistics = {
+            "num_samples": self.moments.num_samples,
+            "mean": self.moments.mean,
+            "var": self.moments.variance,
+            "standard_error": self.moments.standard_error,
+            "relative_half_width": self.moments.relative_half_width(self.confidence_level),
+        }
+        if self.quantile_sketch is not None:
+            statistics["quantiles"] = self.quantile_sketch.quantiles(self.quantiles)
+        return statistics
 
     def post_run(self):
         """Analyze the results."""
         if self.result_description is not None:
             results = process_outputs(self.output, self.result_description, self.samples)
+            if self.moments is not None:
+                results["streaming_statistics"] = self.streaming_statistics()
+            if self.qmc_sequence is not None:
+                results["rqmc_statistics"] = self.rqmc_statistics()
             if self.result_description["write_results"]:
                 write_results(results, self.global_settings.result_file(".pickle"))
 
@@ -15,10 +15,12 @@
 """Deterministic optimization toolbox."""
 
 import logging
+import threading
 import time
+from collections import OrderedDict
 
 import numpy as np
-from scipy.optimize import Bounds, minimize
+from scipy.optimize import Bounds, OptimizeResult, minimize
 from scipy.optimize._numdiff import _prepare_bounds
 
 from queens.iterators._iterator import Iterator
@@ -34,6 +36,10 @@ class Optimization(Iterator):
 
     Based on the *scipy.optimize.minimize* optimization toolbox [1].
 
+    If several initial guesses are provided, the optimizations from all starting points run in
+    lockstep: the positions requested by all of them in one step are evaluated in a single model
+    evaluation. The best solution and all local optima are returned.
+
     References:
         [1]: https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
 
@@ -72,7 +78,8 @@ class Optimization(Iterator):
                          Only for COBYLA, SLSQP and trust-constr
                          (see SciPy documentation for details)
         initial_guess (np.array): Initial guess, i.e. start point of
-                                  optimization.
+                                  optimization. For multi-start optimizations, one row per
+                                  starting point.
         jac_method (str): Method to calculate a finite difference based approximation of the
                           Jacobian matrix:
 
@@ -85,9 +92,15 @@ class Optimization(Iterator):
         result_description (dict): Description of desired post-processing.
         verbose_output (int): Integer encoding which kind of verbose information should be
                               printed by the optimizers.
-        precalculated_positions (dict): Dictionary containing precalculated positions and
-                                        corresponding model responses.
-        solution (np.array): Solution obtained from the optimization process.
+        precalculated_positions (OrderedDict): Model responses at precalculated positions, indexed
+                                               by the bytes of the positions and ordered from
+                                               least to most recently used.
+        max_precalculated_positions (int, None): Maximum number of stored precalculated positions.
+                                                 If exceeded, the least recently used position is
+                                                 discarded. None means no limit.
+        solution (np.array): Solution obtained from the optimization process. For multi-start
+                             optimizations, the best solution.
+        local_optima (list): Solutions of all starting points of a multi-start optimization.
         objective_and_jacobian (bool): If true, every time the objective is evaluated also the
                                        jacobian is evaluated. This leads to improved batching, but
                                        can lead to unnecessary evaluations of the jacobian during
@@ -111,6 +124,7 @@ class Optimization(Iterator):
         jac_method="2-point",
         jac_rel_step=None,
         objective_and_jacobian=False,
+        max_precalculated_positions=None,
     ):
         """Initialize an Optimization.
 
@@ -119,7 +133,9 @@ class Optimization(Iterator):
             parameters (Parameters): Parameters object
             global_settings (GlobalSettings): settings of the QUEENS experiment including its name
                                               and the output directory
-            initial_guess (array like): initial position at which the optimization starts
+            initial_guess (array like): initial position at which the optimization starts. A
+                                        two-dimensional array with one starting point per row
+                                        starts a multi-start optimization.
             result_description (dict): Description of desired post-processing.
             verbose_output (int): Integer encoding which kind of verbose information should be
                                   printed by the optimizers.
@@ -172,10 +188,14 @@ class Optimization(Iterator):
                                                 the jacobian during line-search.
                                                 This option is only available for gradient methods.
                                                 Default is false.
+            max_precalculated_positions (int, opt): Maximum number of stored precalculated
+                                                    positions. By default, all positions are
+                                                    stored.
         """
         super().__init__(model, parameters, global_settings)
 
         initial_guess = np.atleast_1d(np.array(initial_guess))
+        first_guess = initial_guess[0] if initial_guess.ndim == 2 else initial_guess
 
         # check sanity of bounds and extract array of lower and upper bounds to unify the bounds
         if not isinstance(bounds, Bounds):
@@ -184,7 +204,7 @@ class Optimization(Iterator):
                 # lb or ub can be scalars which don't have a len attribute
                 if hasattr(lb, "__len__") and hasattr(ub, "__len__"):
                     # warn if definition of bounds is not unique
-                    if len(lb) == 2 and len(ub) == 2 and len(initial_guess) == 2:
+                    if len(lb) == 2 and len(ub) == 2 and len(first_guess) == 2:
                         _logger.warning(
                             "Definition of 'bounds' is not unique. "
                             "Make sure to use the 'new' definition of bounds: "
@@ -205,7 +225,7 @@ class Optimization(Iterator):
         # unify the bounds:
         # make sure that each array contains number of variable entries
         # i.e. we need one lower bound and one upper bound per variable
-        lb, ub = _prepare_bounds((lb, ub), initial_guess)
+        lb, ub = _prepare_bounds((lb, ub), first_guess)
 
         # convert to Bounds object to ensure correct handling by scipy.optimize
         bounds = Bounds(lb=lb, ub=ub)
@@ -228,8 +248,11 @@ class Optimization(Iterator):
         self.max_feval = max_feval
         self.result_description = result_description
         self.verbose_output = verbose_output
-        self.precalculated_positions = {"position": [], "output": []}
+        self.precalculated_positions = OrderedDict()
+        self.max_precalculated_positions = max_precalculated_positions
         self.solution = None
+        self.local_optima = None
+        self._lockstep_evaluator = None
         self.objective_and_jacobian = objective_and_jacobian
         if self.algorithm in ["COBYLA", "NELDER-MEAD", "POWELL"]:
             self.objective_and_jacobian = False
@@ -314,12 +337,29 @@ class Optimization(Iterator):
         """Core run of Optimization iterator."""
         _logger.info("Welcome to Optimization core run.")
         start = time.time()
+        if self.initial_guess.ndim == 2:
+            self.local_optima = self._run_multi_start(self.initial_guess)
+            self.solution = min(self.local_optima, key=self._solution_objective)
+        else:
+            self.solution = self._minimize(self.initial_guess)
+        end = time.time()
+        _logger.info("Optimization took %E seconds.", end - start)
 
+    def _minimize(self, initial_guess):
+        """Run the optimization algorithm from an initial guess.
+
+        Args:
+            initial_guess (np.array): Start point of the optimization
+
+        Returns:
+            solution (OptimizeResult): Solution of the optimization
+        """
+        solution = None
         # minimization with bounds using Jacobian
         if self.algorithm in {"L-BFGS-B", "TNC"}:
-            self.solution = minimize(
+            solution = minimize(
                 self.objective,
-                self.initial_guess,
+                initial_guess,
                 method=self.algorithm,
                 jac=self.jacobian,
                 bounds=self.bounds,
@@ -328,9 +368,9 @@ class Optimization(Iterator):
         # Constrained Optimization BY Linear Approximation:
         # minimization with constraints without Jacobian
         elif self.algorithm in {"COBYLA"}:
-            self.solution = minimize(
+            solution = minimize(
                 self.objective,
-                self.initial_guess,
+                initial_guess,
                 method=self.algorithm,
                 constraints=self.cons,
                 options={"disp": self.verbose_output},
@@ -338,9 +378,9 @@ class Optimization(Iterator):
         # Sequential Least SQuares Programming:
         # minimization with bounds and constraints using Jacobian
         elif self.algorithm in {"SLSQP"}:
-            self.solution = minimize(
+            solution = minimize(
                 self.objective,
-                self.initial_guess,
+                initial_guess,
                 method=self.algorithm,
                 jac=self.jacobian,
                 bounds=self.bounds,
@@ -349,23 +389,77 @@ class Optimization(Iterator):
             )
         # minimization (unconstrained, unbounded) without Jacobian
         elif self.algorithm in {"NELDER-MEAD", "POWELL"}:
-            self.solution = minimize(
+            solution = minimize(
                 self.objective,
-                self.initial_guess,
+                initial_guess,
                 method=self.algorithm,
                 options={"disp": self.verbose_output},
             )
         # minimization (unconstrained, unbounded) using Jacobian
         elif self.algorithm in {"CG", "BFGS"}:
-            self.solution = minimize(
+            solution = minimize(
                 self.objective,
-                self.initial_guess,
+                initial_guess,
                 method=self.algorithm,
                 jac=self.jacobian,
                 options={"disp": self.verbose_output},
             )
-        end = time.time()
-        _logger.info("Optimization took %E seconds.", end - start)
+        return solution
+
+    @staticmethod
+    def _solution_objective(solution):
+        """Objective function value of a solution.
+
+        Args:
+            solution (OptimizeResult): Solution of the optimization
+
+        Returns:
+            float: Objective function value of the solution
+        """
+        return solution.fun
+
+    def _run_multi_start(self, initial_guesses):
+        """Run the optimizations from several starting points in lockstep.
+
+        Each optimization runs in its own thread. The model is only evaluated by the calling
+        thread, which merges the positions requested by all optimizations into one batch.
+
+        Args:
+            initial_guesses (np.array): Starting points, one per row
+
+        Returns:
+            solutions (list): Solution of each starting point
+        """
+        self._lockstep_evaluator = _LockstepEvaluator(
+            self._evaluate_positions, self.parameters.num_parameters, len(initial_guesses)
+        )
+        solutions = [None] * len(initial_guesses)
+        errors = []
+
+        def run_optimization(i, initial_guess):
+            try:
+                solutions[i] = self._minimize(initial_guess)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                errors.append(exception)
+            finally:
+                self._lockstep_evaluator.finish()
+
+        threads = [
+            threading.Thread(target=run_optimization, args=(i, initial_guess), daemon=True)
+            for i, initial_guess in enumerate(initial_guesses)
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            self._lockstep_evaluator.run()
+            for thread in threads:
+                thread.join()
+        finally:
+            self._lockstep_evaluator = None
+
+        if errors:
+            raise errors[0]
+        return solutions
 
     def post_run(self):
         """Analyze the resulting optimum."""
@@ -373,8 +467,11 @@ class Optimization(Iterator):
 
         if self.result_description:
             if self.result_description["write_results"]:
+                solution = self.solution
+                if self.local_optima is not None:
+                    solution = OptimizeResult(solution, local_optima=self.local_optima)
                 write_results(
-                    self.solution,
+                    solution,
                     self.global_settings.result_file(".pickle"),
                 )
 
@@ -387,26 +484,57 @@ class Optimization(Iterator):
         Returns:
             f_batch (np.ndarray): Model response
         """
+        if self._lockstep_evaluator is not None and self._lockstep_evaluator.is_worker():
+            return self._lockstep_evaluator.evaluate(positions)
+        return self._evaluate_positions(positions).squeeze()
+
+    def _evaluate_positions(self, positions):
+        """Evaluate the model at positions that were not evaluated before.
+
+        Args:
+            positions (np.ndarray): Positions at which the model is evaluated
+
+        Returns:
+            np.ndarray: Model response, one entry per position
+        """
         positions = positions.reshape(-1, self.parameters.num_parameters)
         f_batch = [None] * len(positions)
-        new_positions_to_evaluate = []
-        new_positions_batch_id = []
+        new_positions_to_evaluate = {}
+        new_positions_batch_ids = {}
         for i, position in enumerate(positions):
             precalculated_output = self.check_precalculated(position)
             if precalculated_output is None:
-                new_positions_to_evaluate.append(position)
-                new_positions_batch_id.append(i)
+                # positions occurring several times in the batch are only evaluated once
+                key = self._position_key(position)
+                new_positions_to_evaluate.setdefault(key, position)
+                new_positions_batch_ids.setdefault(key, []).append(i)
             else:
                 f_batch[i] = precalculated_output
         if new_positions_to_evaluate:
-            new_positions_to_evaluate = np.array(new_positions_to_evaluate)
-            f_new = self.model.evaluate(new_positions_to_evaluate)["result"]
-            for position_id, output in zip(new_positions_batch_id, f_new):
-                f_batch[position_id] = output
-            self.precalculated_positions["position"].extend(new_positions_to_evaluate)
-            self.precalculated_positions["output"].extend(f_new)
-        f_batch = np.array(f_batch).squeeze()
-        return f_batch
+            new_positions = np.array(list(new_positions_to_evaluate.values()))
+            f_new = self.model.evaluate(new_positions)["result"]
+            for batch_ids, position, output in zip(
+                new_positions_batch_ids.values(), new_positions, f_new
+            ):
+                for position_id in batch_ids:
+                    f_batch[position_id] = output
+                self.store_precalculated(position, output)
+        return np.array(f_batch)
+
+    @staticmethod
+    def _position_key(position):
+        """Hashable key of a position.
+
+        Positive and negative zeros are mapped to the same key, such that positions match exactly
+        if they are numerically equal.
+
+        Args:
+            position (np.ndarray): Position
+
+        Returns:
+            bytes: Key of the position
+        """
+        return (np.asarray(position, dtype=float).reshape(-1) + 0.0).tobytes()
 
     def check_precalculated(self, position):
         """Check if the model was already evaluated at defined position.
@@ -417,7 +545,122 @@ class Optimization(Iterator):
         Returns:
             np.ndarray: Precalculated model response or *None*
         """
-        for i, precalculated_position in enumerate(self.precalculated_positions["position"]):
-            if np.equal(position, precalculated_position).all():
-                return self.precalculated_positions["output"][i]
-        return None
+        key = self._position_key(position)
+        if key not in self.precalculated_positions:
+            return None
+        self.precalculated_positions.move_to_end(key)
+        return self.precalculated_positions[key]
+
+    def store_precalculated(self, position, output):
+        """Store the model response at a position.
+
+        Args:
+            position (np.ndarray): Position at which the model was evaluated
+            output (np.ndarray): Model response at the position
+        """
+        key = self._position_key(position)
+        self.precalculated_positions[key] = output
+        self.precalculated_positions.move_to_end(key)
+        if (
+            self.max_precalculated_positions is not None
+            and len(self.precalculated_positions) > self.max_precalculated_positions
+        ):
+            self.precalculated_positions.popitem(last=False)
+
+
+class _LockstepEvaluator:
+    """Merge the model evaluations of several optimization threads into batches.
+
+    The worker threads request positions and block until all running workers have either
+    requested positions or finished. The coordinating thread then evaluates all requested
+    positions at once and hands the results back to the workers.
+
+    Attributes:
+        evaluate_positions (callable): Function evaluating the model at positions, returning one
+                                       response per position
+        num_parameters (int): Number of parameters of a position
+        num_running (int): Number of running worker threads
+        requests (dict): Requested positions by worker thread
+        results (dict): Results by worker thread
+        error (Exception, None): Error raised during the evaluation
+        coordinator (int): Identifier of the coordinating thread
+        condition (threading.Condition): Condition synchronizing the threads
+    """
+
+    def __init__(self, evaluate_positions, num_parameters, num_workers):
+        """Initialize the lockstep evaluator.
+
+        Args:
+            evaluate_positions (callable): Function evaluating the model at positions, returning
+                                           one response per position
+            num_parameters (int): Number of parameters of a position
+            num_workers (int): Number of worker threads
+        """
+        self.evaluate_positions = evaluate_positions
+        self.num_parameters = num_parameters
+        self.num_running = num_workers
+        self.requests = {}
+        self.results = {}
+        self.error = None
+        self.coordinator = threading.get_ident()
+        self.condition = threading.Condition()
+
+    def is_worker(self):
+        """Check if the current thread is a worker thread.
+
+        Returns:
+            bool: True if the current thread is not the coordinating thread
+        """
+        return threading.get_ident() != self.coordinator
+
+    def evaluate(self, positions):
+        """Request the evaluation of positions and wait for the result.
+
+        Args:
+            positions (np.ndarray): Positions at which the model is evaluated
+
+        Returns:
+            np.ndarray: Model response
+        """
+        worker = threading.get_ident()
+        with self.condition:
+            self.requests[worker] = positions
+            self.condition.notify_all()
+            self.condition.wait_for(lambda: worker in self.results or self.error is not None)
+            if self.error is not None:
+                raise self.error
+            return self.results.pop(worker)
+
+    def finish(self):
+        """Deregister the current worker thread."""
+        with self.condition:
+            self.num_running -= 1
+            self.condition.notify_all()
+
+    def run(self):
+        """Evaluate the requests of the workers until all workers have finished."""
+        while True:
+            with self.condition:
+                self.condition.wait_for(lambda: len(self.requests) == self.num_running)
+                if self.num_running == 0:
+                    return
+                requests, self.requests = self.requests, {}
+
+            try:
+                # Evaluate all positions at once and split the responses among the requests
+                positions = [np.reshape(x, (-1, self.num_parameters)) for x in requests.values()]
+                responses = self.evaluate_positions(np.concatenate(positions))
+                split_ids = np.cumsum([len(x) for x in positions])[:-1]
+                results = {
+                    worker: response.squeeze()
+                    for worker, response in zip(requests, np.split(responses, split_ids))
+                }
+            except Exception as exception:
+                with self.condition:
+                    self.error = exception
+                    self.condition.notify_all()
+                raise
+
+            with self.condition:
+                self.results.update(results)
+                self.condition.notify_all()
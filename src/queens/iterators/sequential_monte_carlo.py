@@ -49,6 +49,7 @@ from queens.iterators.metropolis_hastings import MetropolisHastings
 from queens.utils import sequential_monte_carlo as smc_utils
 from queens.utils.logger_settings import log_init_args
 from queens.utils.process_outputs import process_outputs, write_results
+from queens.utils.random_generator import spawn_random_generators
 
 _logger = logging.getLogger(__name__)
 
@@ -84,6 +85,14 @@ class SequentialMonteCarlo(Iterator):
                    of the MCMC kernel.
         b (float): Parameter for the scaling of the covariance matrix of the proposal distribution
                    of the MCMC kernel.
+        resampling (function): Resampling scheme returning the resampled particle indices.
+        max_rejuvenation_steps (int): Maximum number of MH steps per tempering stage. If None, a
+                                      fixed number of *num_rejuvenation_steps* is performed.
+        min_move_probability (float): Targeted probability of each particle to move at least once
+                                      during the rejuvenation.
+        rng (np.random.Generator, None): Random number generator of the initial particles and the
+                                         resampling. None if the globally seeded random state is
+                                         used.
     """
 
     @log_init_args
@@ -99,6 +108,10 @@ class SequentialMonteCarlo(Iterator):
         mcmc_proposal_distribution,
         num_rejuvenation_steps,
         plot_trace_every=0,
+        resampling_type="multinomial",
+        max_rejuvenation_steps=None,
+        min_move_probability=0.99,
+        independent_streams=False,
     ):
         """Initialize the SequentialMonteCarlo class.
 
@@ -112,9 +125,25 @@ class SequentialMonteCarlo(Iterator):
             seed (int): Seed for random number generator.
             temper_type (str): Temper type ('bayes' or 'generic')
             mcmc_proposal_distribution (obj): Proposal distribution for the mcmc kernel
-            num_rejuvenation_steps (int): number of samples per rejuvenation
+            num_rejuvenation_steps (int): Number of MH steps per rejuvenation. If
+                                          *max_rejuvenation_steps* is provided, rounds of this
+                                          number of steps are performed until the stopping rule
+                                          is fulfilled.
             plot_trace_every (int): Print the current trace every *plot_trace_every*-th iteration.
                                     Default: 0 (do not print the trace).
+            resampling_type (str): Resampling scheme ('multinomial', 'systematic', 'stratified'
+                                   or 'residual')
+            max_rejuvenation_steps (int, opt): Maximum number of MH steps per tempering stage.
+                                               If provided, the number of steps is adapted to the
+                                               acceptance rate.
+            min_move_probability (float, opt): Targeted probability of each particle to move at
+                                               least once during the rejuvenation. Only used if
+                                               *max_rejuvenation_steps* is provided.
+            independent_streams (bool, opt): If True, the initial particles and the resampling on
+                                             the one hand and the MCMC kernel on the other hand
+                                             draw from two independent random streams spawned
+                                             from the seed. Otherwise, they draw from the globally
+                                             seeded random state.
         """
         super().__init__(model, parameters, global_settings)
 
@@ -138,6 +167,9 @@ class SequentialMonteCarlo(Iterator):
         self.plot_trace_every = plot_trace_every
         self.result_description = result_description
         self.seed = seed
+        self.rng = None
+        if independent_streams:
+            self.rng, self.mcmc_kernel.rng = spawn_random_generators(seed, 2)
 
         self.num_particles = num_particles
 
@@ -165,6 +197,9 @@ class SequentialMonteCarlo(Iterator):
         self.ess_cur = 0.0
 
         self.temper = smc_utils.temper_factory(temper_type)
+        self.resampling = smc_utils.resampling_factory(resampling_type)
+        self.max_rejuvenation_steps = max_rejuvenation_steps
+        self.min_move_probability = min_move_probability
 
         # tempering parameter (linked to counter/ time index)
         self.gamma_cur = 0.0
@@ -204,7 +239,7 @@ class SequentialMonteCarlo(Iterator):
         np.random.seed(self.seed)
 
         # draw initial particles from prior distribution
-        self.particles = self.parameters.draw_samples(self.num_particles)
+        self.particles = self.parameters.draw_samples(self.num_particles, rng=self.rng)
         self.log_likelihood = self.eval_log_likelihood(self.particles)
         self.log_prior = self.eval_log_prior(self.particles)
         self.log_posterior = self.log_likelihood + self.log_prior
@@ -336,18 +371,13 @@ class SequentialMonteCarlo(Iterator):
 
         Resampling reduces the variance of the particle approximation by
         eliminating particles with small weights and duplicating
-        particles with large weights (see 2.2.1 in [2]).
+        particles with large weights (see 2.2.1 in [2]). The resampling
+        scheme is selected via *resampling_type*.
 
         Returns:
             Tuple of updated particles, resampled weights, log-likelihood, and log-prior.
         """
-        # draw from multinomial distribution to decide
-        # the frequency of individual particles
-        particle_freq = np.random.multinomial(self.num_particles, self.weights)
-
-        idx_list = []
-        for idx, freq in enumerate(particle_freq):
-            idx_list += [idx] * freq
+        idx_list = self.resampling(self.weights, self.num_particles, rng=self.rng)
 
         resampled_weights = np.ones(self.num_particles)
 
@@ -358,6 +388,72 @@ class SequentialMonteCarlo(Iterator):
             self.log_prior[idx_list],
         )
 
+    def num_required_rejuvenation_steps(self, accept_rate):
+        """Number of MH steps after which a particle has moved with the targeted probability.
+
+        A particle does not move during *n* steps with probability (1 - *accept_rate*)^n, which is
+        estimated by the average acceptance rate of the rejuvenation (see, e.g., Drovandi, C. C.
+        and Pettitt, A. N. (2011). Estimation of parameters for macroparasite population evolution
+        using approximate Bayesian computation. Biometrics, 67(1), 225-233).
+
+        Args:
+            accept_rate (float): Average acceptance rate of the MH steps
+
+        Returns:
+            float: Required number of MH steps
+        """
+        if accept_rate <= 0:
+            return np.inf
+        if accept_rate >= 1:
+            return 1
+        return np.ceil(np.log(1 - self.min_move_probability) / np.log(1 - accept_rate))
+
+    def rejuvenate(self, cov_mat):
+        """Rejuvenate the particles with MH steps.
+
+        Each MH step evaluates all particles in a single batch. Without *max_rejuvenation_steps*,
+        *num_rejuvenation_steps* MH steps are performed. Otherwise, rounds of
+        *num_rejuvenation_steps* steps are repeated until each particle has moved at least once
+        with probability *min_move_probability* (estimated from the average acceptance rate) or
+        *max_rejuvenation_steps* is reached.
+
+        Args:
+            cov_mat (np.array): Covariance matrix of the random walk proposal
+
+        Returns:
+            float: Average acceptance rate of all MH steps of the rejuvenation
+        """
+        num_steps = 0
+        num_accepted = 0.0
+        while True:
+            self.mcmc_kernel.pre_run(
+                self.particles, self.log_likelihood, self.log_prior, self.gamma_cur, cov_mat
+            )
+            self.mcmc_kernel.core_run()
+            (
+                self.particles,
+                self.log_likelihood,
+                self.log_prior,
+                self.log_posterior,
+                accept_rate,
+            ) = self.mcmc_kernel.post_run()
+
+            num_steps += self.mcmc_kernel.num_samples
+            num_accepted += accept_rate * self.mcmc_kernel.num_samples
+            avg_accept = num_accepted / num_steps
+            if (
+                self.max_rejuvenation_steps is None
+                or num_steps >= self.max_rejuvenation_steps
+                or num_steps >= self.num_required_rejuvenation_steps(avg_accept)
+            ):
+                break
+
+        if self.max_rejuvenation_steps is not None:
+            _logger.info(
+                "Rejuvenation with %s MH steps, acceptance rate: %.5f", num_steps, avg_accept
+            )
+        return avg_accept
+
     def core_run(self):
         """Core run of Sequential Monte Carlo iterator."""
         _logger.info("Welcome to SMC core run.")
@@ -406,17 +502,7 @@ class SequentialMonteCarlo(Iterator):
             cov_mat *= scale_prop_cov**2
 
             # Rejuvenate
-            self.mcmc_kernel.pre_run(
-                self.particles, self.log_likelihood, self.log_prior, self.gamma_cur, cov_mat
-            )
-            self.mcmc_kernel.core_run()
-            (
-                self.particles,
-                self.log_likelihood,
-                self.log_prior,
-                self.log_posterior,
-                avg_accept,
-            ) = self.mcmc_kernel.post_run()
+            avg_accept = self.rejuvenate(cov_mat)
 
             # plot the trace every plot_trace_every-th iteration
             if self.plot_trace_every and not step % self.plot_trace_every:
@@ -24,6 +24,7 @@ from SALib.sample import saltelli
 
 from queens.distributions import lognormal, normal, uniform
 from queens.iterators._iterator import Iterator
+from queens.utils.io import load_chunk_results, write_chunk_results
 from queens.utils.logger_settings import log_init_args
 from queens.utils.process_outputs import write_results
 
@@ -36,6 +37,12 @@ class SobolIndex(Iterator):
 
     This class essentially provides a wrapper around the SALib library.
 
+    With a chunk size, the Saltelli samples are evaluated chunk by chunk. The results of each chunk
+    are written to disk right away, such that an interrupted run can be resumed. After each chunk,
+    the indices and their bootstrap confidence intervals are recomputed on all samples evaluated so
+    far to monitor the convergence. Optionally, the evaluation stops once the confidence intervals
+    are narrow enough.
+
     Attributes:
         seed (int): Seed for random number generator.
         num_samples (int): Number of samples.
@@ -51,6 +58,14 @@ class SobolIndex(Iterator):
         num_params (int): Number of parameters.
         parameter_names (list): List of parameter names.
         sensitivity_indices (dict): Sensitivity indices from Sobol analysis.
+        chunk_size (int, None): Number of base samples evaluated at once. None evaluates all
+                                samples at once without writing chunks to disk.
+        resume (bool): If True, chunks with existing results on disk are not evaluated again.
+        convergence_tolerance (float, None): Stop the chunked evaluation once all confidence
+                                             intervals of the first and total order indices are
+                                             smaller than this tolerance.
+        convergence_history (list): First and total order indices with confidence intervals after
+                                    each chunk.
     """
 
     @log_init_args
@@ -66,6 +81,9 @@ class SobolIndex(Iterator):
         confidence_level,
         result_description,
         skip_values=None,
+        chunk_size=None,
+        resume=False,
+        convergence_tolerance=None,
     ):
         """Initialize Saltelli SALib iterator object.
 
@@ -83,7 +101,18 @@ class SobolIndex(Iterator):
                                        of base 2. None triggers the SALib default value:
                                        a power of 2 >= N, or 16; whichever is greater.
                                        (default: None).
+            chunk_size (int, opt): Number of base samples evaluated at once. Each base sample
+                                   corresponds to 2D+2 (D+2 without second order indices) model
+                                   evaluations. The results of each chunk are written to disk.
+                                   By default, all samples are evaluated at once.
+            resume (bool, opt): If True, chunks with existing results on disk are loaded instead
+                                of evaluated.
+            convergence_tolerance (float, opt): Stop the chunked evaluation once all confidence
+                                                intervals of the first and total order indices
+                                                are smaller than this tolerance.
         """
+        if chunk_size is None and (resume or convergence_tolerance is not None):
+            raise ValueError("Resuming and convergence monitoring require a chunk size.")
         super().__init__(model, parameters, global_settings)
 
         self.seed = seed
@@ -100,6 +129,10 @@ class SobolIndex(Iterator):
         self.num_params = self.parameters.num_parameters
         self.parameter_names = self.parameters.names
         self.sensitivity_indices = None
+        self.chunk_size = chunk_size
+        self.resume = resume
+        self.convergence_tolerance = convergence_tolerance
+        self.convergence_history = []
 
     def pre_run(self):
         """Generate samples for subsequent analysis and update model."""
@@ -136,12 +169,27 @@ class SobolIndex(Iterator):
     def core_run(self):
         """Run Analysis on model."""
         _logger.info("Evaluate model...")
+        if self.chunk_size is not None:
+            self._run_chunks()
+            return
+
         self.output = self.model.evaluate(self.samples)
 
         _logger.info("Calculate Sensitivity Indices...")
-        self.sensitivity_indices = sobol.analyze(
+        self.sensitivity_indices = self._analyze(self.output["result"])
+
+    def _analyze(self, result):
+        """Compute the Sobol indices and their confidence intervals.
+
+        Args:
+            result (np.ndarray): Model outputs of the first base samples
+
+        Returns:
+            dict: Sensitivity indices with confidence intervals
+        """
+        return sobol.analyze(
             self.salib_problem,
-            np.reshape(self.output["result"], (-1)),
+            np.reshape(result, (-1)),
             calc_second_order=self.calc_second_order,
             num_resamples=self.num_bootstrap_samples,
             conf_level=self.confidence_level,
@@ -149,6 +197,86 @@ class SobolIndex(Iterator):
             seed=self.seed,
         )
 
+    def _run_chunks(self):
+        """Evaluate the samples chunk by chunk and monitor the convergence of the indices.
+
+        The samples of a base sample are contiguous, such that each chunk extends the estimate by
+        *chunk_size* base samples.
+        """
+        if self.calc_second_order:
+            num_samples_per_base_sample = 2 * self.num_params + 2
+        else:
+            num_samples_per_base_sample = self.num_params + 2
+        num_chunk_samples = self.chunk_size * num_samples_per_base_sample
+
+        self.convergence_history = []
+        chunk_outputs = []
+        for chunk_id, chunk_start in enumerate(range(0, len(self.samples), num_chunk_samples)):
+            chunk_outputs.append(
+                self._evaluate_chunk(
+                    chunk_id, self.samples[chunk_start : chunk_start + num_chunk_samples]
+                )
+            )
+            self.output = {
+                key: np.concatenate([chunk_output[key] for chunk_output in chunk_outputs])
+                for key in chunk_outputs[0]
+            }
+
+            self.sensitivity_indices = self._analyze(self.output["result"])
+            num_base_samples = len(self.output["result"]) // num_samples_per_base_sample
+            self.convergence_history.append(
+                {
+                    "num_samples": num_base_samples,
+                    **{
+                        key: np.copy(self.sensitivity_indices[key])
+                        for key in ["S1", "S1_conf", "ST", "ST_conf"]
+                    },
+                }
+            )
+            _logger.info(
+                "Base samples: %d, S1: %s, ST: %s",
+                num_base_samples,
+                self.sensitivity_indices["S1"],
+                self.sensitivity_indices["ST"],
+            )
+            if self._converged():
+                _logger.info("Confidence intervals below %s. Stop.", self.convergence_tolerance)
+                break
+
+        self.samples = self.samples[: len(self.output["result"])]
+
+    def _converged(self):
+        """Check if the confidence intervals of the indices are below the tolerance.
+
+        Returns:
+            bool: True if all confidence intervals are smaller than the tolerance
+        """
+        if self.convergence_tolerance is None:
+            return False
+        return bool(
+            np.all(self.sensitivity_indices["S1_conf"] < self.convergence_tolerance)
+            and np.all(self.sensitivity_indices["ST_conf"] < self.convergence_tolerance)
+        )
+
+    def _evaluate_chunk(self, chunk_id, samples):
+        """Evaluate a chunk of samples and write its results to disk.
+
+        When resuming, existing results of the chunk are loaded if they belong to the same samples.
+
+        Args:
+            chunk_id (int): Number of the chunk
+            samples (np.ndarray): Samples of the chunk
+
+        Returns:
+            dict: Model output of the chunk
+        """
+        chunk_file = self.global_settings.result_file(".npz", suffix=f"_sobol_chunk_{chunk_id}")
+        if self.resume:
+            chunk_output = load_chunk_results(chunk_file, samples)
+            if chunk_output is not None:
+                return chunk_output
+        return write_chunk_results(chunk_file, samples, self.model.evaluate(samples))
+
     def post_run(self):
         """Analyze the results."""
         results = self.process_results()
@@ -233,6 +361,7 @@ class SobolIndex(Iterator):
             "second_order": self.calc_second_order,
             "samples": self.samples,
             "output": self.output,
+            "convergence_history": self.convergence_history,
         }
 
         return results
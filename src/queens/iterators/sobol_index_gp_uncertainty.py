@@ -154,7 +154,11 @@ class SobolIndexGPUncertainty(Iterator):
         """Core-run."""
         self.model.build_approximation()
 
-        self.calculate_index()
+        # the worker pool of the estimator is also terminated if the calculation fails
+        try:
+            self.calculate_index()
+        finally:
+            self.index_estimator.close_pool()
 
     def post_run(self):
         """Post-run."""
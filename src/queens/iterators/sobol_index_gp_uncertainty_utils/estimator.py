@@ -14,9 +14,12 @@
 #
 """Helper classes for estimation of Sobol indices."""
 
+import contextlib
 import logging
 import multiprocessing as mp
+import tempfile
 import time
+from pathlib import Path
 
 import numpy as np
 import xarray as xr
@@ -26,6 +29,8 @@ from queens.iterators.sobol_index_gp_uncertainty_utils.utils_estimate_indices im
     calculate_indices_second_order_gp_mean,
     calculate_indices_second_order_gp_realizations,
     calculate_indices_third_order,
+    estimate_on_shared_data,
+    release_shared_data,
 )
 from queens.utils.logger_settings import log_init_args
 
@@ -35,6 +40,11 @@ _logger = logging.getLogger(__name__)
 class SobolIndexEstimator:
     """Sobol Index Estimator class.
 
+    The estimates are computed in parallel by a pool of worker processes, which is started once and
+    reused until *close_pool* is called. The predictions and bootstrap indices are written once
+    per estimation to memory-mapped files, such that the workers only receive the ranges of
+    GP realizations or bootstrap samples to evaluate.
+
     Attributes:
         number_bootstrap_samples (int): number of bootstrap samples
         number_parameters (int): number of input space dimensions
@@ -47,6 +57,7 @@ class SobolIndexEstimator:
         first_order_estimator (string): estimator for first-order Sobol indices
         parameter_names (list): list of parameter names
         seed_bootstrap_samples (int): seed for bootstrap samples
+        pool (mp.pool.Pool): persistent pool of worker processes
     """
 
     @log_init_args
@@ -88,6 +99,7 @@ class SobolIndexEstimator:
         self.estimates_first_order = estimates_first_order
         self.estimates_second_order = estimates_second_order
         self.estimates_total_order = estimates_total_order
+        self.pool = None
 
     @classmethod
     def from_config_create(cls, method_options, parameter_names):
@@ -146,27 +158,23 @@ class SobolIndexEstimator:
         bootstrap_idx = self._draw_bootstrap_index()
         cross_parameter_names = self.parameter_names.copy()
 
-        # start multiprocessing pool
-        pool = mp.get_context("spawn").Pool(num_procs)
-
-        for input_dim, parameter_name in enumerate(self.parameter_names):
-            # adapt index so that for second-order indices redundant indices are not calculated
-            # twice since S_ij == S_ji
-            cross_parameter_names.remove(parameter_name)
-            start_time = time.time()
-
-            # calculate estimates in parallel (either over realizations or bootstrapping samples)
-            estimate_function, input_list = self._setup_parallelization(
-                prediction, input_dim, bootstrap_idx
-            )
-            raw_output = pool.starmap(estimate_function, input_list)
-
-            # sort raw output from parallel processes
-            self._sort_output(raw_output, parameter_name, cross_parameter_names)
+        with _shared_data(prediction, bootstrap_idx) as data_directory:
+            for input_dim, parameter_name in enumerate(self.parameter_names):
+                # adapt index so that for second-order indices redundant indices are not
+                # calculated twice since S_ij == S_ji
+                cross_parameter_names.remove(parameter_name)
+                start_time = time.time()
+
+                # calculate estimates in parallel (either over realizations or bootstrapping
+                # samples)
+                raw_output = self._map(
+                    *self._setup_parallelization(input_dim), data_directory, num_procs
+                )
 
-            _logger.info("Time for parameter %s: %f", parameter_name, time.time() - start_time)
+                # sort raw output from parallel processes
+                self._sort_output(raw_output, parameter_name, cross_parameter_names)
 
-        pool.close()
+                _logger.info("Time for parameter %s: %f", parameter_name, time.time() - start_time)
 
         _logger.debug("First-order estimates: %s", self.estimates_first_order.values)
         _logger.debug("Total-order estimates: %s", self.estimates_total_order.values)
@@ -178,6 +186,74 @@ class SobolIndexEstimator:
         }
         return estimates
 
+    def _map(
+        self, estimate_function, arguments, parallel_over_bootstrap, data_directory, num_procs
+    ):
+        """Evaluate an estimate function for all tasks on the shared data.
+
+        The tasks (GP realizations or bootstrap samples) are split into contiguous ranges, which
+        are distributed to the workers.
+
+        Args:
+            estimate_function (obj): function object for estimate calculation
+            arguments (tuple): arguments of the estimate function following the prediction and
+                               the bootstrap indices
+            parallel_over_bootstrap (bool): True if parallelized over bootstrap samples
+            data_directory (str): directory with the shared data
+            num_procs (int): number of processors
+
+        Returns:
+            raw_output (list): output of the estimate function for each task
+        """
+        if parallel_over_bootstrap:
+            number_tasks = self.number_bootstrap_samples
+        else:
+            number_tasks = self.number_gp_realizations
+        bounds = np.linspace(0, number_tasks, min(number_tasks, 4 * num_procs) + 1).astype(int)
+        input_list = [
+            (
+                data_directory,
+                estimate_function,
+                range(start, end),
+                parallel_over_bootstrap,
+                arguments,
+            )
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+
+        if num_procs == 1:
+            raw_output = [estimate_on_shared_data(*task_input) for task_input in input_list]
+        else:
+            pool = self._get_pool(min(num_procs, len(input_list)))
+            raw_output = pool.starmap(estimate_on_shared_data, input_list)
+        return [task_output for range_output in raw_output for task_output in range_output]
+
+    def _get_pool(self, num_procs):
+        """Get the pool of worker processes and start it on the first call.
+
+        The workers are spawned once and reused for all further estimates.
+
+        Args:
+            num_procs (int): number of processors
+
+        Returns:
+            pool (mp.pool.Pool): pool of worker processes
+        """
+        if self.pool is None:
+            self.pool = mp.get_context("spawn").Pool(num_procs)
+        return self.pool
+
+    def close_pool(self):
+        """Shut down the pool of worker processes.
+
+        All tasks are finished when the estimates are returned, such that the idle workers can be
+        terminated right away.
+        """
+        if self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+            self.pool = None
+
     def _draw_bootstrap_index(self):
         """Draw random index for bootstrapping.
 
@@ -256,7 +332,7 @@ class SobolIndexEstimator:
 
         return estimates_first_order, estimates_second_order, estimates_total_order
 
-    def _setup_parallelization(self, prediction, input_dim, bootstrap_idx):
+    def _setup_parallelization(self, input_dim):
         """Setup parallelization for calculation of estimates.
 
         The parallelization scheme is chosen as follows:
@@ -264,54 +340,32 @@ class SobolIndexEstimator:
         - If we use the GP mean, parallelize over the bootstrap samples.
 
         Args:
-            prediction (xr.DataArray): prediction
             input_dim (int): input parameter
-            bootstrap_idx (ndarray): random index for bootstrapping
 
         Returns:
             estimate_function (obj): function object for estimate calculation
-            input_list (list): list of input for estimate_function
+            arguments (tuple): arguments of estimate_function following the prediction and the
+                               bootstrap indices
+            parallel_over_bootstrap (bool): True if parallelized over bootstrap samples
         """
         if self.calculate_second_order:
             if self.number_gp_realizations == 1:
                 estimate_function = calculate_indices_second_order_gp_mean
-                input_list = [
-                    (
-                        prediction.data.squeeze(),
-                        bootstrap_idx[b, :],
-                        input_dim,
-                        self.number_parameters,
-                        self.first_order_estimator,
-                    )
-                    for b in np.arange(int(self.number_bootstrap_samples))
-                ]
-            else:
-                estimate_function = calculate_indices_second_order_gp_realizations
-                input_list = [
-                    (
-                        prediction.loc[{"gp_realization": k}].data,
-                        bootstrap_idx,
-                        input_dim,
-                        self.number_bootstrap_samples,
-                        self.number_parameters,
-                        self.first_order_estimator,
-                    )
-                    for k in np.arange(self.number_gp_realizations)
-                ]
+                arguments = (input_dim, self.number_parameters, self.first_order_estimator)
+                return estimate_function, arguments, True
+
+            estimate_function = calculate_indices_second_order_gp_realizations
+            arguments = (
+                input_dim,
+                self.number_bootstrap_samples,
+                self.number_parameters,
+                self.first_order_estimator,
+            )
         else:
             estimate_function = calculate_indices_first_total_order
-            input_list = [
-                (
-                    prediction.loc[{"gp_realization": k}].data,
-                    bootstrap_idx,
-                    input_dim,
-                    self.number_bootstrap_samples,
-                    self.first_order_estimator,
-                )
-                for k in np.arange(self.number_gp_realizations)
-            ]
+            arguments = (input_dim, self.number_bootstrap_samples, self.first_order_estimator)
 
-        return estimate_function, input_list
+        return estimate_function, arguments, False
 
     def _sort_output(self, raw_output, parameter_name, cross_parameter_names):
         """Sort raw output into DataArray.
@@ -489,12 +543,8 @@ class SobolIndexEstimatorThirdOrder(SobolIndexEstimator):
 
         start_time = time.time()
         # calculate estimates in parallel over Gaussian process realizations
-        estimate_function, input_list = self._setup_parallelization(prediction, 0, bootstrap_idx)
-
-        # start multiprocessing pool
-        pool = mp.get_context("spawn").Pool(num_procs)
-        raw_output = pool.starmap(estimate_function, input_list)
-        pool.close()
+        with _shared_data(prediction, bootstrap_idx) as data_directory:
+            raw_output = self._map(*self._setup_parallelization(0), data_directory, num_procs)
 
         # sort raw output from parallel processes
         self._sort_output(raw_output, "", [])
@@ -533,30 +583,25 @@ class SobolIndexEstimatorThirdOrder(SobolIndexEstimator):
         )
         return estimates_third_order
 
-    def _setup_parallelization(self, prediction, input_dim, bootstrap_idx):
+    def _setup_parallelization(self, input_dim):
         """Setup parallelization for calculation of estimates.
 
         Args:
-            prediction (xr.DataArray): prediction
             input_dim (int): input parameter
-            bootstrap_idx (ndarray): random index for bootstrapping
 
         Returns:
             estimate_function (obj): function object for estimate calculation
-            input_list (list): list of input for estimate_function
+            arguments (tuple): arguments of estimate_function following the prediction and the
+                               bootstrap indices
+            parallel_over_bootstrap (bool): True if parallelized over bootstrap samples
         """
         estimate_function = calculate_indices_third_order
-        input_list = [
-            (
-                prediction.loc[{"gp_realization": k}].data,
-                bootstrap_idx,
-                self.number_bootstrap_samples,
-                len(self.third_order_parameters),
-                self.first_order_estimator,
-            )
-            for k in np.arange(self.number_gp_realizations)
-        ]
-        return estimate_function, input_list
+        arguments = (
+            self.number_bootstrap_samples,
+            len(self.third_order_parameters),
+            self.first_order_estimator,
+        )
+        return estimate_function, arguments, False
 
     def _sort_output(self, raw_output, parameter_name, cross_parameter_names):
         """Sort raw output into DataArray.
@@ -568,3 +613,31 @@ class SobolIndexEstimatorThirdOrder(SobolIndexEstimator):
         """
         for k in np.arange(self.number_gp_realizations):
             self.estimates_third_order.loc[{"gp_realization": k}] = raw_output[k]
+
+
+@contextlib.contextmanager
+def _shared_data(prediction, bootstrap_idx):
+    """Write the prediction and bootstrap indices to memory-mapped files.
+
+    The GP realizations are stored contiguously. The files are removed on exit.
+
+    Args:
+        prediction (xr.DataArray): prediction from Gaussian process
+        bootstrap_idx (ndarray): index for bootstrapping
+
+    Yields:
+        data_directory (str): directory with the shared data
+    """
+    with tempfile.TemporaryDirectory(prefix="queens_sobol_") as data_directory:
+        data = np.moveaxis(np.asarray(prediction.data, dtype=np.float64), -1, 0)
+        shared_prediction = np.lib.format.open_memmap(
+            Path(data_directory, "prediction.npy"), mode="w+", dtype=np.float64, shape=data.shape
+        )
+        shared_prediction[:] = data
+        shared_prediction.flush()
+        del shared_prediction
+        np.save(Path(data_directory, "bootstrap_idx.npy"), bootstrap_idx)
+        try:
+            yield data_directory
+        finally:
+            release_shared_data()
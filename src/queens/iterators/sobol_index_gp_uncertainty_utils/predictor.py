@@ -33,24 +33,55 @@ class Predictor:
     of the Gaussian process or using the posterior mean of the Gaussian process (if the number of
     GP realizations is set to 1).
 
+    The realizations are either sampled independently at each sample (*independent*) or as
+    correlated sample paths of the posterior (*pathwise*). Pathwise realizations are low-rank
+    function draws, which are evaluated in chunks of samples. Hence, the cost is linear in the
+    number of realizations and the memory of intermediate results is bounded by the chunk size.
+
     Attributes:
         number_gp_realizations (int): number of Gaussian process realizations
         gp_model (Model): Gaussian process model
         seed_posterior_samples (int): seed for posterior samples
+        posterior_sampling (str): sampling of the realizations, *independent* or *pathwise*
+        number_fourier_features (int): number of random Fourier features of pathwise realizations
+        prediction_chunk_size (int): number of samples at which pathwise realizations are
+                                     evaluated at once
     """
 
     @log_init_args
-    def __init__(self, gp_model, number_gp_realizations, seed_posterior_samples):
+    def __init__(
+        self,
+        gp_model,
+        number_gp_realizations,
+        seed_posterior_samples,
+        posterior_sampling="independent",
+        number_fourier_features=1000,
+        prediction_chunk_size=1000,
+    ):
         """Initialize.
 
         Args:
             gp_model (Model): Gaussian process model
             number_gp_realizations (int): number of Gaussian process realizations
             seed_posterior_samples (int): seed for posterior samples
+            posterior_sampling (str, opt): sampling of the realizations, *independent* or
+                                           *pathwise*
+            number_fourier_features (int, opt): number of random Fourier features of pathwise
+                                                realizations
+            prediction_chunk_size (int, opt): number of samples at which pathwise realizations
+                                              are evaluated at once
         """
+        if posterior_sampling not in ("independent", "pathwise"):
+            raise ValueError(
+                f"Unknown posterior sampling '{posterior_sampling}'. "
+                "Valid options are 'independent' and 'pathwise'."
+            )
         self.gp_model = gp_model
         self.number_gp_realizations = number_gp_realizations
         self.seed_posterior_samples = seed_posterior_samples
+        self.posterior_sampling = posterior_sampling
+        self.number_fourier_features = number_fourier_features
+        self.prediction_chunk_size = prediction_chunk_size
 
     @classmethod
     def from_config_create(cls, method_options, gp_model):
@@ -65,14 +96,19 @@ class Predictor:
         """
         number_gp_realizations = method_options["number_gp_realizations"]
         seed_posterior_samples = method_options.get("seed_posterior_samples", None)
+        posterior_sampling = method_options.get("posterior_sampling", "independent")
         if number_gp_realizations == 1:
             _logger.info("Number of realizations = 1. Prediction is based on GP mean.")
         else:
             _logger.info("Number of realizations = %i", number_gp_realizations)
+            _logger.info("Posterior sampling: %s", posterior_sampling)
         return cls(
             gp_model=gp_model,
             number_gp_realizations=number_gp_realizations,
             seed_posterior_samples=seed_posterior_samples,
+            posterior_sampling=posterior_sampling,
+            number_fourier_features=method_options.get("number_fourier_features", 1000),
+            prediction_chunk_size=method_options.get("prediction_chunk_size", 1000),
         )
 
     def predict(self, samples):
@@ -91,11 +127,20 @@ class Predictor:
         prediction = self._init_prediction(samples)
 
         inputs = np.array(samples).reshape(-1, samples.shape[-1])
-        gp_output = self.gp_model.predict(inputs, support="f")
 
         if self.number_gp_realizations == 1:
+            gp_output = self.gp_model.predict(inputs, support="f")
             raw_prediction = gp_output["result"].reshape(*samples.shape[:2], 1)
+        elif self.posterior_sampling == "pathwise":
+            raw_prediction = self.gp_model.sample_posterior_paths(
+                inputs,
+                self.number_gp_realizations,
+                number_features=self.number_fourier_features,
+                rng=np.random.default_rng(self.seed_posterior_samples),
+                chunk_size=self.prediction_chunk_size,
+            ).reshape(*samples.shape[:2], self.number_gp_realizations)
         else:
+            gp_output = self.gp_model.predict(inputs, support="f")
             if self.seed_posterior_samples:
                 np.random.seed(self.seed_posterior_samples)
             raw_prediction = (
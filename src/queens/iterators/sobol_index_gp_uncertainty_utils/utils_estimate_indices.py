@@ -20,8 +20,67 @@ with multiprocessing.
 Important: Do not use XArrays in parallel processes as they are very slow!
 """
 
+from pathlib import Path
+
 import numpy as np
 
+# memory-mapped shared data opened by the current process
+_SHARED_DATA = {}
+
+
+def load_shared_data(data_directory):
+    """Open the shared predictions and bootstrap indices.
+
+    The memory-mapped arrays are opened once per process and data directory.
+
+    Args:
+        data_directory (str): Directory with the shared arrays
+
+    Returns:
+        prediction (np.memmap): predictions with shape (gp_realization, monte_carlo,
+                                sample_matrix)
+        bootstrap_idx (np.ndarray): bootstrap indices
+    """
+    if data_directory not in _SHARED_DATA:
+        _SHARED_DATA.clear()
+        _SHARED_DATA[data_directory] = (
+            np.load(Path(data_directory, "prediction.npy"), mmap_mode="r"),
+            np.load(Path(data_directory, "bootstrap_idx.npy")),
+        )
+    return _SHARED_DATA[data_directory]
+
+
+def release_shared_data():
+    """Close the shared data opened by the current process."""
+    _SHARED_DATA.clear()
+
+
+def estimate_on_shared_data(
+    data_directory, estimate_function, task_range, parallel_over_bootstrap, arguments
+):
+    """Evaluate an estimate function for a range of tasks on the shared data.
+
+    Args:
+        data_directory (str): Directory with the shared arrays
+        estimate_function (obj): function object for estimate calculation
+        task_range (range): bootstrap samples or GP realizations to evaluate
+        parallel_over_bootstrap (bool): True if the tasks are bootstrap samples (of the GP mean)
+        arguments (tuple): arguments of the estimate function following the prediction and the
+                           bootstrap indices
+
+    Returns:
+        list: output of the estimate function for each task
+    """
+    prediction, bootstrap_idx = load_shared_data(data_directory)
+    if parallel_over_bootstrap:
+        return [
+            estimate_function(prediction[0], bootstrap_idx[task_id], *arguments)
+            for task_id in task_range
+        ]
+    return [
+        estimate_function(prediction[task_id], bootstrap_idx, *arguments) for task_id in task_range
+    ]
+
 
 def bootstrap(prediction, bootstrap_indices):
     """Bootstrap samples.
@@ -92,10 +92,15 @@ class Gaussian(Likelihood):
         if noise_value is None and noise_type.startswith("fixed"):
             raise InvalidOptionError(f"You have to provide a 'noise_value' for {noise_type}.")
 
+        # fixed independent noise is represented by the variances to avoid dense covariance
+        # matrices, the MAP estimates are updated as dense matrices
+        covariance_structure = "dense"
         if noise_type == "fixed_variance":
-            covariance = noise_value * np.eye(y_obs_dim)
+            covariance = noise_value * np.ones(y_obs_dim)
+            covariance_structure = "diagonal"
         elif noise_type == "fixed_variance_vector":
-            covariance = np.diag(noise_value)
+            covariance = np.array(noise_value).reshape(-1)
+            covariance_structure = "diagonal"
         elif noise_type == "fixed_covariance_matrix":
             covariance = noise_value
         elif noise_type in [
@@ -107,7 +112,9 @@ class Gaussian(Likelihood):
         else:
             raise NotImplementedError
 
-        normal_distribution = Normal(self.y_obs, covariance)
+        normal_distribution = Normal(
+            self.y_obs, covariance, covariance_structure=covariance_structure
+        )
 
         self.nugget_noise_variance = nugget_noise_variance
         self.noise_type = noise_type
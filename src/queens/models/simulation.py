@@ -26,6 +26,7 @@ class Simulation(Model):
     Attributes:
         scheduler (Scheduler): Scheduler for the simulations
         driver (Driver): Driver for the simulations
+        job_ids (np.ndarray, None): IDs of the jobs of the last concurrent evaluation
     """
 
     @log_init_args
@@ -39,6 +40,7 @@ class Simulation(Model):
         super().__init__()
         self.scheduler = scheduler
         self.driver = driver
+        self.job_ids = None
         self.scheduler.copy_files_to_experiment_dir(self.driver.files_to_copy)
 
     def _evaluate(self, samples):
@@ -75,3 +77,59 @@ class Simulation(Model):
         response_gradient = np.swapaxes(self.response["gradient"], 1, 2)
         gradient = np.sum(upstream_gradient[:, :, np.newaxis] * response_gradient, axis=1)
         return gradient
+
+
+def supports_concurrent_evaluation(model):
+    """Check if the jobs of a model can be submitted together with those of other models.
+
+    This only holds for plain simulation models. Subclasses that override the evaluation (e.g.
+    finite differences or adjoint models) are evaluated via their own *evaluate* method.
+
+    Args:
+        model (Model): Model to check
+
+    Returns:
+        bool: True if the model evaluates its samples directly with its scheduler
+    """
+    return isinstance(model, Simulation) and type(model)._evaluate is Simulation._evaluate
+
+
+def evaluate_concurrently(models, samples):
+    """Evaluate several models at the same time.
+
+    The jobs of all simulation models that share a scheduler are submitted at once, such that the
+    scheduler can process them concurrently. Other models, including subclasses of the simulation
+    model with their own evaluation, are evaluated one after another. Models without samples are
+    not evaluated.
+
+    Args:
+        models (list): Models to evaluate
+        samples (list): Input samples of each model
+
+    Returns:
+        responses (list): Response of each model (None for models without samples)
+    """
+    responses = [None] * len(models)
+    indices_by_scheduler = {}
+    for index, (model, model_samples) in enumerate(zip(models, samples)):
+        if len(model_samples) == 0:
+            continue
+        if supports_concurrent_evaluation(model):
+            indices_by_scheduler.setdefault(id(model.scheduler), []).append(index)
+        else:
+            responses[index] = model.evaluate(model_samples)
+
+    for indices in indices_by_scheduler.values():
+        scheduler = models[indices[0]].scheduler
+        batches = []
+        for index in indices:
+            model = models[index]
+            model.job_ids = scheduler.get_job_ids(len(samples[index]))
+            batches.append((samples[index], model.driver, model.job_ids))
+
+        for index, response in zip(indices, scheduler.evaluate_batches(batches)):
+            models[index].num_evaluations += len(samples[index])
+            models[index].response = response
+            responses[index] = response
+
+    return responses
@@ -21,6 +21,7 @@ import numpy as np
 import tensorflow_probability as tfp
 
 from queens.models.surrogates._surrogate import Surrogate
+from queens.models.surrogates.utils.pathwise_sampling import SquaredExponentialPosteriorPaths
 from queens.utils.configure_tensorflow import configure_tensorflow
 from queens.utils.gpflow_transformations import init_scaler, set_transform_function
 from queens.utils.logger_settings import log_init_args
@@ -270,6 +271,38 @@ class GaussianProcess(Surrogate):
 
         return output
 
+    def sample_posterior_paths(
+        self, x_test, number_paths, number_features=1000, rng=None, chunk_size=1000
+    ):
+        """Sample correlated paths of the posterior latent function at *x_test*.
+
+        In contrast to independent samples at each input, the paths are functions drawn from the
+        posterior (see *SquaredExponentialPosteriorPaths*). The inputs are evaluated in chunks.
+
+        Args:
+            x_test (np.ndarray): Inputs at which the paths are evaluated
+            number_paths (int): Number of sample paths
+            number_features (int, opt): Number of random Fourier features of the prior paths
+            rng (np.random.Generator, opt): Random number generator
+            chunk_size (int, opt): Number of inputs evaluated at once
+
+        Returns:
+            np.ndarray: Posterior sample paths of shape (number of inputs, number_paths)
+        """
+        x_test = np.atleast_2d(x_test).reshape((-1, self.number_input_dimensions))
+        paths = SquaredExponentialPosteriorPaths(
+            self.x_train,
+            self.y_train,
+            lengthscales=self.model.kernel.lengthscales.numpy(),
+            variance=self.model.kernel.variance.numpy(),
+            noise_variance=self.model.likelihood.variance.numpy(),
+            number_paths=number_paths,
+            number_features=number_features,
+            rng=rng,
+        )
+        samples = paths.evaluate(self.scaler_x.transform(x_test), chunk_size=chunk_size)
+        return samples * self.scaler_y.scale_ + self.scaler_y.mean_
+
     def assign_hyperparameters(self, hyperparameters, transform=False):
         """Assign untransformed (constrained) hyperparameters to model.
 
@@ -0,0 +1,155 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Pathwise sampling of Gaussian process posteriors.
+
+Posterior sample paths are drawn with decoupled sampling [1]: a prior sample path, approximated
+with random Fourier features [2], is updated with the exact posterior correction (Matheron's
+rule),
+
+    f_post(x) = f_prior(x) + k(x, X) (K + s² I)^-1 (y - f_prior(X) - e),   e ~ N(0, s² I).
+
+The paths are correlated functions, which can be evaluated at arbitrary inputs. Drawing a path
+requires one solve with the kernel matrix of the training data. The cost of evaluating the paths
+is linear in the number of inputs and paths, and the inputs are processed in chunks to bound the
+memory.
+
+References:
+    [1]: Wilson, J. T., Borovitskiy, V., Terenin, A., Mostowsky, P., & Deisenroth, M. P. (2020).
+         Efficiently sampling functions from Gaussian process posteriors. Proceedings of the 37th
+         International Conference on Machine Learning, 10292-10302.
+    [2]: Rahimi, A., & Recht, B. (2007). Random features for large-scale kernel machines. Advances
+         in Neural Information Processing Systems 20.
+"""
+
+import numpy as np
+import scipy.linalg
+
+from queens.utils.numpy_linalg import safe_cholesky
+from queens.utils.random_generator import get_random_generator
+
+
+class SquaredExponentialPosteriorPaths:
+    """Posterior sample paths of a Gaussian process with squared exponential kernel.
+
+    Attributes:
+        x_train (np.ndarray): Training inputs
+        lengthscales (np.ndarray): Lengthscales of the kernel per input dimension
+        variance (float): Variance of the kernel
+        frequencies (np.ndarray): Random frequencies of the Fourier features
+        phases (np.ndarray): Random phases of the Fourier features
+        feature_weights (np.ndarray): Weights of the Fourier features of the prior paths
+        update_weights (np.ndarray): Weights of the kernel functions of the posterior update
+    """
+
+    def __init__(
+        self,
+        x_train,
+        y_train,
+        lengthscales,
+        variance,
+        noise_variance,
+        number_paths,
+        number_features=1000,
+        rng=None,
+    ):
+        """Draw posterior sample paths.
+
+        Args:
+            x_train (np.ndarray): Training inputs
+            y_train (np.ndarray): Training outputs
+            lengthscales (float, np.ndarray): Lengthscales of the kernel (scalar or per dimension)
+            variance (float): Variance of the kernel
+            noise_variance (float): Variance of the observation noise
+            number_paths (int): Number of sample paths
+            number_features (int, opt): Number of random Fourier features of the prior paths
+            rng (np.random.Generator, opt): Random number generator
+        """
+        rng = get_random_generator(rng)
+        y_train = np.asarray(y_train, dtype=float).reshape(-1, 1)
+        self.x_train = np.asarray(x_train, dtype=float).reshape(y_train.shape[0], -1)
+        number_dimensions = self.x_train.shape[1]
+        self.lengthscales = np.broadcast_to(
+            np.asarray(lengthscales, dtype=float).reshape(-1), (number_dimensions,)
+        )
+        self.variance = float(variance)
+
+        self.frequencies = (
+            rng.standard_normal((number_dimensions, number_features))
+            / self.lengthscales[:, np.newaxis]
+        )
+        self.phases = rng.uniform(0.0, 2.0 * np.pi, number_features)
+        self.feature_weights = rng.standard_normal((number_features, number_paths))
+        noise = np.sqrt(noise_variance) * rng.standard_normal((y_train.shape[0], number_paths))
+
+        kernel_matrix = self.kernel(self.x_train, self.x_train) + noise_variance * np.eye(
+            y_train.shape[0]
+        )
+        low_cholesky = safe_cholesky(kernel_matrix)
+        self.update_weights = scipy.linalg.cho_solve(
+            (low_cholesky, True), y_train - self.prior(self.x_train) - noise
+        )
+
+    def kernel(self, x_1, x_2):
+        """Evaluate the squared exponential kernel.
+
+        Args:
+            x_1 (np.ndarray): First inputs
+            x_2 (np.ndarray): Second inputs
+
+        Returns:
+            np.ndarray: Kernel matrix of shape (len(x_1), len(x_2))
+        """
+        scaled_x_1 = x_1 / self.lengthscales
+        scaled_x_2 = x_2 / self.lengthscales
+        squared_distances = (
+            np.sum(scaled_x_1**2, axis=1)[:, np.newaxis]
+            + np.sum(scaled_x_2**2, axis=1)
+            - 2.0 * np.dot(scaled_x_1, scaled_x_2.T)
+        )
+        return self.variance * np.exp(-0.5 * np.maximum(squared_distances, 0.0))
+
+    def prior(self, x):
+        """Evaluate the prior sample paths.
+
+        Args:
+            x (np.ndarray): Inputs
+
+        Returns:
+            np.ndarray: Prior sample paths of shape (len(x), number_paths)
+        """
+        number_features = self.phases.shape[0]
+        features = np.sqrt(2.0 * self.variance / number_features) * np.cos(
+            np.dot(x, self.frequencies) + self.phases
+        )
+        return np.dot(features, self.feature_weights)
+
+    def evaluate(self, x, chunk_size=1000):
+        """Evaluate the posterior sample paths.
+
+        Args:
+            x (np.ndarray): Inputs
+            chunk_size (int, opt): Number of inputs evaluated at once
+
+        Returns:
+            np.ndarray: Posterior sample paths of shape (len(x), number_paths)
+        """
+        x = np.asarray(x, dtype=float).reshape(-1, self.x_train.shape[1])
+        paths = np.empty((x.shape[0], self.feature_weights.shape[1]))
+        for start in range(0, x.shape[0], chunk_size):
+            chunk = x[start : start + chunk_size]
+            paths[start : start + chunk_size] = self.prior(chunk) + np.dot(
+                self.kernel(chunk, self.x_train), self.update_weights
+            )
+        return paths
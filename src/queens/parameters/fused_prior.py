@@ -0,0 +1,465 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Fused evaluation of the joint prior of independent parameters.
+
+One-dimensional parameters of the same distribution family are stacked into arrays, such that
+each family is evaluated with a single vectorized call instead of one call per parameter. All
+other parameters (multivariate distributions, random fields, ...) are evaluated individually.
+"""
+
+import abc
+
+import numpy as np
+import scipy.stats
+
+from queens.distributions.lognormal import LogNormal
+from queens.distributions.normal import Normal
+from queens.distributions.uniform import Uniform
+from queens.utils.random_generator import get_random_generator
+
+
+class _ParameterGroup(metaclass=abc.ABCMeta):
+    """Group of one-dimensional parameters of the same distribution family.
+
+    Attributes:
+        columns (np.ndarray): Columns of the parameters in the samples
+    """
+
+    def __init__(self, parameters, columns):
+        """Initialize parameter group.
+
+        Args:
+            parameters (list): One-dimensional distributions of the group
+            columns (list): Columns of the parameters in the samples
+        """
+        self.columns = np.array(columns, dtype=int)
+        self.stack_parameters(parameters)
+
+    @staticmethod
+    def _stack(parameters, attribute):
+        """Stack a (scalar) attribute of all parameters.
+
+        Args:
+            parameters (list): One-dimensional distributions of the group
+            attribute (function): Function returning the attribute of a distribution
+
+        Returns:
+            np.ndarray: Stacked attribute
+        """
+        return np.array([np.squeeze(attribute(parameter)) for parameter in parameters])
+
+    @abc.abstractmethod
+    def stack_parameters(self, parameters):
+        """Stack the distribution parameters of the group.
+
+        Args:
+            parameters (list): One-dimensional distributions of the group
+        """
+
+    @abc.abstractmethod
+    def draw(self, num_samples, rng=None):
+        """Draw samples of all parameters of the group.
+
+        Args:
+            num_samples (int): Number of samples
+            rng (np.random.Generator, optional): Random number generator
+        """
+
+    @abc.abstractmethod
+    def logpdf(self, samples):
+        """Logpdf of each parameter of the group.
+
+        Args:
+            samples (np.ndarray): Samples of the parameters of the group
+        """
+
+    @abc.abstractmethod
+    def grad_logpdf(self, samples):
+        """Gradient of the logpdf of each parameter of the group.
+
+        Args:
+            samples (np.ndarray): Samples of the parameters of the group
+        """
+
+    @abc.abstractmethod
+    def ppf(self, quantiles):
+        """Percent point function of each parameter of the group.
+
+        Args:
+            quantiles (np.ndarray): Quantiles of the parameters of the group
+        """
+
+
+class _NormalGroup(_ParameterGroup):
+    """Group of one-dimensional normal distributions.
+
+    Attributes:
+        mean (np.ndarray): Means of the distributions
+        std (np.ndarray): Standard deviations of the distributions
+        precision (np.ndarray): Precisions of the distributions
+        logpdf_const (np.ndarray): Constants for the evaluation of the logpdf
+    """
+
+    def stack_parameters(self, parameters):
+        """Stack the distribution parameters of the group.
+
+        Args:
+            parameters (list): One-dimensional distributions of the group
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.mean = self._stack(parameters, lambda parameter: parameter.mean)
+        self.std = self._stack(parameters, lambda parameter: parameter.low_chol)
+        self.precision = self._stack(parameters, lambda parameter: parameter.precision)
+        self.logpdf_const = self._stack(parameters, lambda parameter: parameter.logpdf_const)
+
+    def draw(self, num_samples, rng=None):
+        """Draw samples of all parameters of the group.
+
+        Args:
+            num_samples (int): Number of samples
+            rng (np.random.Generator, optional): Random number generator
+
+        Returns:
+            np.ndarray: Drawn samples
+        """
+        # same order of random numbers as drawing the parameters one after the other
+        return (
+            self.mean
+            + self.std
+            * get_random_generator(rng).standard_normal((len(self.columns), num_samples)).T
+        )
+
+    def logpdf(self, samples):
+        """Logpdf of each parameter of the group.
+
+        Args:
+            samples (np.ndarray): Samples of the parameters of the group
+
+        Returns:
+            np.ndarray: Logpdf of each parameter
+        """
+        dist = samples - self.mean
+        return self.logpdf_const - 0.5 * dist * self.precision * dist
+
+    def grad_logpdf(self, samples):
+        """Gradient of the logpdf of each parameter of the group.
+
+        Args:
+            samples (np.ndarray): Samples of the parameters of the group
+
+        Returns:
+            np.ndarray: Gradient of the logpdf of each parameter
+        """
+        return (self.mean - samples) * self.precision
+
+    def ppf(self, quantiles):
+        """Percent point function of each parameter of the group.
+
+        Args:
+            quantiles (np.ndarray): Quantiles of the parameters of the group
+
+        Returns:
+            np.ndarray: Positions which correspond to given quantiles
+        """
+        return scipy.stats.norm.ppf(quantiles, loc=self.mean, scale=self.std)
+
+
+class _LogNormalGroup(_NormalGroup):
+    """Group of one-dimensional lognormal distributions."""
+
+    def stack_parameters(self, parameters):
+        """Stack the distribution parameters of the underlying normal distributions.
+
+        Args:
+            parameters (list): One-dimensional distributions of the group
+        """
+        super().stack_parameters([parameter.normal_distribution for parameter in parameters])
+
+    def draw(self, num_samples, rng=None):
+        """Draw samples of all parameters of the group.
+
+        Args:
+            num_samples (int): Number of samples
+            rng (np.random.Generator, optional): Random number generator
+
+        Returns:
+            np.ndarray: Drawn samples
+        """
+        return np.exp(super().draw(num_samples, rng=rng))
+
+    def logpdf(self, samples):
+        """Logpdf of each parameter of the group.
+
+        Args:
+            samples (np.ndarray): Samples of the parameters of the group
+
+        Returns:
+            np.ndarray: Logpdf of each parameter
+        """
+        log_samples = np.log(samples)
+        return super().logpdf(log_samples) - log_samples
+
+    def grad_logpdf(self, samples):
+        """Gradient of the logpdf of each parameter of the group.
+
+        Args:
+            samples (np.ndarray): Samples of the parameters of the group
+
+        Returns:
+            np.ndarray: Gradient of the logpdf of each parameter
+        """
+        samples = np.where(samples == 0, np.nan, samples)
+        return 1 / samples * (super().grad_logpdf(np.log(samples)) - 1)
+
+    def ppf(self, quantiles):
+        """Percent point function of each parameter of the group.
+
+        Args:
+            quantiles (np.ndarray): Quantiles of the parameters of the group
+
+        Returns:
+            np.ndarray: Positions which correspond to given quantiles
+        """
+        return scipy.stats.lognorm.ppf(quantiles, s=self.std, scale=np.exp(self.mean))
+
+
+class _UniformGroup(_ParameterGroup):
+    """Group of one-dimensional uniform distributions.
+
+    Attributes:
+        lower_bound (np.ndarray): Lower bounds of the distributions
+        upper_bound (np.ndarray): Upper bounds of the distributions
+        logpdf_const (np.ndarray): Logpdf of the distributions within their bounds
+    """
+
+    def stack_parameters(self, parameters):
+        """Stack the distribution parameters of the group.
+
+        Args:
+            parameters (list): One-dimensional distributions of the group
+        """
+        # pylint: disable=attribute-defined-outside-init
+        self.lower_bound = self._stack(parameters, lambda parameter: parameter.lower_bound)
+        self.upper_bound = self._stack(parameters, lambda parameter: parameter.upper_bound)
+        self.logpdf_const = self._stack(parameters, lambda parameter: parameter.logpdf_const)
+
+    def draw(self, num_samples, rng=None):
+        """Draw samples of all parameters of the group.
+
+        Args:
+            num_samples (int): Number of samples
+            rng (np.random.Generator, optional): Random number generator
+
+        Returns:
+            np.ndarray: Drawn samples
+        """
+        # same order of random numbers as drawing the parameters one after the other
+        return (
+            get_random_generator(rng)
+            .uniform(
+                low=self.lower_bound.reshape(-1, 1),
+                high=self.upper_bound.reshape(-1, 1),
+                size=(len(self.columns), num_samples),
+            )
+            .T
+        )
+
+    def logpdf(self, samples):
+        """Logpdf of each parameter of the group.
+
+        Args:
+            samples (np.ndarray): Samples of the parameters of the group
+
+        Returns:
+            np.ndarray: Logpdf of each parameter
+        """
+        within_bounds = (samples >= self.lower_bound) & (samples <= self.upper_bound)
+        return np.where(within_bounds, self.logpdf_const, -np.inf)
+
+    def grad_logpdf(self, samples):
+        """Gradient of the logpdf of each parameter of the group.
+
+        Args:
+            samples (np.ndarray): Samples of the parameters of the group
+
+        Returns:
+            np.ndarray: Gradient of the logpdf of each parameter
+        """
+        return np.zeros(samples.shape)
+
+    def ppf(self, quantiles):
+        """Percent point function of each parameter of the group.
+
+        Args:
+            quantiles (np.ndarray): Quantiles of the parameters of the group
+
+        Returns:
+            np.ndarray: Positions which correspond to given quantiles
+        """
+        return scipy.stats.uniform.ppf(
+            quantiles, loc=self.lower_bound, scale=self.upper_bound - self.lower_bound
+        )
+
+
+# exact types, subclasses might change the behavior of the distribution
+GROUP_TYPES = {
+    Normal: _NormalGroup,
+    LogNormal: _LogNormalGroup,
+    Uniform: _UniformGroup,
+}
+
+
+def _group_type(parameter):
+    """Group type of a parameter.
+
+    Args:
+        parameter (Continuous, RandomField): Parameter object
+
+    Returns:
+        type: Group class or *None* if the parameter can not be grouped
+    """
+    if getattr(parameter, "dimension", None) != 1:
+        return None
+    return GROUP_TYPES.get(type(parameter))
+
+
+class FusedPrior:
+    """Fused joint prior of independent parameters.
+
+    The groups are compiled once from the parameters. Changes of the distribution parameters
+    after the construction are therefore not reflected.
+
+    Attributes:
+        num_parameters (int): Number of (truncated) parameters
+        groups (list): Groups of parameters of the same family, used for the evaluation of the
+                       logpdf, its gradient and the ppf
+        draw_groups (list): Groups of consecutive parameters of the same family and ungrouped
+                            parameters in the order of the parameters. Used to draw samples with
+                            the same random numbers as drawing the parameters one after the other.
+        ungrouped (list): Tuples of parameters which can not be grouped and their columns in the
+                          samples
+    """
+
+    def __init__(self, parameters):
+        """Initialize fused prior.
+
+        Args:
+            parameters (list): Parameter objects in the order of the columns of the samples
+        """
+        families = {}
+        self.draw_groups = []
+        self.ungrouped = []
+        draw_run = []
+        column = 0
+        for parameter in parameters:
+            group_type = _group_type(parameter)
+            if draw_run and group_type is not draw_run[0][2]:
+                self.draw_groups.append(self._draw_group(draw_run))
+                draw_run = []
+
+            if group_type is None:
+                columns = slice(column, column + parameter.dimension)
+                self.ungrouped.append((parameter, columns))
+                self.draw_groups.append((parameter, columns))
+            else:
+                families.setdefault(group_type, []).append((parameter, column))
+                draw_run.append((parameter, column, group_type))
+            column += parameter.dimension
+
+        if draw_run:
+            self.draw_groups.append(self._draw_group(draw_run))
+
+        self.num_parameters = column
+        self.groups = [group_type(*zip(*members)) for group_type, members in families.items()]
+
+    @staticmethod
+    def _draw_group(draw_run):
+        """Create a group from a run of consecutive parameters.
+
+        Args:
+            draw_run (list): Tuples of parameter, column and group type
+
+        Returns:
+            _ParameterGroup: Group of the parameters
+        """
+        parameters, columns, group_types = zip(*draw_run)
+        return group_types[0](parameters, columns)
+
+    def draw_samples(self, num_samples, rng=None):
+        """Draw samples from all parameters.
+
+        Args:
+            num_samples (int): Number of samples
+            rng (np.random.Generator, optional): Random number generator
+
+        Returns:
+            samples (np.ndarray): Drawn samples
+        """
+        samples = np.zeros((num_samples, self.num_parameters))
+        for group in self.draw_groups:
+            if isinstance(group, _ParameterGroup):
+                samples[:, group.columns] = group.draw(num_samples, rng=rng)
+            else:
+                parameter, columns = group
+                samples[:, columns] = parameter.draw(num_samples, rng=rng)
+        return samples
+
+    def joint_logpdf(self, samples):
+        """Evaluate the logpdf summed over all parameters.
+
+        Args:
+            samples (np.ndarray): Samples, each row represents a sample
+
+        Returns:
+            logpdf (np.ndarray): logpdf summed over all parameters
+        """
+        logpdf = 0
+        for group in self.groups:
+            logpdf += group.logpdf(samples[:, group.columns]).sum(axis=1)
+        for parameter, columns in self.ungrouped:
+            logpdf += parameter.logpdf(samples[:, columns])
+        return logpdf
+
+    def grad_joint_logpdf(self, samples):
+        """Evaluate the gradient of the joint logpdf w.r.t. the samples.
+
+        Args:
+            samples (np.ndarray): Samples, each row represents a sample
+
+        Returns:
+            grad_logpdf (np.ndarray): Gradient of the joint logpdf w.r.t. the samples
+        """
+        grad_logpdf = np.zeros(samples.shape)
+        for group in self.groups:
+            grad_logpdf[:, group.columns] = group.grad_logpdf(samples[:, group.columns])
+        for parameter, columns in self.ungrouped:
+            grad_logpdf[:, columns] = parameter.grad_logpdf(samples[:, columns])
+        return grad_logpdf
+
+    def inverse_cdf_transform(self, samples):
+        """Transform samples from the unit hypercube with the ppf of the parameters.
+
+        Args:
+            samples (np.ndarray): Samples, each row represents a sample
+
+        Returns:
+            transformed_samples (np.ndarray): Transformed samples
+        """
+        transformed_samples = np.zeros(samples.shape)
+        for group in self.groups:
+            transformed_samples[:, group.columns] = group.ppf(samples[:, group.columns])
+        for parameter, columns in self.ungrouped:
+            transformed_samples[:, columns] = parameter.ppf(samples[:, columns]).reshape(-1, 1)
+        return transformed_samples
@@ -19,8 +19,11 @@ import logging
 import numpy as np
 
 from queens.distributions._distribution import Continuous
+from queens.parameters.fused_prior import FusedPrior
 from queens.parameters.random_fields._random_field import RandomField
 from queens.utils.logger_settings import log_init_args
+from queens.utils.pool import create_pool
+from queens.utils.random_generator import spawn_random_generators, split_into_chunks
 
 _logger = logging.getLogger(__name__)
 
@@ -57,6 +60,7 @@ class Parameters:
         num_parameters (int): Number of (truncated) parameters.
         random_field_flag (bool): Specifies if random fields are used.
         names (list): Parameter names.
+        fused_prior (FusedPrior): Joint prior evaluating parameters of the same family at once.
     """
 
     @log_init_args
@@ -90,24 +94,45 @@ class Parameters:
         self.num_parameters = joint_parameters_dim
         self.random_field_flag = random_field_flag
         self.names = list(parameters.keys())
+        self.fused_prior = FusedPrior(self.to_list())
 
-    def draw_samples(self, num_samples):
+    def draw_samples(self, num_samples, rng=None):
         """Draw samples from all parameters.
 
         Args:
             num_samples (int): The number of samples to draw for each parameter.
+            rng (np.random.Generator, optional): Random number generator. If not provided, the
+                                                 global random state is used.
 
         Returns:
             samples (np.ndarray): Drawn samples
         """
-        samples = np.zeros((num_samples, self.num_parameters))
-        current_index = 0
-        for parameter in self.to_list():
-            samples[:, current_index : current_index + parameter.dimension] = parameter.draw(
-                num_samples
-            )
-            current_index += parameter.dimension
-        return samples
+        return self.fused_prior.draw_samples(num_samples, rng=rng)
+
+    def draw_samples_from_streams(self, num_samples, seed, num_streams, num_workers=None):
+        """Draw samples chunk-wise from independent random streams.
+
+        The samples are split into *num_streams* consecutive chunks. The *i*-th chunk is drawn
+        from the *i*-th generator spawned from *seed*. Hence, the samples are bit-reproducible
+        independent of the number of workers and each chunk can be redrawn on its own.
+
+        Args:
+            num_samples (int): The number of samples to draw for each parameter.
+            seed (int, np.random.SeedSequence): Root seed of the streams
+            num_streams (int): Number of independent streams (chunks)
+            num_workers (int, optional): Number of processes drawing the chunks in parallel
+
+        Returns:
+            samples (np.ndarray): Drawn samples
+        """
+        chunk_sizes = split_into_chunks(num_samples, num_streams)
+        rngs = spawn_random_generators(seed, num_streams)
+        pool = create_pool(num_workers)
+        if pool is None:
+            chunks = list(map(self.draw_samples, chunk_sizes, rngs))
+        else:
+            chunks = pool.map(self.draw_samples, chunk_sizes, rngs)
+        return np.concatenate(chunks, axis=0)
 
     def joint_logpdf(self, samples):
         """Evaluate the logpdf summed over all parameters.
@@ -121,12 +146,7 @@ class Parameters:
             logpdf (np.ndarray): logpdf summed over all parameters
         """
         samples = samples.reshape(-1, self.num_parameters)
-        logpdf = 0
-        i = 0
-        for parameter in self.to_list():
-            logpdf += parameter.logpdf(samples[:, i : i + parameter.dimension])
-            i += parameter.dimension
-        return logpdf
+        return self.fused_prior.joint_logpdf(samples)
 
     def grad_joint_logpdf(self, samples):
         """Evaluate the gradient of the joint logpdf w.r.t. the samples.
@@ -140,14 +160,7 @@ class Parameters:
             grad_logpdf (np.ndarray): Gradient of the joint logpdf w.r.t. the samples
         """
         samples = samples.reshape(-1, self.num_parameters)
-        grad_logpdf = np.zeros(samples.shape)
-        j = 0
-        for parameter in self.to_list():
-            grad_logpdf[:, j : j + parameter.dimension] = parameter.grad_logpdf(
-                samples[:, j : j + parameter.dimension]
-            )
-            j += parameter.dimension
-        return grad_logpdf
+        return self.fused_prior.grad_joint_logpdf(samples)
 
     def latent_grad(self, upstream_gradient):
         """Gradient of the rvs and rfs w.r.t. latent variables.
@@ -189,30 +202,45 @@ class Parameters:
             transformed_samples (np.ndarray): Transformed samples
         """
         samples = samples.reshape(-1, self.num_parameters)
-        transformed_samples = np.zeros(samples.shape)
-        for i, parameter in enumerate(self.to_list()):
+        for parameter in self.to_list():
             if parameter.dimension != 1:
                 raise ValueError("Only 1D Random variables can be transformed!")
-            transformed_samples[:, i] = parameter.ppf(samples[:, i])
-        return transformed_samples
+        return self.fused_prior.inverse_cdf_transform(samples)
 
     def sample_as_dict(self, sample):
         """Return sample as a dict.
 
         Args:
-            sample (np.ndarray): A single sample
+            sample (np.ndarray, dict): A single sample. If the sample is already a dict (e.g.,
+                                       created by *samples_as_dicts*), it is returned unchanged.
 
         Returns:
             sample_dict (dict): Dictionary containing sample members and the corresponding parameter
             keys
         """
-        sample_dict = {}
+        if isinstance(sample, dict):
+            return sample
         sample = sample.reshape(-1)
         if self.random_field_flag:
             sample = self.expand_random_field_realization(sample)
-        for j, key in enumerate(self.parameters_keys):
-            sample_dict[key] = sample[j]
-        return sample_dict
+        return dict(zip(self.parameters_keys, sample))
+
+    def samples_as_dicts(self, samples):
+        """Return a batch of samples as dicts.
+
+        The random field realizations of all samples are expanded at once.
+
+        Args:
+            samples (np.ndarray): Samples, each row represents a sample
+
+        Returns:
+            sample_dicts (list): Dictionaries containing sample members and the corresponding
+            parameter keys
+        """
+        samples = samples.reshape(-1, self.num_parameters)
+        if self.random_field_flag:
+            samples = self.expand_random_field_realizations(samples)
+        return [dict(zip(self.parameters_keys, sample)) for sample in samples]
 
     def expand_random_field_realization(self, truncated_sample):
         """Expand truncated representation of random fields.
@@ -223,25 +251,40 @@ class Parameters:
         Returns:
             sample_expanded (np.ndarray): Expanded representation of sample
         """
-        sample_expanded = np.zeros(len(self.parameters_keys))
+        return self.expand_random_field_realizations(truncated_sample.reshape(1, -1))[0]
+
+    def expand_random_field_realizations(self, truncated_samples):
+        """Expand truncated representation of random fields for a batch of samples.
+
+        Each random field is expanded with a single matrix product for all samples.
+
+        Args:
+            truncated_samples (np.ndarray): Truncated representation of samples, each row
+                                            represents a sample
+
+        Returns:
+            samples_expanded (np.ndarray): Expanded representation of samples
+        """
+        truncated_samples = truncated_samples.reshape(-1, self.num_parameters)
+        samples_expanded = np.empty((truncated_samples.shape[0], len(self.parameters_keys)))
         index_truncated = 0
         index_expanded = 0
         for parameter in self.to_list():
+            latent_samples = truncated_samples[
+                :, index_truncated : index_truncated + parameter.dimension
+            ]
             if isinstance(parameter, RandomField):
-                sample_expanded[index_expanded : index_expanded + parameter.dim_coords] = (
-                    parameter.expanded_representation(
-                        truncated_sample[index_truncated : index_truncated + parameter.dimension]
-                    )
+                samples_expanded[:, index_expanded : index_expanded + parameter.dim_coords] = (
+                    parameter.expanded_representation(latent_samples)
                 )
                 index_expanded += parameter.dim_coords
-                index_truncated += parameter.dimension
             else:
-                sample_expanded[index_expanded : index_expanded + parameter.dimension] = (
-                    truncated_sample[index_truncated : index_truncated + parameter.dimension]
+                samples_expanded[:, index_expanded : index_expanded + parameter.dimension] = (
+                    latent_samples
                 )
                 index_expanded += parameter.dimension
-                index_truncated += parameter.dimension
-        return sample_expanded
+            index_truncated += parameter.dimension
+        return samples_expanded
 
     def to_list(self):
         """Return parameters as list.
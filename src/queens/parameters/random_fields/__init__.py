@@ -17,6 +17,7 @@
 Modules for random fields.
 """
 
+from queens.parameters.random_fields.circulant_embedding import CirculantEmbedding
 from queens.parameters.random_fields.fourier import Fourier
 from queens.parameters.random_fields.karhunen_loeve import KarhunenLoeve
 from queens.parameters.random_fields.piece_wise import PieceWise
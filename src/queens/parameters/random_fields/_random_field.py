@@ -15,11 +15,18 @@
 """Random fields module."""
 
 import abc
+import hashlib
+import json
+import logging
+import zipfile
 
 import numpy as np
 
+from queens.utils.config_directories import random_field_cache_directory
 from queens.utils.numpy_array import at_least_2d
 
+_logger = logging.getLogger(__name__)
+
 
 class RandomField(metaclass=abc.ABCMeta):
     """RandomField meta class.
@@ -29,14 +36,16 @@ class RandomField(metaclass=abc.ABCMeta):
             coords (np.ndarray): Coordinates at which the random field is evaluated.
             dim_coords (int): Dimension of the random field (number of coordinates)
             distribution (obj): QUEENS distribution object of latent space variables
+            cache_basis (bool): Cache the basis of the field on disk
     """
 
-    def __init__(self, coords):
+    def __init__(self, coords, cache_basis=False):
         """Initialize random field object.
 
         Args:
             coords (dict): Dictionary with coordinates of discretized random field and the
                            corresponding keys
+            cache_basis (bool, opt): Cache the basis of the field on disk
         """
         # ensure that coordinates are an ndarray
         coords["coords"] = np.array(coords["coords"], copy=False)
@@ -50,13 +59,15 @@ class RandomField(metaclass=abc.ABCMeta):
         self.dim_coords = len(coords["keys"])
         self.dimension = None
         self.distribution = None
+        self.cache_basis = cache_basis
 
     @abc.abstractmethod
-    def draw(self, num_samples):
+    def draw(self, num_samples, rng=None):
         """Draw samples of the latent space.
 
         Args:
             num_samples (int): Batch size of samples to draw
+            rng (np.random.Generator, optional): Random number generator
         """
 
     @abc.abstractmethod
@@ -86,3 +97,55 @@ class RandomField(metaclass=abc.ABCMeta):
     def latent_gradient(self, upstream_gradient):
         """Graident of the field with respect to the latent variables."""
         raise NotImplementedError
+
+    def load_or_compute_basis(self, hyperparameters, compute_basis):
+        """Load the basis of the field from the cache or compute and cache it.
+
+        The cache file is identified by the field type, the coordinates and the hyperparameters
+        the basis depends on. It is stored as compressed *.npz* file in the random field cache
+        directory.
+
+        Args:
+            hyperparameters (dict): Hyperparameters the basis depends on
+            compute_basis (function): Function returning the basis as dict of arrays
+
+        Returns:
+            basis (dict): Arrays describing the basis
+        """
+        if not self.cache_basis:
+            return compute_basis()
+
+        cache_file = random_field_cache_directory() / (
+            f"{self.__class__.__name__}_{self._basis_hash(hyperparameters)}.npz"
+        )
+        if cache_file.is_file():
+            try:
+                with np.load(cache_file) as cached_basis:
+                    _logger.info("Loaded random field basis from %s.", cache_file)
+                    return dict(cached_basis)
+            except (OSError, ValueError, zipfile.BadZipFile):
+                _logger.warning("Could not read the cached basis %s. Recomputing it.", cache_file)
+
+        basis = compute_basis()
+        tmp_file = cache_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as file:
+            np.savez_compressed(file, **basis)
+        tmp_file.replace(cache_file)
+        _logger.info("Cached random field basis in %s.", cache_file)
+        return basis
+
+    def _basis_hash(self, hyperparameters):
+        """Hash of the coordinates and the hyperparameters of the field.
+
+        Args:
+            hyperparameters (dict): Hyperparameters the basis depends on
+
+        Returns:
+            str: Hex digest identifying the basis
+        """
+        coords = np.ascontiguousarray(self.coords["coords"], dtype=np.float64)
+        basis_hash = hashlib.sha256()
+        basis_hash.update(str(coords.shape).encode("utf-8"))
+        basis_hash.update(coords.tobytes())
+        basis_hash.update(json.dumps(hyperparameters, sort_keys=True, default=str).encode("utf-8"))
+        return basis_hash.hexdigest()
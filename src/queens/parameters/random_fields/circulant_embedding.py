@@ -0,0 +1,255 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Circulant embedding random fields class."""
+
+import logging
+
+import numpy as np
+from scipy import fft
+
+from queens.distributions.mean_field_normal import MeanFieldNormal
+from queens.parameters.random_fields._random_field import RandomField
+
+_logger = logging.getLogger(__name__)
+
+
+class CirculantEmbedding(RandomField):
+    """Circulant embedding random field class for regular grids.
+
+    The covariance matrix of a stationary field on a regular grid is embedded into a (block)
+    circulant matrix on a periodic grid of at least twice the size. Circulant matrices are
+    diagonalized by the discrete Fourier transform, such that the field is sampled exactly with
+    FFTs in *O(n log n)*:
+
+        field = mean + R C^(1/2) z,    C^(1/2) z = ifft(sqrt(lambda) * fft(z))
+
+    where *z* are the independent standard normal latent variables on the periodic grid, *lambda*
+    the eigenvalues of the circulant matrix and *R* the restriction to the original grid. The
+    dimension of the latent space is therefore the size of the periodic grid.
+
+    Attributes:
+        mean (np.array): Mean at coordinates of random field, can be a single constant
+        std (float): Hyperparameter for standard-deviation of random field
+        corr_length (float): Hyperparameter for the correlation length
+        grid_shape (tuple): Number of grid points in each direction
+        grid_spacing (np.ndarray): Grid spacing in each direction
+        embedding_shape (tuple): Number of grid points of the periodic grid in each direction
+        embedding_index (np.ndarray): Flat index of each coordinate in the periodic grid
+        sqrt_eigenvalues (np.ndarray): Square root of the eigenvalues of the circulant matrix
+                                       (real FFT layout)
+    """
+
+    def __init__(
+        self,
+        coords,
+        mean=0.0,
+        std=1.0,
+        corr_length=0.3,
+        max_padding_steps=6,
+        eigenvalue_tolerance=1e-10,
+    ):
+        """Initialize circulant embedding object.
+
+        Args:
+            coords (dict): Dictionary with coordinates of discretized random field and the
+                           corresponding keys. The coordinates have to form a regular grid (in
+                           arbitrary order).
+            mean (np.array): Mean at coordinates of random field, can be a single constant
+            std (float): Hyperparameter for standard-deviation of random field
+            corr_length (float): Hyperparameter for the correlation length
+            max_padding_steps (int, opt): Maximum number of times the periodic grid is doubled in
+                                          size if the embedding is not positive semi-definite
+            eigenvalue_tolerance (float, opt): Negative eigenvalues with a magnitude below this
+                                               tolerance (relative to the largest eigenvalue) are
+                                               considered round-off errors and set to zero
+        """
+        super().__init__(coords)
+        self.mean = mean
+        self.std = std
+        self.corr_length = corr_length
+
+        grid_index, self.grid_shape, self.grid_spacing = self.grid_indices(self.coords["coords"])
+
+        embedding_shape = tuple(
+            fft.next_fast_len(2 * (num_points - 1)) if num_points > 1 else 1
+            for num_points in self.grid_shape
+        )
+        for padding_step in range(max_padding_steps + 1):
+            eigenvalues = self.embedding_eigenvalues(embedding_shape)
+            min_eigenvalue = eigenvalues.min() / eigenvalues.max()
+            if min_eigenvalue >= -eigenvalue_tolerance or padding_step == max_padding_steps:
+                break
+            embedding_shape = tuple(
+                fft.next_fast_len(2 * num_points) if num_points > 1 else 1
+                for num_points in embedding_shape
+            )
+
+        if min_eigenvalue < -eigenvalue_tolerance:
+            _logger.warning(
+                "The circulant embedding is not positive semi-definite. Negative eigenvalues up "
+                "to %e (relative to the largest eigenvalue) are set to zero, the covariance of "
+                "the field is approximated.",
+                -min_eigenvalue,
+            )
+
+        self.embedding_shape = embedding_shape
+        self.embedding_index = np.ravel_multi_index(grid_index.T, self.embedding_shape)
+        self.sqrt_eigenvalues = np.sqrt(np.clip(eigenvalues, 0, None))
+        self.dimension = int(np.prod(self.embedding_shape))
+
+        self.distribution = MeanFieldNormal(mean=0, variance=1, dimension=self.dimension)
+
+    @staticmethod
+    def grid_indices(coordinates):
+        """Compute the indices of the coordinates in the regular grid.
+
+        Args:
+            coordinates (np.ndarray): Coordinates of the random field
+
+        Returns:
+            grid_index (np.ndarray): Multi-index of each coordinate in the grid
+            grid_shape (tuple): Number of grid points in each direction
+            grid_spacing (np.ndarray): Grid spacing in each direction
+        """
+        lower_bound = coordinates.min(axis=0)
+        extent = coordinates.max(axis=0) - lower_bound
+        tolerance = 1e-8 * np.maximum(extent, 1.0)
+
+        grid_index = np.empty(coordinates.shape, dtype=int)
+        grid_shape = []
+        grid_spacing = np.ones(coordinates.shape[1])
+        for direction in range(coordinates.shape[1]):
+            values = coordinates[:, direction] - lower_bound[direction]
+            num_points = 1 + np.count_nonzero(np.diff(np.unique(values)) > tolerance[direction])
+            if num_points > 1:
+                grid_spacing[direction] = extent[direction] / (num_points - 1)
+            index = np.rint(values / grid_spacing[direction])
+            if np.any(np.abs(index * grid_spacing[direction] - values) > tolerance[direction]):
+                raise ValueError(
+                    "The coordinates of the circulant embedding random field do not lie on a "
+                    f"regular grid (direction {direction})."
+                )
+            grid_index[:, direction] = index
+            grid_shape.append(num_points)
+
+        grid_shape = tuple(grid_shape)
+        if np.prod(grid_shape) != len(coordinates) or len(
+            np.unique(np.ravel_multi_index(grid_index.T, grid_shape))
+        ) != len(coordinates):
+            raise ValueError(
+                "The coordinates of the circulant embedding random field do not form a complete "
+                f"regular grid of shape {grid_shape}."
+            )
+        return grid_index, grid_shape, grid_spacing
+
+    def embedding_eigenvalues(self, embedding_shape):
+        """Eigenvalues of the circulant embedding of the covariance matrix.
+
+        Args:
+            embedding_shape (tuple): Number of grid points of the periodic grid in each direction
+
+        Returns:
+            eigenvalues (np.ndarray): Eigenvalues of the circulant matrix (real FFT layout)
+        """
+        squared_distance = 0
+        for direction, num_points in enumerate(embedding_shape):
+            steps = np.arange(num_points)
+            periodic_distance = np.minimum(steps, num_points - steps) * self.grid_spacing[direction]
+            shape = [1] * len(embedding_shape)
+            shape[direction] = num_points
+            squared_distance = squared_distance + periodic_distance.reshape(shape) ** 2
+
+        # assume squared exponential kernel
+        covariance = (self.std**2) * np.exp(-squared_distance / (2 * self.corr_length**2))
+        # the first row of a symmetric circulant matrix has a real spectrum
+        return fft.rfftn(covariance).real
+
+    def _apply_sqrt_covariance(self, samples):
+        """Multiply samples on the periodic grid with the square root of the circulant matrix.
+
+        Args:
+            samples (np.ndarray): Samples on the periodic grid, each row represents a sample
+
+        Returns:
+            np.ndarray: Product with the (symmetric) square root of the circulant matrix
+        """
+        axes = tuple(range(1, len(self.embedding_shape) + 1))
+        samples = samples.reshape(-1, *self.embedding_shape)
+        samples_transformed = fft.rfftn(samples, axes=axes) * self.sqrt_eigenvalues
+        return fft.irfftn(samples_transformed, s=self.embedding_shape, axes=axes).reshape(
+            -1, self.dimension
+        )
+
+    def draw(self, num_samples, rng=None):
+        """Draw samples from the latent representation of the random field.
+
+        Args:
+            num_samples: Number of draws of latent random samples
+            rng (np.random.Generator, optional): Random number generator
+        Returns:
+            samples (np.ndarray): Drawn samples
+        """
+        return self.distribution.draw(num_samples, rng=rng)
+
+    def logpdf(self, samples):
+        """Get joint logpdf of latent space.
+
+        Args:
+            samples (np.array): Samples for evaluating the logpdf
+
+        Returns:
+            logpdf (np.array): Logpdf of the samples
+        """
+        return self.distribution.logpdf(samples)
+
+    def grad_logpdf(self, samples):
+        """Get gradient of joint logpdf of latent space.
+
+        Args:
+            samples (np.array): Samples for evaluating the gradient of the logpdf
+
+        Returns:
+            gradient (np.array): Gradient of the logpdf
+        """
+        return self.distribution.grad_logpdf(samples)
+
+    def expanded_representation(self, samples):
+        """Expand latent representation of samples.
+
+        Args:
+            samples (np.ndarray): Latent representation of samples
+
+        Returns:
+            samples_expanded (np.ndarray): Expanded representation of samples
+        """
+        samples_expanded = self.mean + self._apply_sqrt_covariance(samples)[:, self.embedding_index]
+        return samples_expanded
+
+    def latent_gradient(self, upstream_gradient):
+        """Gradient of the field with respect to the latent parameters.
+
+        Args:
+            upstream_gradient (np.ndarray): Gradient with respect to all coords of the field
+
+        Returns:
+            latent_grad (np.ndarray): Gradient of the field with respect to the latent
+            parameters
+        """
+        upstream_gradient = np.atleast_2d(upstream_gradient)
+        padded_gradient = np.zeros((upstream_gradient.shape[0], self.dimension))
+        padded_gradient[:, self.embedding_index] = upstream_gradient
+        # the square root of the circulant matrix is symmetric
+        latent_grad = self._apply_sqrt_covariance(padded_gradient)
+        return latent_grad
@@ -53,6 +53,9 @@ class Fourier(RandomField):
         corr_length=0.3,
         variability=0.98,
         trunc_threshold=64,
+        chunk_size=None,
+        basis_file=None,
+        cache_basis=False,
     ):
         """Initialize Fourier object.
 
@@ -64,8 +67,17 @@ class Fourier(RandomField):
             corr_length (float): Hyperparameter for the correlation length
             variability (float): Explained variance of by the eigen
             trunc_threshold (int): Truncation threshold for Fourier series.
+            chunk_size (int, opt): Number of coordinates for which the basis is assembled at once.
+                                   Defaults to a chunk size with bounded memory.
+            basis_file (Path, str, opt): If provided, the basis is written to this memory-mapped
+                                         *.npy* file instead of being held in memory
+            cache_basis (bool, opt): Cache the basis on disk. If the coordinates and
+                                     hyperparameters did not change, it is loaded instead of
+                                     recomputed. The cache is not bounded in size and has to be
+                                     cleaned up manually. Not used in combination with
+                                     *basis_file*.
         """
-        super().__init__(coords)
+        super().__init__(coords, cache_basis=cache_basis and basis_file is None)
         self.mean = mean
         self.std = std
         self.corr_length = corr_length
@@ -109,26 +121,37 @@ class Fourier(RandomField):
             self.number_expansion_terms, self.corr_length, self.convex_hull_size
         )
         self.check_convergence()
-        self.basis = dimension_methods_class.calculate_basis(
-            self.coordinates,
-            self.basis_dimension,
-            self.number_expansion_terms,
-            self.convex_hull_size,
-            self.covariance,
-            self.latent_index,
-        )
+
+        def compute_basis():
+            basis = dimension_methods_class.calculate_basis(
+                self.coordinates,
+                self.basis_dimension,
+                self.number_expansion_terms,
+                self.convex_hull_size,
+                self.covariance,
+                self.latent_index,
+                chunk_size=chunk_size,
+                basis_file=basis_file,
+            )
+            return {"basis": basis}
+
+        self.basis = self.load_or_compute_basis(
+            {"corr_length": self.corr_length, "trunc_threshold": self.trunc_threshold},
+            compute_basis,
+        )["basis"]
 
         self.distribution = MeanFieldNormal(mean=0, variance=1, dimension=self.dimension)
 
-    def draw(self, num_samples):
+    def draw(self, num_samples, rng=None):
         """Draw samples from the latent representation of the random field.
 
         Args:
             num_samples: Number of draws of latent random samples
+            rng (np.random.Generator, optional): Random number generator
         Returns:
             samples (np.ndarray): Drawn samples
         """
-        return self.distribution.draw(num_samples)
+        return self.distribution.draw(num_samples, rng=rng)
 
     def logpdf(self, samples):
         """Get joint logpdf of latent space.
@@ -245,7 +268,14 @@ class DimensionMethods1D:
 
     @staticmethod
     def calculate_basis(
-        coordinates, basis_dimension, number_expansion_terms, convex_hull_size, covariance, index
+        coordinates,
+        basis_dimension,
+        number_expansion_terms,
+        convex_hull_size,
+        covariance,
+        index,
+        chunk_size=None,
+        basis_file=None,
     ):
         """Calculate the fourier basis.
 
@@ -257,23 +287,23 @@ class DimensionMethods1D:
             covariance (np.array): Transform of covariance matrix
             index (np.array): Array indexing valid basis terms in accordance to the truncation
                               threshold
+            chunk_size (int, opt): Number of coordinates for which the basis is assembled at once
+            basis_file (Path, str, opt): Path to a memory-mapped *.npy* file for the basis
 
         Returns:
             basis (np.array): Transformed and truncated fourier basis
         """
-        basis = np.zeros(shape=(coordinates.shape[0], basis_dimension))
-        k = (
-            np.linspace(0, number_expansion_terms - 1, number_expansion_terms)
-            * np.pi
-            / convex_hull_size
+        return calculate_truncated_basis(
+            coordinates,
+            basis_dimension,
+            number_expansion_terms,
+            convex_hull_size,
+            covariance,
+            index,
+            TRIGONOMETRIC_TERMS_1D,
+            chunk_size=chunk_size,
+            basis_file=basis_file,
         )
-        arguements = np.outer(coordinates, k)
-        cos_terms = np.multiply(np.cos(arguements), covariance)
-        sin_terms = np.multiply(np.sin(arguements), covariance)
-
-        basis[:, 0::2] = cos_terms
-        basis[:, 1::2] = sin_terms
-        return basis[:, index]
 
 
 class DimensionMethods2D:
@@ -339,7 +369,14 @@ class DimensionMethods2D:
 
     @staticmethod
     def calculate_basis(
-        coordinates, basis_dimension, number_expansion_terms, convex_hull_size, covariance, index
+        coordinates,
+        basis_dimension,
+        number_expansion_terms,
+        convex_hull_size,
+        covariance,
+        index,
+        chunk_size=None,
+        basis_file=None,
     ):
         """Calculate the fourier basis.
 
@@ -351,42 +388,23 @@ class DimensionMethods2D:
             covariance (np.array): Transform of covariance matrix
             index (np.array): Array indexing valid basis terms in accordance to the truncation
                               threshold
+            chunk_size (int, opt): Number of coordinates for which the basis is assembled at once
+            basis_file (Path, str, opt): Path to a memory-mapped *.npy* file for the basis
 
         Returns:
             basis (np.array): Transformed and truncated fourier basis
         """
-        basis = np.zeros(shape=(coordinates.shape[0], basis_dimension))
-        k = (
-            np.linspace(0, number_expansion_terms - 1, number_expansion_terms)
-            * np.pi
-            / convex_hull_size
+        return calculate_truncated_basis(
+            coordinates,
+            basis_dimension,
+            number_expansion_terms,
+            convex_hull_size,
+            covariance,
+            index,
+            TRIGONOMETRIC_TERMS_2D,
+            chunk_size=chunk_size,
+            basis_file=basis_file,
         )
-        arguements = [np.outer(coordinates[:, 0], k), np.outer(coordinates[:, 1], k)]
-
-        cosine_x0 = np.cos(arguements[0])
-        cosine_x1 = np.cos(arguements[1])
-        sin_x0 = np.sin(arguements[0])
-        sin_x1 = np.sin(arguements[1])
-
-        terms = np.zeros(shape=(4, len(coordinates), len(covariance)))
-        for i in range(len(coordinates)):
-            terms[:, i, :] = np.array(
-                [
-                    np.kron(cosine_x0[i, :], cosine_x1[i, :]),
-                    np.kron(sin_x0[i, :], sin_x1[i, :]),
-                    np.kron(cosine_x0[i, :], sin_x1[i, :]),
-                    np.kron(sin_x0[i, :], cosine_x1[i, :]),
-                ]
-            )
-
-        terms = np.multiply(terms, covariance)
-
-        basis[:, 0::4] = terms[0]
-        basis[:, 1::4] = terms[1]
-        basis[:, 2::4] = terms[2]
-        basis[:, 3::4] = terms[3]
-
-        return basis[:, index]
 
 
 class DimensionMethods3D:
@@ -456,7 +474,14 @@ class DimensionMethods3D:
 
     @staticmethod
     def calculate_basis(
-        coordinates, basis_dimension, number_expansion_terms, convex_hull_size, covariance, index
+        coordinates,
+        basis_dimension,
+        number_expansion_terms,
+        convex_hull_size,
+        covariance,
+        index,
+        chunk_size=None,
+        basis_file=None,
     ):
         """Calculate the fourier basis.
 
@@ -468,78 +493,104 @@ class DimensionMethods3D:
             covariance (np.array): Transform of covariance matrix
             index (np.array): Array indexing valid basis terms in accordance to the truncation
                               threshold
+            chunk_size (int, opt): Number of coordinates for which the basis is assembled at once
+            basis_file (Path, str, opt): Path to a memory-mapped *.npy* file for the basis
 
         Returns:
             basis (np.array): Transformed and truncated fourier basis
         """
-        basis = np.zeros(shape=(coordinates.shape[0], basis_dimension))
-        k = (
-            np.linspace(0, number_expansion_terms - 1, number_expansion_terms)
-            * np.pi
-            / convex_hull_size
+        return calculate_truncated_basis(
+            coordinates,
+            basis_dimension,
+            number_expansion_terms,
+            convex_hull_size,
+            covariance,
+            index,
+            TRIGONOMETRIC_TERMS_3D,
+            chunk_size=chunk_size,
+            basis_file=basis_file,
         )
 
-        arguements = [
-            np.outer(coordinates[:, 0], k),
-            np.outer(coordinates[:, 1], k),
-            np.outer(coordinates[:, 2], k),
-        ]
-
-        cosine_x0 = np.cos(arguements[0])
-        cosine_x1 = np.cos(arguements[1])
-        cosine_x2 = np.cos(arguements[2])
-        sin_x0 = np.sin(arguements[0])
-        sin_x1 = np.sin(arguements[1])
-        sin_x2 = np.sin(arguements[2])
-
-        terms = np.zeros(shape=(8, len(coordinates), len(covariance)))
-        for i in range(len(coordinates)):
-            terms[:, i, :] = np.array(
-                [
-                    np.kron(
-                        np.kron(cosine_x0[i, :], cosine_x1[i, :]),
-                        cosine_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(sin_x0[i, :], sin_x1[i, :]),
-                        cosine_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(cosine_x0[i, :], sin_x1[i, :]),
-                        cosine_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(sin_x0[i, :], cosine_x1[i, :]),
-                        cosine_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(cosine_x0[i, :], cosine_x1[i, :]),
-                        sin_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(sin_x0[i, :], sin_x1[i, :]),
-                        sin_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(cosine_x0[i, :], sin_x1[i, :]),
-                        sin_x2[i, :],
-                    ),
-                    np.kron(
-                        np.kron(sin_x0[i, :], cosine_x1[i, :]),
-                        sin_x2[i, :],
-                    ),
-                ]
-            )
 
-        terms = np.multiply(terms, covariance)
+# Order of the cosine (False) and sine (True) factors per coordinate direction of the basis terms
+# belonging to one frequency tuple
+TRIGONOMETRIC_TERMS_1D = ((False,), (True,))
+TRIGONOMETRIC_TERMS_2D = ((False, False), (True, True), (False, True), (True, False))
+TRIGONOMETRIC_TERMS_3D = tuple(terms + (False,) for terms in TRIGONOMETRIC_TERMS_2D) + tuple(
+    terms + (True,) for terms in TRIGONOMETRIC_TERMS_2D
+)
+
+# Maximum number of basis entries assembled at once (128 MB in double precision)
+MAX_CHUNK_ENTRIES = 2**24
+
+
+def calculate_truncated_basis(
+    coordinates,
+    basis_dimension,
+    number_expansion_terms,
+    convex_hull_size,
+    covariance,
+    index,
+    trigonometric_terms,
+    chunk_size=None,
+    basis_file=None,
+):
+    """Assemble the truncated fourier basis chunk-wise.
+
+    Only the basis terms selected by the truncation *index* are computed. Each term is the product
+    of one cosine or sine factor per coordinate direction, evaluated for all coordinates of a chunk
+    at once, so that the memory is bounded by the chunk size and not by the number of coordinates.
+
+    Args:
+        coordinates (np.array): Coordinates of the field
+        basis_dimension (int): Dimension of the complete Fourier basis (not the latent space)
+        number_expansion_terms (int): Number of frequencies
+        convex_hull_size  (float): Maximum length on the mesh
+        covariance (np.array): Transform of covariance matrix
+        index (np.array): Array indexing valid basis terms in accordance to the truncation
+                          threshold
+        trigonometric_terms (tuple): Cosine (False) and sine (True) factors per direction of the
+                                     basis terms of one frequency tuple
+        chunk_size (int, opt): Number of coordinates for which the basis is assembled at once
+        basis_file (Path, str, opt): Path to a memory-mapped *.npy* file for the basis
+
+    Returns:
+        basis (np.array): Transformed and truncated fourier basis
+    """
+    coordinates = coordinates.reshape(coordinates.shape[0], -1)
+    num_coords, field_dimension = coordinates.shape
+    num_terms = len(trigonometric_terms)
+
+    # frequency tuples which are not truncated
+    frequency_index = np.flatnonzero(np.asarray(index).reshape(-1, num_terms)[:, 0])
+    frequencies = np.unravel_index(frequency_index, (number_expansion_terms,) * field_dimension)
+    weights = covariance[frequency_index]
+    dimension = num_terms * len(frequency_index)
+    if num_terms * len(covariance) != basis_dimension:
+        raise ValueError("Basis dimension does not match the number of frequencies.")
+
+    if basis_file is None:
+        basis = np.empty((num_coords, dimension))
+    else:
+        basis = np.lib.format.open_memmap(
+            basis_file, mode="w+", dtype=np.float64, shape=(num_coords, dimension)
+        )
+
+    if chunk_size is None:
+        chunk_size = max(1, MAX_CHUNK_ENTRIES // max(1, dimension))
+
+    wave_numbers = np.arange(number_expansion_terms) * np.pi / convex_hull_size
+    for start in range(0, num_coords, chunk_size):
+        chunk = coordinates[start : start + chunk_size]
+        arguments = chunk[:, :, np.newaxis] * wave_numbers
+        trigonometric_factors = (np.cos(arguments), np.sin(arguments))
 
-        basis[:, 0::8] = terms[0]
-        basis[:, 1::8] = terms[1]
-        basis[:, 2::8] = terms[2]
-        basis[:, 3::8] = terms[3]
-        basis[:, 4::8] = terms[4]
-        basis[:, 5::8] = terms[5]
-        basis[:, 6::8] = terms[6]
-        basis[:, 7::8] = terms[7]
+        for term, sine_flags in enumerate(trigonometric_terms):
+            chunk_term = np.tile(weights, (len(chunk), 1))
+            for direction, sine_flag in enumerate(sine_flags):
+                chunk_term *= trigonometric_factors[sine_flag][:, direction, frequencies[direction]]
+            basis[start : start + chunk_size, term::num_terms] = chunk_term
 
-        return basis[:, index]
+    if basis_file is not None:
+        basis.flush()
+    return basis
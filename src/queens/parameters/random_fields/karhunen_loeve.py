@@ -17,10 +17,14 @@
 import logging
 
 import numpy as np
+import scipy.sparse
+from scipy.sparse.linalg import eigsh
+from scipy.spatial import KDTree
 from scipy.spatial.distance import pdist, squareform
 
 from queens.distributions.mean_field_normal import MeanFieldNormal
 from queens.parameters.random_fields._random_field import RandomField
+from queens.utils.valid_options import check_if_valid_options
 
 _logger = logging.getLogger(__name__)
 
@@ -35,8 +39,10 @@ class KarhunenLoeve(RandomField):
             std (float): Hyperparameter for standard-deviation of random field
             corr_length (float): Hyperparameter for the correlation length
             cut_off (float): Lower value limit of covariance matrix entries
+            eigensolver (str): Eigensolver backend, *dense* or *sparse*
             mean (np.array): Mean at coordinates of random field, can be a single constant
-            cov_matrix (np.array): Covariance matrix to compute eigendecomposition on
+            cov_matrix (np.array, scipy.sparse.csr_matrix): Covariance matrix to compute
+                                                             eigendecomposition on
             eigenbasis (np.array): Eigenvectors of covariance matrix, weighted by the eigenvalues
             eigenvalues (np.array): Eigenvalues of covariance matrix
             eigenvectors (np.array): Eigenvectors of covariance matrix
@@ -52,6 +58,8 @@ class KarhunenLoeve(RandomField):
         explained_variance=None,
         latent_dimension=None,
         cut_off=0.0,
+        eigensolver="dense",
+        cache_basis=False,
     ):
         """Initialize KL object.
 
@@ -65,13 +73,30 @@ class KarhunenLoeve(RandomField):
             latent_dimension (int): Dimension of the latent space,
                                     mutually exclusive argument with explained_variance
             cut_off (float): Lower value limit of covariance matrix entries
+            eigensolver (str): Eigensolver backend. *dense* computes the full eigendecomposition
+                               of the dense covariance matrix. *sparse* assembles a sparse
+                               covariance matrix from all node pairs with a covariance above
+                               *cut_off* (KD-tree neighbour search) and computes only the
+                               leading modes iteratively.
+            cache_basis (bool, opt): Cache the truncated eigendecomposition on disk. If the
+                                     coordinates and hyperparameters did not change, it is loaded
+                                     instead of recomputed (in this case *cov_matrix* is not set).
+                                     The cache is not bounded in size and has to be cleaned up
+                                     manually.
         """
-        super().__init__(coords)
+        super().__init__(coords, cache_basis=cache_basis)
+        check_if_valid_options(["dense", "sparse"], eigensolver)
+        if eigensolver == "sparse" and not 0 < cut_off < std**2:
+            raise ValueError(
+                "The sparse eigensolver requires a cut_off in the range (0, std**2) to sparsify "
+                f"the covariance matrix, but cut_off={cut_off} was provided."
+            )
         self.nugget_variance = 1e-9
         self.explained_variance = explained_variance
         self.std = std
         self.corr_length = corr_length
         self.cut_off = cut_off
+        self.eigensolver = eigensolver
         self.mean = mean
         self.cov_matrix = None
         self.eigenbasis = None
@@ -88,20 +113,36 @@ class KarhunenLoeve(RandomField):
         else:
             self.dimension = None
 
-        self.calculate_covariance_matrix()
-        self.eigendecomp_cov_matrix()
+        basis = self.load_or_compute_basis(
+            {
+                "std": self.std,
+                "corr_length": self.corr_length,
+                "cut_off": self.cut_off,
+                "nugget_variance": self.nugget_variance,
+                "explained_variance": explained_variance,
+                "latent_dimension": latent_dimension,
+                "eigensolver": self.eigensolver,
+            },
+            self._compute_basis,
+        )
+        self.eigenvalues = basis["eigenvalues"]
+        self.eigenvectors = basis["eigenvectors"]
+        self.dimension = int(basis["dimension"])
+        self.explained_variance = float(basis["explained_variance"])
+        self.eigenbasis = self.eigenvectors * np.sqrt(self.eigenvalues)
 
         self.distribution = MeanFieldNormal(mean=0, variance=1, dimension=self.dimension)
 
-    def draw(self, num_samples):
+    def draw(self, num_samples, rng=None):
         """Draw samples from the latent representation of the random field.
 
         Args:
             num_samples: Number of draws of latent random samples
+            rng (np.random.Generator, optional): Random number generator
         Returns:
             samples (np.ndarray): Drawn samples
         """
-        return self.distribution.draw(num_samples)
+        return self.distribution.draw(num_samples, rng=rng)
 
     def logpdf(self, samples):
         """Get joint logpdf of latent space.
@@ -150,31 +191,84 @@ class KarhunenLoeve(RandomField):
         latent_grad = np.matmul(upstream_gradient, self.eigenbasis)
         return latent_grad
 
+    def _compute_basis(self):
+        """Compute the truncated eigendecomposition of the covariance matrix.
+
+        Returns:
+            basis (dict): Eigenvalues, eigenvectors, latent dimension and explained variance
+        """
+        self.calculate_covariance_matrix()
+        self.eigendecomp_cov_matrix()
+        return {
+            "eigenvalues": self.eigenvalues,
+            "eigenvectors": self.eigenvectors,
+            "dimension": self.dimension,
+            "explained_variance": self.explained_variance,
+        }
+
     def calculate_covariance_matrix(self):
         """Calculate discretized covariance matrix.
 
         Based on the kernel description of the random field, build its
         covariance matrix using the external geometry and coordinates.
         """
+        if self.eigensolver == "sparse":
+            self.cov_matrix = self._sparse_covariance_matrix()
+            return
+
         # assume squared exponential kernel
         distance = squareform(pdist(self.coords["coords"], "sqeuclidean"))
         covariance = (self.std**2) * np.exp(-distance / (2 * self.corr_length**2))
         covariance[covariance < self.cut_off] = 0
         self.cov_matrix = covariance + self.nugget_variance * np.eye(self.dim_coords)
 
+    def _sparse_covariance_matrix(self):
+        """Assemble the sparse covariance matrix.
+
+        Only node pairs within the distance at which the squared exponential kernel drops to
+        *cut_off* are found by a KD-tree neighbour search and stored.
+
+        Returns:
+            cov_matrix (scipy.sparse.csr_matrix): Sparse covariance matrix
+        """
+        radius = self.corr_length * np.sqrt(-2 * np.log(self.cut_off / self.std**2))
+        coords = self.coords["coords"]
+        pairs = KDTree(coords).query_pairs(radius, output_type="ndarray")
+        squared_distance = np.sum((coords[pairs[:, 0]] - coords[pairs[:, 1]]) ** 2, axis=1)
+        covariance = (self.std**2) * np.exp(-squared_distance / (2 * self.corr_length**2))
+
+        rows = np.concatenate([pairs[:, 0], pairs[:, 1], np.arange(self.dim_coords)])
+        cols = np.concatenate([pairs[:, 1], pairs[:, 0], np.arange(self.dim_coords)])
+        values = np.concatenate(
+            [
+                covariance,
+                covariance,
+                np.full(self.dim_coords, self.std**2 + self.nugget_variance),
+            ]
+        )
+        return scipy.sparse.csr_matrix(
+            (values, (rows, cols)), shape=(self.dim_coords, self.dim_coords)
+        )
+
     def eigendecomp_cov_matrix(self):
         """Decompose and then truncate the random field.
 
         According to desired variance fraction that should be
         covered/explained by the truncation.
         """
-        # compute eigendecomposition
-        eig_val, eig_vec = np.linalg.eigh(self.cov_matrix)
-        eigenvalues = np.flip(eig_val)
-        eigenvectors = np.flip(eig_vec, axis=1)
+        if self.eigensolver == "sparse":
+            eigenvalues, eigenvectors = self._leading_eigenpairs()
+            # only the leading eigenvalues are known, the total variance is the trace
+            total_variance = np.sum(self.cov_matrix.diagonal())
+        else:
+            # compute eigendecomposition
+            eig_val, eig_vec = np.linalg.eigh(self.cov_matrix)
+            eigenvalues = np.flip(eig_val)
+            eigenvectors = np.flip(eig_vec, axis=1)
+            total_variance = np.sum(eigenvalues)
 
         if self.dimension is None:
-            eigenvalues_normed = eigenvalues / np.sum(eigenvalues)
+            eigenvalues_normed = eigenvalues / total_variance
             dimension = (np.cumsum(eigenvalues_normed) < self.explained_variance).argmin() + 1
             if dimension == 1 and eigenvalues_normed[0] <= self.explained_variance:
                 raise ValueError("Expansion failed.")
@@ -186,8 +280,38 @@ class KarhunenLoeve(RandomField):
         self.eigenvectors = eigenvectors[:, : self.dimension]
 
         if self.explained_variance is None:
-            self.explained_variance = np.sum(self.eigenvalues) / np.sum(eigenvalues)
+            self.explained_variance = np.sum(self.eigenvalues) / total_variance
             _logger.info("Explained variance is %f", self.explained_variance)
 
         # weight the eigenbasis with the eigenvalues
         self.eigenbasis = self.eigenvectors * np.sqrt(self.eigenvalues)
+
+    def _leading_eigenpairs(self):
+        """Compute the leading eigenpairs of the sparse covariance matrix iteratively.
+
+        If the latent dimension is not fixed, the number of computed modes is doubled until the
+        desired explained variance is reached.
+
+        Returns:
+            eigenvalues (np.ndarray): Leading eigenvalues in descending order
+            eigenvectors (np.ndarray): Corresponding eigenvectors
+        """
+        max_num_modes = self.dim_coords - 1
+        total_variance = np.sum(self.cov_matrix.diagonal())
+        num_modes = min(self.dimension or 16, max_num_modes)
+        while True:
+            eig_val, eig_vec = eigsh(self.cov_matrix, k=num_modes, which="LA")
+            order = np.argsort(eig_val)[::-1]
+            eigenvalues, eigenvectors = eig_val[order], eig_vec[:, order]
+            explained_variance = np.sum(eigenvalues) / total_variance
+            if (
+                self.dimension is not None
+                or explained_variance >= self.explained_variance
+                or num_modes == max_num_modes
+            ):
+                break
+            num_modes = min(2 * num_modes, max_num_modes)
+
+        if self.dimension is None and explained_variance < self.explained_variance:
+            raise ValueError("Expansion failed.")
+        return eigenvalues, eigenvectors
@@ -46,15 +46,16 @@ class PieceWise(RandomField):
         self.distribution = deepcopy(latent_1d_distribution)
         self.distribution.dimension = self.dimension
 
-    def draw(self, num_samples):
+    def draw(self, num_samples, rng=None):
         """Draw samples from the latent representation of the random field.
 
         Args:
             num_samples: Number of draws of latent random samples
+            rng (np.random.Generator, optional): Random number generator
         Returns:
             samples (np.ndarray): Drawn samples
         """
-        samples = self.latent_1d_distribution.draw(num_samples * self.dimension).reshape(
+        samples = self.latent_1d_distribution.draw(num_samples * self.dimension, rng=rng).reshape(
             num_samples, self.dimension
         )
         return samples
@@ -83,6 +83,46 @@ class Dask(Scheduler):
         Returns:
             result_dict (dict): Dictionary containing results
         """
+        return self.evaluate_batches([(samples, driver, job_ids)])[0]
+
+    def evaluate_batches(self, batches):
+        """Submit the jobs of several batches at once.
+
+        All jobs are submitted to the cluster before waiting for any result, such that the batches
+        are processed concurrently.
+
+        Args:
+            batches (list): Tuples of samples, driver and job IDs (or None) of each batch
+
+        Returns:
+            list: Result dictionaries of the batches
+        """
+        batch_futures = []
+        all_job_ids = []
+        for samples, driver, job_ids in batches:
+            if job_ids is None:
+                job_ids = self.get_job_ids(len(samples))
+            batch_futures.append(self._submit(samples, driver, job_ids))
+            all_job_ids.extend(job_ids)
+
+        futures = [future for futures in batch_futures for future in futures]
+        results = self._collect(futures, all_job_ids)
+        return [
+            self._results_to_output([results[future.key] for future in futures])
+            for futures in batch_futures
+        ]
+
+    def _submit(self, samples, driver, job_ids):
+        """Submit the jobs of a batch to the cluster.
+
+        Args:
+            samples (np.array): Array of samples
+            driver (Driver): Driver object that runs simulation
+            job_ids (lst): List of job IDs corresponding to samples
+
+        Returns:
+            list: Futures of the jobs
+        """
         if self.restart_workers:
             # This is necessary, because the subprocess in the driver does not get killed
             # sometimes when the worker is restarted.
@@ -93,9 +133,8 @@ class Dask(Scheduler):
         else:
             run_driver = driver.run
 
-        if job_ids is None:
-            job_ids = self.get_job_ids(len(samples))
-        futures = self.client.map(
+        samples = self.expand_samples(samples, driver)
+        return self.client.map(
             run_driver,
             samples,
             job_ids,
@@ -105,8 +144,18 @@ class Dask(Scheduler):
             experiment_name=self.experiment_name,
         )
 
+    def _collect(self, futures, job_ids):
+        """Wait for the jobs to finish.
+
+        Args:
+            futures (list): Futures of the jobs
+            job_ids (lst): List of job IDs of the futures
+
+        Returns:
+            results (dict): Results of the jobs by future key
+        """
         # The theoretical number of sequential jobs
-        num_sequential_jobs = int(np.ceil(len(samples) / self.num_jobs))
+        num_sequential_jobs = int(np.ceil(len(futures) / self.num_jobs))
 
         results = {future.key: None for future in futures}
         with tqdm.tqdm(total=len(futures)) as progressbar:
@@ -122,7 +171,7 @@ class Dask(Scheduler):
                 averaged_time_per_job = elapsed_time / num_sequential_jobs
 
                 run_time_dict = {
-                    "number of jobs": len(samples),
+                    "number of jobs": len(futures),
                     "number of parallel jobs": self.num_jobs,
                     "number of procs": self.num_procs,
                     "total elapsed time": f"{elapsed_time:.3e}s",
@@ -133,9 +182,20 @@ class Dask(Scheduler):
                         f"Batch summary for jobs {min(job_ids)} - {max(job_ids)}", run_time_dict
                     )
                 )
+        return results
 
+    @staticmethod
+    def _results_to_output(results):
+        """Collect the results of the jobs of a batch.
+
+        Args:
+            results (list): Results of the jobs
+
+        Returns:
+            result_dict (dict): Dictionary containing results
+        """
         result_dict = {"result": [], "gradient": []}
-        for result in results.values():
+        for result in results:
             # We should remove this squeeze! It is only introduced for consistency with old test.
             result_dict["result"].append(np.atleast_1d(np.array(result[0]).squeeze()))
             result_dict["gradient"].append(result[1])
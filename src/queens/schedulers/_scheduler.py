@@ -63,6 +63,39 @@ class Scheduler(metaclass=abc.ABCMeta):
             result_dict (dict): Dictionary containing results
         """
 
+    def evaluate_batches(self, batches):
+        """Submit the jobs of several batches, e.g., of different drivers.
+
+        Schedulers that can run jobs concurrently submit all jobs of all batches at once, such that
+        no batch has to wait for the previous one. By default, the batches are evaluated one after
+        another.
+
+        Args:
+            batches (list): Tuples of samples, driver and job IDs (or None) of each batch
+
+        Returns:
+            list: Result dictionaries of the batches
+        """
+        return [self.evaluate(samples, driver, job_ids) for samples, driver, job_ids in batches]
+
+    @staticmethod
+    def expand_samples(samples, driver):
+        """Expand the random field realizations of all samples at once.
+
+        Without random fields, the samples are returned unchanged and converted to dicts by the
+        driver.
+
+        Args:
+            samples (np.array): Array of samples
+            driver (Driver): Driver object that runs simulation
+
+        Returns:
+            samples (np.array, list): Samples or list of sample dicts with expanded random fields
+        """
+        if driver.parameters.random_field_flag:
+            return driver.parameters.samples_as_dicts(samples)
+        return samples
+
     def copy_files_to_experiment_dir(self, paths):
         """Copy file to experiment directory.
 
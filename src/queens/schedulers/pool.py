@@ -52,42 +52,114 @@ class Pool(Scheduler):
         )
         self.pool = create_pool(num_jobs)
 
-    def evaluate(self, samples, driver, job_ids=None):
-        """Submit jobs to driver.
+    def _driver_function(self, driver):
+        """Driver run function with the settings of this scheduler.
 
         Args:
-            samples (np.array): Array of samples
             driver (Driver): Driver object that runs simulation
-            job_ids (lst, opt): List of job IDs corresponding to samples
 
         Returns:
-            result_dict (dict): Dictionary containing results
+            function: Function of sample and job ID
         """
-        function = partial(
+        return partial(
             driver.run,
             num_procs=1,
             experiment_dir=self.experiment_dir,
             experiment_name=self.experiment_name,
         )
-        if job_ids is None:
-            job_ids = self.get_job_ids(len(samples))
-        # Pool or no pool
+
+    def _map(self, functions, samples, job_ids):
+        """Run the jobs with or without pool.
+
+        Args:
+            functions (list): Driver run function of each job
+            samples (list): Sample of each job
+            job_ids (list): ID of each job
+
+        Returns:
+            list: Results of the jobs
+        """
         if self.pool:
-            results = self.pool.map(function, samples, job_ids)
-        elif self.verbose:
-            results = list(map(function, tqdm(samples), job_ids))
-        else:
-            results = list(map(function, samples, job_ids))
-
-        output = {}
-        # check if gradient is returned --> tuple
-        if isinstance(results[0], tuple):
-            results_iterator, gradient_iterator = zip(*results)
-            results_array = np.array(list(results_iterator))
-            gradients_array = np.array(list(gradient_iterator))
-            output["gradient"] = gradients_array
-        else:
-            results_array = np.array(results)
-
-        output["result"] = results_array
-        return output
+            return self.pool.map(_run_job, functions, samples, job_ids)
+        if self.verbose:
+            return list(map(_run_job, functions, tqdm(samples), job_ids))
+        return list(map(_run_job, functions, samples, job_ids))
+
+    def evaluate(self, samples, driver, job_ids=None):
+        """Submit jobs to driver.
+
+        Args:
+            samples (np.array): Array of samples
+            driver (Driver): Driver object that runs simulation
+            job_ids (lst, opt): List of job IDs corresponding to samples
+
+        Returns:
+            result_dict (dict): Dictionary containing results
+        """
+        return self.evaluate_batches([(samples, driver, job_ids)])[0]
+
+    def evaluate_batches(self, batches):
+        """Submit the jobs of several batches at once.
+
+        The jobs of all batches are distributed to the pool in a single map.
+
+        Args:
+            batches (list): Tuples of samples, driver and job IDs (or None) of each batch
+
+        Returns:
+            list: Result dictionaries of the batches
+        """
+        functions, all_samples, all_job_ids, batch_sizes = [], [], [], []
+        for samples, driver, job_ids in batches:
+            if job_ids is None:
+                job_ids = self.get_job_ids(len(samples))
+            samples = self.expand_samples(samples, driver)
+            functions.extend([self._driver_function(driver)] * len(samples))
+            all_samples.extend(samples)
+            all_job_ids.extend(job_ids)
+            batch_sizes.append(len(samples))
+
+        results = self._map(functions, all_samples, all_job_ids)
+
+        outputs = []
+        batch_ends = np.cumsum(batch_sizes)
+        for start, end in zip(batch_ends - batch_sizes, batch_ends):
+            outputs.append(_results_to_output(results[start:end]))
+        return outputs
+
+
+def _run_job(function, sample, job_id):
+    """Run a single job.
+
+    Args:
+        function (function): Driver run function
+        sample (np.array, dict): Sample of the job
+        job_id (int): ID of the job
+
+    Returns:
+        Result of the job
+    """
+    return function(sample, job_id)
+
+
+def _results_to_output(results):
+    """Collect the results of the jobs of a batch.
+
+    Args:
+        results (list): Results of the jobs
+
+    Returns:
+        output (dict): Dictionary containing results (and gradients)
+    """
+    output = {}
+    # check if gradient is returned --> tuple
+    if results and isinstance(results[0], tuple):
+        results_iterator, gradient_iterator = zip(*results)
+        results_array = np.array(list(results_iterator))
+        gradients_array = np.array(list(gradient_iterator))
+        output["gradient"] = gradients_array
+    else:
+        results_array = np.array(results)
+
+    output["result"] = results_array
+    return output
@@ -0,0 +1,79 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Alias method for sampling from discrete distributions."""
+
+import numpy as np
+
+from queens.utils.random_generator import get_random_generator
+
+
+class AliasTable:
+    """Alias table for O(1) sampling of indices of a discrete distribution.
+
+    The table is built once in O(n) with Vose's method [1]. Each draw requires one uniform random
+    index and one uniform random number, independent of the number of events.
+
+    References:
+        [1]: Vose, M. D. (1991). A linear algorithm for generating random numbers with a given
+             distribution. IEEE Transactions on Software Engineering, 17(9), 972-975.
+
+    Attributes:
+        acceptance_probabilities (np.ndarray): Probability to accept the drawn column
+        aliases (np.ndarray): Alias index of each column
+    """
+
+    def __init__(self, probabilities):
+        """Build the alias table.
+
+        Args:
+            probabilities (np.ndarray): Probabilities of the events (summing up to one)
+        """
+        num_events = len(probabilities)
+        scaled_probabilities = np.array(probabilities, dtype=float).reshape(-1) * num_events
+        acceptance_probabilities = np.ones(num_events)
+        aliases = np.arange(num_events)
+
+        small = list(np.flatnonzero(scaled_probabilities < 1.0))
+        large = list(np.flatnonzero(scaled_probabilities >= 1.0))
+        while small and large:
+            small_index = small.pop()
+            large_index = large[-1]
+            acceptance_probabilities[small_index] = scaled_probabilities[small_index]
+            aliases[small_index] = large_index
+            scaled_probabilities[large_index] -= 1.0 - scaled_probabilities[small_index]
+            if scaled_probabilities[large_index] < 1.0:
+                small.append(large.pop())
+
+        # the remaining columns are full up to round-off errors
+        self.acceptance_probabilities = acceptance_probabilities
+        self.aliases = aliases
+
+    def draw(self, num_draws=1, rng=None):
+        """Draw indices of events.
+
+        A single uniform random number per draw selects the column (integer part) and decides
+        between the column and its alias (fractional part).
+
+        Args:
+            num_draws (int, optional): Number of draws
+            rng (np.random.Generator, optional): Random number generator
+
+        Returns:
+            np.ndarray: Indices of the drawn events
+        """
+        scaled_uniforms = get_random_generator(rng).random(num_draws) * len(self.aliases)
+        columns = scaled_uniforms.astype(int)
+        accept = scaled_uniforms - columns < self.acceptance_probabilities[columns]
+        return np.where(accept, columns, self.aliases[columns])
@@ -161,6 +161,57 @@ def gather_metadata_and_write_to_csv():
     _logger.info("Done.")
 
 
+@cli_logging
+def reprocess_experiment_dir_cli():
+    """Re-process the job outputs of an existing experiment directory."""
+    # pylint: disable-next=import-outside-toplevel
+    from queens.utils.reprocessing import reprocess_experiment_dir_from_config
+
+    ascii_art.print_crown(60)
+    ascii_art.print_banner("QUEENS", 60)
+
+    parser = argparse.ArgumentParser(
+        description="QUEENS cli util to apply a data processor to all jobs of an existing "
+        "experiment directory and write the consolidated data to a single file."
+    )
+    parser.add_argument(
+        "--experiment_dir",
+        type=str,
+        required=True,
+        help="Experiment dir to simulation folders",
+    )
+    parser.add_argument(
+        "--data_processor",
+        type=str,
+        required=True,
+        help="Data processor configuration in .json or .yaml/yml format.",
+    )
+    parser.add_argument(
+        "--num_workers", type=int, default=1, help="Number of parallel workers", metavar="N"
+    )
+    parser.add_argument(
+        "--output_path",
+        type=str,
+        default=None,
+        help="Path to the consolidated .npz or .parquet output file",
+    )
+    parser.add_argument(
+        "--use_cache", type=str_to_bool, default=True, help="Skip unchanged jobs yes/no."
+    )
+
+    args = sys.argv[1:]
+    args = parser.parse_args(args)
+    _logger.info("Re-processing experiment directory %s.", args.experiment_dir)
+    reprocess_experiment_dir_from_config(
+        experiment_dir=args.experiment_dir,
+        data_processor_config_path=args.data_processor,
+        num_workers=args.num_workers,
+        output_path=args.output_path,
+        use_cache=args.use_cache,
+    )
+    _logger.info("Done.")
+
+
 def build_html_coverage_report():
     """Build html coverage report."""
     _logger.info("Build html coverage report...")
@@ -22,6 +22,7 @@ from queens.utils.path import create_folder_if_not_existent
 _logger = logging.getLogger(__name__)
 
 BASE_DATA_DIR = "queens-experiments"
+RANDOM_FIELD_CACHE_DIR = "random-field-cache"
 
 
 def base_directory():
@@ -62,6 +63,20 @@ def experiment_directory(experiment_name):
     return experiment_dir
 
 
+def random_field_cache_directory():
+    """Directory for the cached bases of random fields.
+
+    The cache is shared by all experiments and located in the base directory (see
+    base_directory()).
+
+    Returns:
+        cache_dir (Path): Path to the random field cache directory
+    """
+    cache_dir = base_directory() / RANDOM_FIELD_CACHE_DIR
+    create_directory(cache_dir)
+    return cache_dir
+
+
 def create_directory(dir_path):
     """Create a directory either local or remote."""
     _logger.debug("Creating folder %s.", dir_path)
@@ -17,8 +17,10 @@
 import csv
 import logging
 import pickle
+import zipfile
 from pathlib import Path
 
+import numpy as np
 import yaml
 
 from queens.utils.exceptions import FileTypeError
@@ -161,6 +163,58 @@ def write_to_csv(output_file_path, data, delimiter=","):
             writer.writerow(row)
 
 
+def load_chunk_results(chunk_file, samples):
+    """Load the model output of a chunk of samples written by *write_chunk_results*.
+
+    Args:
+        chunk_file (Path): Path to the *.npz* file of the chunk
+        samples (np.ndarray): Samples of the chunk
+
+    Returns:
+        dict, None: Model output of the chunk or *None* if the file does not exist, cannot be read
+        or belongs to different samples
+    """
+    if not chunk_file.is_file():
+        return None
+    try:
+        with np.load(chunk_file) as chunk_data:
+            chunk_output = dict(chunk_data)
+    except (OSError, ValueError, zipfile.BadZipFile):
+        _logger.warning("Could not read the chunk %s.", chunk_file)
+        return None
+    if not np.array_equal(chunk_output.pop("samples", None), samples):
+        _logger.warning("The chunk %s belongs to different samples.", chunk_file)
+        return None
+    _logger.info("Loaded the results of the chunk %s.", chunk_file)
+    return chunk_output
+
+
+def write_chunk_results(chunk_file, samples, response):
+    """Write the model output of a chunk of samples to an *.npz* file.
+
+    The file is replaced atomically, such that an interrupted run never leaves a partially written
+    chunk. Outputs without values (e.g., missing gradients) are not stored.
+
+    Args:
+        chunk_file (Path): Path to the *.npz* file of the chunk
+        samples (np.ndarray): Samples of the chunk
+        response (dict): Model response at the samples
+
+    Returns:
+        dict: Stored model output of the chunk
+    """
+    chunk_output = {
+        key: np.asarray(value)
+        for key, value in response.items()
+        if np.asarray(value).dtype != object
+    }
+    tmp_file = chunk_file.with_suffix(".tmp")
+    with open(tmp_file, "wb") as file:
+        np.savez(file, samples=samples, **chunk_output)
+    tmp_file.replace(chunk_file)
+    return chunk_output
+
+
 def read_file(file_path):
     """Function to read in a file.
 
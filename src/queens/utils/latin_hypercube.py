@@ -0,0 +1,329 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Optimized Latin hypercube designs.
+
+A design is improved by exchanging two entries of one of its columns, which preserves the Latin
+hypercube property. Following the enhanced stochastic evolutionary (ESE) algorithm [1], an exchange
+is accepted if it deteriorates the criterion by less than a random fraction of a threshold, which is
+adapted to the acceptance rate. The criteria are updated incrementally: an exchange changes the
+distances of the two exchanged points only (maximin) or a single row of the cross-product matrix
+(correlation). Hence, an exchange costs O(N·D) or O(D) operations instead of the O(N²·D) of a full
+evaluation of the criterion, and the matrix of pairwise distances is never stored.
+
+The exchanges are still proposed one after another. For a design with 1e5 samples in 50 dimensions,
+an exchange takes about 16 ms (maximin) or 0.1 ms (correlation), such that the maximin criterion
+can only be optimized with a small number of exchanges relative to the size of such designs.
+
+References:
+    [1]: Jin, R., Chen, W., & Sudjianto, A. (2005). An efficient algorithm for constructing optimal
+         design of computer experiments. Journal of Statistical Planning and Inference, 134(1),
+         268-287.
+"""
+
+import numpy as np
+
+from queens.utils.random_generator import get_random_generator
+from queens.utils.valid_options import get_option
+
+
+class MaximinCriterion:
+    r"""Space-filling criterion :math:`\phi_p = \sum_{i<j} d_{ij}^{-p}` of a design.
+
+    Minimizing :math:`\phi_p` maximizes the minimal distance of the points for large *p*. The
+    distances are normalized with a reference distance to avoid overflows.
+
+    Attributes:
+        samples (np.ndarray): Design that is modified in-place by the exchanges
+        power (float): Exponent *p* of the criterion
+        squared_norms (np.ndarray): Squared norms of the points of the design
+        reference_distance (float): Squared distance used for normalization
+    """
+
+    def __init__(self, samples, power=10):
+        """Initialize the criterion.
+
+        Args:
+            samples (np.ndarray): Design of shape (num_samples, num_dimensions)
+            power (float, opt): Exponent *p* of the criterion
+        """
+        self.samples = samples
+        self.power = power
+        self.squared_norms = np.sum(samples**2, axis=1)
+        self.reference_distance = np.median(self._squared_distances([0])[0, 1:])
+
+    def _squared_distances(self, rows):
+        """Squared distances of some points to all points of the design.
+
+        Args:
+            rows (list): Indices of the points
+
+        Returns:
+            np.ndarray: Squared distances of shape (len(rows), num_samples)
+        """
+        squared_distances = (
+            self.squared_norms[rows, np.newaxis]
+            + self.squared_norms
+            - 2.0 * np.dot(self.samples[rows], self.samples.T)
+        )
+        return squared_distances
+
+    def _contributions(self, squared_distances):
+        """Contributions of pairs of points to the criterion.
+
+        Args:
+            squared_distances (np.ndarray): Squared distances of the pairs
+
+        Returns:
+            np.ndarray: Contributions to the criterion
+        """
+        normalized_distances = np.maximum(squared_distances / self.reference_distance, 1e-12)
+        return normalized_distances ** (-0.5 * self.power)
+
+    def difference(self, column, row_1, row_2):
+        """Change of the criterion if two entries of a column are exchanged.
+
+        Args:
+            column (int): Column of the entries
+            row_1 (int): Row of the first entry
+            row_2 (int): Row of the second entry
+
+        Returns:
+            float: Change of the criterion
+        """
+        squared_distances = self._squared_distances([row_1, row_2])
+        values = self.samples[:, column]
+        shift = (values[row_2] - values) ** 2 - (values[row_1] - values) ** 2
+        new_squared_distances = squared_distances + np.stack([shift, -shift])
+        differences = self._contributions(new_squared_distances) - self._contributions(
+            squared_distances
+        )
+        # the distance between the two points does not change
+        differences[:, [row_1, row_2]] = 0.0
+        return np.sum(differences)
+
+    def exchange(self, column, row_1, row_2):
+        """Exchange two entries of a column.
+
+        Args:
+            column (int): Column of the entries
+            row_1 (int): Row of the first entry
+            row_2 (int): Row of the second entry
+        """
+        value_1, value_2 = self.samples[[row_1, row_2], column]
+        self.samples[[row_1, row_2], column] = value_2, value_1
+        self.squared_norms[row_1] += value_2**2 - value_1**2
+        self.squared_norms[row_2] += value_1**2 - value_2**2
+
+
+class CorrelationCriterion:
+    """Sum of the squared correlation coefficients of all pairs of columns of a design.
+
+    Exchanges within a column do not change the means and variances of the columns, such that only
+    the cross products of the exchanged column have to be updated.
+
+    Attributes:
+        samples (np.ndarray): Design that is modified in-place by the exchanges
+        cross_products (np.ndarray): Cross products of the centered columns
+        variances (np.ndarray): Sums of the squared centered columns
+    """
+
+    def __init__(self, samples):
+        """Initialize the criterion.
+
+        Args:
+            samples (np.ndarray): Design of shape (num_samples, num_dimensions)
+        """
+        self.samples = samples
+        centered_samples = samples - np.mean(samples, axis=0)
+        self.cross_products = np.dot(centered_samples.T, centered_samples)
+        self.variances = np.diag(self.cross_products).copy()
+
+    def _cross_product_changes(self, column, row_1, row_2):
+        """Changes of the cross products of a column if two of its entries are exchanged.
+
+        Args:
+            column (int): Column of the entries
+            row_1 (int): Row of the first entry
+            row_2 (int): Row of the second entry
+
+        Returns:
+            np.ndarray: Changes of the cross products with all columns
+        """
+        changes = (self.samples[row_2, column] - self.samples[row_1, column]) * (
+            self.samples[row_1] - self.samples[row_2]
+        )
+        changes[column] = 0.0
+        return changes
+
+    def difference(self, column, row_1, row_2):
+        """Change of the criterion if two entries of a column are exchanged.
+
+        Args:
+            column (int): Column of the entries
+            row_1 (int): Row of the first entry
+            row_2 (int): Row of the second entry
+
+        Returns:
+            float: Change of the criterion
+        """
+        changes = self._cross_product_changes(column, row_1, row_2)
+        cross_products = self.cross_products[column]
+        return 2.0 * np.sum(
+            ((cross_products + changes) ** 2 - cross_products**2)
+            / (self.variances[column] * self.variances)
+        )
+
+    def exchange(self, column, row_1, row_2):
+        """Exchange two entries of a column.
+
+        Args:
+            column (int): Column of the entries
+            row_1 (int): Row of the first entry
+            row_2 (int): Row of the second entry
+        """
+        changes = self._cross_product_changes(column, row_1, row_2)
+        self.cross_products[column] += changes
+        self.cross_products[:, column] += changes
+        value_1, value_2 = self.samples[[row_1, row_2], column]
+        self.samples[[row_1, row_2], column] = value_2, value_1
+
+
+# centering of the points within their cells and optimized criterion
+VALID_CRITERIA = {
+    "center": (True, None),
+    "c": (True, None),
+    "maximin": (False, MaximinCriterion),
+    "m": (False, MaximinCriterion),
+    "centermaximin": (True, MaximinCriterion),
+    "cm": (True, MaximinCriterion),
+    "correlation": (False, CorrelationCriterion),
+    "corr": (False, CorrelationCriterion),
+}
+
+
+def latin_hypercube(num_samples, num_dimensions, centered=False, rng=None):
+    """Draw a random Latin hypercube design in the unit hypercube.
+
+    Args:
+        num_samples (int): Number of samples
+        num_dimensions (int): Number of dimensions
+        centered (bool, opt): Place the points in the centers of their cells
+        rng (np.random.Generator, opt): Random number generator
+
+    Returns:
+        np.ndarray: Design of shape (num_samples, num_dimensions)
+    """
+    rng = get_random_generator(rng)
+    cells = np.argsort(rng.random((num_samples, num_dimensions)), axis=0)
+    if centered:
+        offsets = 0.5
+    else:
+        offsets = rng.random((num_samples, num_dimensions))
+    return (cells + offsets) / num_samples
+
+
+def optimize_latin_hypercube(
+    criterion, num_exchanges, rng=None, exchanges_per_cycle=100, tolerance=1e-3, patience=10
+):
+    """Improve a design by threshold-accepted exchanges within its columns.
+
+    The exchanges are organized in cycles. The first cycle only accepts improvements and
+    calibrates the threshold. After each cycle, the threshold is decreased if the design improved
+    and many exchanges were accepted and increased otherwise (simplified ESE algorithm). The best
+    design found is kept.
+
+    The optimization stops early if the best design improved by less than *tolerance* times the
+    total improvement within the last *patience* cycles.
+
+    Args:
+        criterion (MaximinCriterion, CorrelationCriterion): Criterion holding the design
+        num_exchanges (int): Maximum number of proposed exchanges
+        rng (np.random.Generator, opt): Random number generator
+        exchanges_per_cycle (int, opt): Number of exchanges after which the threshold is adapted
+        tolerance (float, opt): Relative improvement below which the optimization stops
+        patience (int, opt): Number of cycles over which the improvement is measured
+
+    Returns:
+        np.ndarray: Optimized design
+    """
+    rng = get_random_generator(rng)
+    num_samples, num_dimensions = criterion.samples.shape
+    best_samples = criterion.samples.copy()
+    threshold = 0.0
+    criterion_change = best_criterion_change = 0.0
+    best_criterion_changes = [0.0]
+    num_done = 0
+    while num_done < num_exchanges:
+        num_cycle_exchanges = min(exchanges_per_cycle, num_exchanges - num_done)
+        columns = (rng.random(num_cycle_exchanges) * num_dimensions).astype(int)
+        rows = (rng.random((num_cycle_exchanges, 2)) * num_samples).astype(int)
+        thresholds = threshold * rng.random(num_cycle_exchanges)
+        differences = []
+        num_accepted = 0
+        for column, (row_1, row_2), cycle_threshold in zip(columns, rows, thresholds):
+            if row_1 == row_2:
+                continue
+            difference = criterion.difference(column, row_1, row_2)
+            differences.append(difference)
+            if difference < cycle_threshold:
+                criterion.exchange(column, row_1, row_2)
+                criterion_change += difference
+                num_accepted += 1
+        num_done += num_cycle_exchanges
+
+        improved = criterion_change < best_criterion_change
+        if improved:
+            best_criterion_change = criterion_change
+            best_samples = criterion.samples.copy()
+        if threshold == 0.0:
+            threshold = 0.1 * np.mean(np.abs(differences)) if differences else 0.0
+        elif improved and num_accepted > 0.1 * num_cycle_exchanges:
+            threshold *= 0.8
+        else:
+            threshold /= 0.8
+
+        best_criterion_changes.append(best_criterion_change)
+        if len(best_criterion_changes) > patience and (
+            best_criterion_changes[-patience - 1] - best_criterion_change
+            <= -tolerance * best_criterion_change
+        ):
+            break
+    return best_samples
+
+
+def optimized_latin_hypercube(
+    num_samples, num_dimensions, criterion="maximin", num_exchanges=None, rng=None
+):
+    """Create an optimized Latin hypercube design in the unit hypercube.
+
+    Args:
+        num_samples (int): Number of samples
+        num_dimensions (int): Number of dimensions
+        criterion (str, opt): "center" or "c", "maximin" or "m", "centermaximin" or "cm", and
+                              "correlation" or "corr"
+        num_exchanges (int, opt): Maximum number of proposed exchanges of the optimization.
+                                  Defaults to ten times the number of entries of the design.
+        rng (np.random.Generator, opt): Random number generator
+
+    Returns:
+        np.ndarray: Design of shape (num_samples, num_dimensions)
+    """
+    centered, criterion_class = get_option(VALID_CRITERIA, criterion)
+    samples = latin_hypercube(num_samples, num_dimensions, centered=centered, rng=rng)
+    if criterion_class is None or num_samples < 2:
+        return samples
+    if num_exchanges is None:
+        num_exchanges = 10 * num_samples * num_dimensions
+    return optimize_latin_hypercube(criterion_class(samples), num_exchanges, rng=rng)
@@ -16,8 +16,10 @@
 
 import numpy as np
 
+from queens.utils.random_generator import get_random_generator
 
-def mh_select(log_acceptance_probability, current_sample, proposed_sample):
+
+def mh_select(log_acceptance_probability, current_sample, proposed_sample, rng=None):
     """Perform Metropolis-Hastings selection.
 
     The Metropolis-Hastings algorithm is used in Markov Chain Monte Carlo (MCMC) methods to
@@ -35,6 +37,7 @@ def mh_select(log_acceptance_probability, current_sample, proposed_sample):
                                                current sample.
         current_sample (np.array): The current sample values from the MCMC chain.
         proposed_sample (np.array): The proposed sample values to be considered for acceptance.
+        rng (np.random.Generator, opt): Random number generator
 
     Returns:
         selected_samples (np.array): The sample values selected after the Metropolis-Hastings
@@ -45,7 +48,7 @@ def mh_select(log_acceptance_probability, current_sample, proposed_sample):
     """
     isfinite = np.isfinite(log_acceptance_probability)
     accept = (
-        np.log(np.random.uniform(size=log_acceptance_probability.shape))
+        np.log(get_random_generator(rng).uniform(size=log_acceptance_probability.shape))
         < log_acceptance_probability
     )
 
@@ -19,6 +19,7 @@ from datetime import datetime
 from pathlib import Path
 from time import perf_counter
 
+import numpy as np
 import pandas as pd
 import yaml
 from pandas.io.json._normalize import nested_to_record
@@ -144,6 +145,32 @@ def get_metadata_from_experiment_dir(experiment_dir):
         yield yaml.safe_load(metadata_path.read_text())
 
 
+def get_job_run_times(experiment_dir, job_ids):
+    """Get the run times of jobs from their metadata.
+
+    The run time of a job is the sum of the times of all its timed code sections.
+
+    Args:
+        experiment_dir (pathlib.Path, str): Path with the job dirs
+        job_ids (list): IDs of the jobs
+
+    Returns:
+        run_times (np.ndarray): Run time of each job (NaN if no time is available)
+    """
+    run_times = np.full(len(job_ids), np.nan)
+    for i, job_id in enumerate(job_ids):
+        metadata_path = (Path(experiment_dir) / str(job_id) / METADATA_FILENAME).with_suffix(
+            METADATA_FILETYPE
+        )
+        if not metadata_path.is_file():
+            continue
+        times = (yaml.safe_load(metadata_path.read_text()) or {}).get("times") or {}
+        section_times = [section["time"] for section in times.values() if "time" in section]
+        if section_times:
+            run_times[i] = sum(section_times)
+    return run_times
+
+
 def write_metadata_to_csv(experiment_dir, csv_path=None):
     """Gather and write job metadata to csv.
 
@@ -0,0 +1,215 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Online statistics of streamed samples."""
+
+import numpy as np
+import scipy.stats
+
+
+class OnlineMoments:
+    """Mean, variance and covariance of samples arriving in batches.
+
+    The moments are updated with the batched variant of Welford's algorithm by Chan et al. [1],
+    which is numerically stable and does not store the samples.
+
+    References:
+        [1]: Chan, T. F., Golub, G. H., & LeVeque, R. J. (1983). Algorithms for computing the sample
+             variance: Analysis and recommendations. The American Statistician, 37(3), 242-247.
+
+    Attributes:
+        num_samples (int): Number of processed samples
+        mean (np.ndarray): Mean of the samples
+        sum_squared_deviations (np.ndarray): Sum of the outer products of the deviations from the
+                                             mean (only the diagonal if the covariance is not
+                                             tracked)
+        track_covariance (bool): If True, the full covariance matrix is tracked
+    """
+
+    def __init__(self, track_covariance=False):
+        """Initialize the online moments.
+
+        Args:
+            track_covariance (bool, opt): If True, the full covariance matrix is tracked
+        """
+        self.num_samples = 0
+        self.mean = None
+        self.sum_squared_deviations = None
+        self.track_covariance = track_covariance
+
+    def update(self, samples):
+        """Add a batch of samples.
+
+        Args:
+            samples (np.ndarray): Samples of shape (num_samples, dimension)
+        """
+        samples = np.asarray(samples, dtype=float).reshape(len(samples), -1)
+        num_new = len(samples)
+        if num_new == 0:
+            return
+        mean_new = samples.mean(axis=0)
+        deviations = samples - mean_new
+        if self.track_covariance:
+            sum_squared_deviations_new = deviations.T @ deviations
+        else:
+            sum_squared_deviations_new = np.sum(deviations**2, axis=0)
+
+        if self.num_samples == 0:
+            self.mean = mean_new
+            self.sum_squared_deviations = sum_squared_deviations_new
+            self.num_samples = num_new
+            return
+
+        num_total = self.num_samples + num_new
+        delta = mean_new - self.mean
+        if self.track_covariance:
+            correction = np.outer(delta, delta)
+        else:
+            correction = delta**2
+        self.sum_squared_deviations = (
+            self.sum_squared_deviations
+            + sum_squared_deviations_new
+            + correction * self.num_samples * num_new / num_total
+        )
+        self.mean = self.mean + delta * num_new / num_total
+        self.num_samples = num_total
+
+    @property
+    def variance(self):
+        """Unbiased sample variance.
+
+        Returns:
+            np.ndarray: Variance of each component
+        """
+        if self.track_covariance:
+            return np.diag(self.covariance)
+        return self.sum_squared_deviations / max(self.num_samples - 1, 1)
+
+    @property
+    def covariance(self):
+        """Unbiased sample covariance matrix.
+
+        Returns:
+            np.ndarray: Covariance matrix
+
+        Raises:
+            ValueError: If the covariance is not tracked
+        """
+        if not self.track_covariance:
+            raise ValueError("The covariance is not tracked.")
+        return self.sum_squared_deviations / max(self.num_samples - 1, 1)
+
+    @property
+    def standard_error(self):
+        """Standard error of the mean.
+
+        Returns:
+            np.ndarray: Standard error of each component
+        """
+        return np.sqrt(self.variance / self.num_samples)
+
+    def relative_half_width(self, confidence_level=0.95):
+        """Half-width of the confidence interval of the mean relative to the mean.
+
+        Args:
+            confidence_level (float, opt): Confidence level of the interval
+
+        Returns:
+            np.ndarray: Relative half-width of each component
+        """
+        quantile = scipy.stats.norm.ppf(0.5 + confidence_level / 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return quantile * self.standard_error / np.abs(self.mean)
+
+
+class QuantileSketch:
+    """Streaming quantile estimates with bounded memory.
+
+    Each component keeps at most *max_centroids* weighted centroids. When a batch exceeds this
+    size, neighboring centroids are merged into groups of equal weight. As long as fewer samples
+    than centroids were processed, every sample is kept as its own centroid.
+
+    Attributes:
+        max_centroids (int): Maximum number of centroids per component
+        centroids (list): Sorted centroid values of each component
+        weights (list): Weights of the centroids of each component
+    """
+
+    def __init__(self, max_centroids=1000):
+        """Initialize the quantile sketch.
+
+        Args:
+            max_centroids (int, opt): Maximum number of centroids per component
+        """
+        self.max_centroids = max_centroids
+        self.centroids = None
+        self.weights = None
+
+    def update(self, samples):
+        """Add a batch of samples.
+
+        Args:
+            samples (np.ndarray): Samples of shape (num_samples, dimension)
+        """
+        samples = np.asarray(samples, dtype=float).reshape(len(samples), -1)
+        if len(samples) == 0:
+            return
+        if self.centroids is None:
+            self.centroids = [np.empty(0)] * samples.shape[1]
+            self.weights = [np.empty(0)] * samples.shape[1]
+
+        for i, component_samples in enumerate(samples.T):
+            values = np.concatenate((self.centroids[i], component_samples))
+            weights = np.concatenate((self.weights[i], np.ones(len(component_samples))))
+            order = np.argsort(values, kind="stable")
+            self.centroids[i], self.weights[i] = self._compress(values[order], weights[order])
+
+    def _compress(self, values, weights):
+        """Merge sorted centroids into at most *max_centroids* groups of equal weight.
+
+        Args:
+            values (np.ndarray): Sorted centroid values
+            weights (np.ndarray): Weights of the centroids
+
+        Returns:
+            np.ndarray: Merged centroid values
+            np.ndarray: Weights of the merged centroids
+        """
+        if len(values) <= self.max_centroids:
+            return values, weights
+        cumulative_weights = np.cumsum(weights)
+        midpoints = (cumulative_weights - weights / 2) / cumulative_weights[-1]
+        groups = np.minimum((midpoints * self.max_centroids).astype(int), self.max_centroids - 1)
+        merged_weights = np.bincount(groups, weights=weights)
+        merged_values = np.bincount(groups, weights=weights * values)
+        non_empty = merged_weights > 0
+        return merged_values[non_empty] / merged_weights[non_empty], merged_weights[non_empty]
+
+    def quantiles(self, probabilities):
+        """Estimate quantiles.
+
+        Args:
+            probabilities (np.ndarray): Probabilities of the quantiles
+
+        Returns:
+            np.ndarray: Quantiles of shape (num_probabilities, dimension)
+        """
+        probabilities = np.atleast_1d(probabilities)
+        quantiles = []
+        for values, weights in zip(self.centroids, self.weights):
+            cumulative_weights = np.cumsum(weights)
+            # the centroids are located at the center of their weight
+            positions = (cumulative_weights - weights / 2) / cumulative_weights[-1]
+            quantiles.append(np.interp(probabilities, positions, values))
+        return np.column_stack(quantiles)
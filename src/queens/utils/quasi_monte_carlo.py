@@ -0,0 +1,96 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Randomized quasi-Monte Carlo sampling.
+
+Low-discrepancy sequences cover the unit hypercube more evenly than pseudo-random samples. Hence,
+for smooth quantities of interest, estimators converge faster. Scrambling randomizes the sequences
+while preserving their low discrepancy. The means of several independent randomizations are
+independent, unbiased estimators, such that their spread provides an error estimate.
+"""
+
+import numpy as np
+from scipy.stats.qmc import Halton, Sobol
+
+from queens.utils.random_generator import spawn_random_generators
+from queens.utils.valid_options import get_option
+
+VALID_SEQUENCES = {"sobol": Sobol, "halton": Halton}
+
+
+def draw_rqmc_samples(parameters, num_samples, num_randomizations=1, sequence="sobol", seed=None):
+    """Draw samples from independently scrambled low-discrepancy sequences.
+
+    The samples are split evenly among the randomizations. The uniform samples are transformed to
+    the parameter distributions with *Parameters.inverse_cdf_transform*.
+
+    Args:
+        parameters (Parameters): Parameters defining the distribution of the samples
+        num_samples (int): Total number of samples (preferably a power of two per randomization
+                           for Sobol sequences)
+        num_randomizations (int, opt): Number of independent randomizations
+        sequence (str, opt): Low-discrepancy sequence ('sobol' or 'halton')
+        seed (int, np.random.SeedSequence, opt): Seed of the randomizations
+
+    Returns:
+        samples (np.ndarray): Samples ordered by randomization
+        randomization_ids (np.ndarray): Randomization of each sample
+
+    Raises:
+        ValueError: If the number of samples is not divisible by the number of randomizations
+    """
+    if num_samples % num_randomizations:
+        raise ValueError(
+            f"The number of samples {num_samples} has to be divisible by the number of "
+            f"randomizations {num_randomizations}."
+        )
+    sequence_class = get_option(VALID_SEQUENCES, sequence)
+    num_samples_per_randomization = num_samples // num_randomizations
+    samples = np.empty((num_samples, parameters.num_parameters))
+    for i, rng in enumerate(spawn_random_generators(seed, num_randomizations)):
+        engine = sequence_class(d=parameters.num_parameters, scramble=True, seed=rng)
+        samples[i * num_samples_per_randomization : (i + 1) * num_samples_per_randomization] = (
+            parameters.inverse_cdf_transform(engine.random(num_samples_per_randomization))
+        )
+    randomization_ids = np.repeat(np.arange(num_randomizations), num_samples_per_randomization)
+    return samples, randomization_ids
+
+
+def rqmc_mean_and_standard_error(outputs, randomization_ids):
+    """Estimate the mean and its standard error from the outputs of several randomizations.
+
+    The mean of each randomization is an independent, unbiased estimate of the mean. The standard
+    error is estimated from their spread.
+
+    Args:
+        outputs (np.ndarray): Outputs of shape (num_samples, ...)
+        randomization_ids (np.ndarray): Randomization of each output
+
+    Returns:
+        mean (np.ndarray): Mean of each output component
+        standard_error (np.ndarray): Standard error of the mean of each output component (NaN for
+                                     a single randomization)
+    """
+    outputs = np.asarray(outputs, dtype=float)
+    flat_outputs = outputs.reshape(len(outputs), -1)
+    ids, inverse = np.unique(randomization_ids, return_inverse=True)
+    counts = np.bincount(inverse)
+    randomization_means = np.column_stack(
+        [np.bincount(inverse, weights=column) / counts for column in flat_outputs.T]
+    )
+    mean = randomization_means.mean(axis=0).reshape(outputs.shape[1:])
+    if len(ids) < 2:
+        return mean, np.full(mean.shape, np.nan)
+    standard_error = randomization_means.std(axis=0, ddof=1) / np.sqrt(len(ids))
+    return mean, standard_error.reshape(outputs.shape[1:])
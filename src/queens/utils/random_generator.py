@@ -0,0 +1,92 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Random number generators.
+
+Random numbers in QUEENS are either drawn from the global random state (seeded with
+``np.random.seed``) or from an explicitly passed ``np.random.Generator``. Independent generators for
+parallel workers or chunks of samples are spawned from a single seed via ``np.random.SeedSequence``,
+such that each stream is reproducible on its own, independent of the order or the process in which
+the streams are consumed.
+"""
+
+import numpy as np
+
+
+def get_random_generator(rng=None):
+    """Get the random number generator to draw from.
+
+    The sampling functions of ``np.random`` (drawing from the global random state) and the
+    methods of ``np.random.Generator`` used in QUEENS share their names and signatures (e.g.
+    *random*, *standard_normal*, *uniform*, *exponential*, *multinomial* and *shuffle*). Hence, both
+    can be used interchangeably.
+
+    Args:
+        rng (np.random.Generator, opt): Random number generator
+
+    Returns:
+        np.random.Generator, module: The provided generator or ``np.random`` if none is provided
+    """
+    if rng is None:
+        return np.random
+    return rng
+
+
+def spawn_seed_sequences(seed, num_streams):
+    """Spawn independent seed sequences from a single seed.
+
+    Args:
+        seed (int, np.random.SeedSequence): Root seed
+        num_streams (int): Number of independent streams
+
+    Returns:
+        list: Seed sequences of the streams
+    """
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return seed.spawn(num_streams)
+
+
+def spawn_random_generators(seed, num_streams):
+    """Spawn independent random number generators from a single seed.
+
+    The *i*-th generator only depends on the root seed and *i*. It can, hence, be recreated
+    independently, e.g. to redraw the samples of a single worker or chunk.
+
+    Args:
+        seed (int, np.random.SeedSequence): Root seed
+        num_streams (int): Number of independent streams
+
+    Returns:
+        list: Random number generators of the streams
+    """
+    return [
+        np.random.default_rng(seed_sequence)
+        for seed_sequence in spawn_seed_sequences(seed, num_streams)
+    ]
+
+
+def split_into_chunks(num_samples, num_chunks):
+    """Split a number of samples into chunks of almost equal size.
+
+    Args:
+        num_samples (int): Total number of samples
+        num_chunks (int): Number of chunks
+
+    Returns:
+        np.ndarray: Number of samples per chunk
+    """
+    chunk_sizes = np.full(num_chunks, num_samples // num_chunks)
+    chunk_sizes[: num_samples % num_chunks] += 1
+    return chunk_sizes
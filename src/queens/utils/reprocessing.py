@@ -0,0 +1,349 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Offline re-processing of existing experiment directories.
+
+The functions in this module apply a data processor to the *output* folder of every job in an
+existing experiment directory, without rerunning the study. The results are consolidated into a
+single file together with the corresponding job ids. Jobs whose output files did not change since
+the last re-processing run are skipped by means of a per-job cache.
+"""
+
+import hashlib
+import json
+import logging
+import pickle
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from queens.data_processors import CsvFile, NumpyFile, PvdFile, TxtFile
+from queens.utils.config_directories import job_dirs_in_experiment_dir
+from queens.utils.exceptions import FileTypeError
+from queens.utils.imports import get_module_class
+from queens.utils.io import load_input_file
+from queens.utils.pool import create_pool
+
+_logger = logging.getLogger(__name__)
+
+VALID_TYPES = {
+    "csv": CsvFile,
+    "numpy": NumpyFile,
+    "pvd": PvdFile,
+    "txt": TxtFile,
+}
+
+OUTPUT_FOLDER_NAME = "output"
+CACHE_FILE_PREFIX = "reprocessing_cache"
+
+
+def data_processor_from_config(config):
+    """Create a data processor from a configuration dictionary.
+
+    The configuration contains the data processor *type* (one of the keys of *VALID_TYPES* or the
+    class name in combination with *external_python_module*) and its keyword arguments. As the
+    re-processing must not modify a finished experiment, configurations that request the deletion
+    of output files are refused.
+
+    Args:
+        config (dict): Data processor configuration
+
+    Returns:
+        data_processor (DataProcessor): Data processor object
+    """
+    config = config.copy()
+    if config.get("files_to_be_deleted_regex_lst"):
+        raise ValueError(
+            "The option 'files_to_be_deleted_regex_lst' is not allowed for the re-processing of "
+            "existing experiment directories. Remove it from the data processor configuration."
+        )
+    data_processor_class = get_module_class(config, VALID_TYPES)
+    return data_processor_class(**config)
+
+
+def data_processor_hash(data_processor_config):
+    """Hash identifying the configuration of a data processor.
+
+    Args:
+        data_processor_config (dict): Data processor configuration
+
+    Returns:
+        str: Hex digest of the data processor configuration
+    """
+    identifier = json.dumps(data_processor_config, sort_keys=True, default=str)
+    return hashlib.sha256(identifier.encode("utf-8")).hexdigest()[:16]
+
+
+def data_processor_to_config(data_processor):
+    """Configuration dictionary describing a data processor object.
+
+    Args:
+        data_processor (DataProcessor): Data processor object
+
+    Returns:
+        dict: Class path and all (non-callable) attributes of the data processor
+    """
+    data_processor_class = data_processor.__class__
+    attributes = {key: value for key, value in vars(data_processor).items() if not callable(value)}
+    return {
+        "type": f"{data_processor_class.__module__}.{data_processor_class.__qualname__}",
+        **attributes,
+    }
+
+
+def output_files_mtime(output_dir, file_name_identifier):
+    """Latest modification time of the output files of a job.
+
+    Args:
+        output_dir (Path): Output directory of the job
+        file_name_identifier (str): Identifier (glob pattern) of the files of interest
+
+    Returns:
+        int: Latest modification time in nanoseconds or *None* if no file matches
+    """
+    mtimes = [file.stat().st_mtime_ns for file in output_dir.glob(file_name_identifier)]
+    if not mtimes:
+        return None
+    return max(mtimes)
+
+
+def load_cache(cache_path):
+    """Load the re-processing cache.
+
+    Args:
+        cache_path (Path): Path to the cache file
+
+    Returns:
+        dict: Cached results with the job ids as keys
+    """
+    if not cache_path.is_file():
+        return {}
+    try:
+        with open(cache_path, "rb") as file:
+            return pickle.load(file)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        _logger.warning("Could not read the re-processing cache %s. Ignoring it.", cache_path)
+        return {}
+
+
+def write_cache(cache_path, cache):
+    """Write the re-processing cache.
+
+    Args:
+        cache_path (Path): Path to the cache file
+        cache (dict): Cached results with the job ids as keys
+    """
+    tmp_path = cache_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as file:
+        pickle.dump(cache, file)
+    tmp_path.replace(cache_path)
+
+
+def _process_job(job_dir, data_processor):
+    """Process the output of a single job.
+
+    Exceptions raised by the data processor are logged and the job is treated as a job without
+    data, so that a single broken job does not abort the re-processing of all other jobs.
+
+    Args:
+        job_dir (Path): Job directory
+        data_processor (DataProcessor): Data processor object
+
+    Returns:
+        tuple: Job id, modification time of the output files and processed data
+    """
+    job_id = int(job_dir.name)
+    output_dir = job_dir / OUTPUT_FOLDER_NAME
+    mtime = output_files_mtime(output_dir, data_processor.file_name_identifier)
+    data = None
+    if mtime is not None:
+        try:
+            data = data_processor.get_data_from_file(output_dir)
+        except Exception as exception:  # pylint: disable=broad-exception-caught
+            _logger.error("Re-processing of job %s failed: %s", job_id, exception)
+    return job_id, mtime, data
+
+
+def _stack_data(cache, job_ids):
+    """Stack the cached data of the jobs along the first axis.
+
+    Args:
+        cache (dict): Cached results with the job ids as keys
+        job_ids (np.ndarray): Ids of the jobs to stack
+
+    Returns:
+        data (np.ndarray): Processed data of the jobs stacked along the first axis
+    """
+    job_data = [np.asarray(cache[job_id]["data"]) for job_id in job_ids]
+    if not job_data:
+        return np.empty((0,))
+
+    shapes = {}
+    for job_id, data in zip(job_ids, job_data):
+        shapes.setdefault(data.shape, []).append(int(job_id))
+    if len(shapes) > 1:
+        shapes_str = "\n".join(f"  {shape}: jobs {ids}" for shape, ids in shapes.items())
+        raise ValueError(
+            "The processed data of the jobs does not have a common shape and can not be "
+            f"stacked. Found the following shapes:\n{shapes_str}"
+        )
+    return np.stack(job_data)
+
+
+def reprocess_experiment_dir(
+    experiment_dir,
+    data_processor,
+    num_workers=1,
+    output_path=None,
+    use_cache=True,
+    data_processor_config=None,
+):
+    """Apply a data processor to all jobs of an existing experiment directory.
+
+    The data processor is applied to the *output* folder of every job directory in parallel. The
+    processed data is stacked to a single array and written to *output_path* together with the job
+    ids. Supported output formats are *.npz* and *.parquet*.
+
+    Args:
+        experiment_dir (Path, str): Experiment directory containing the job directories
+        data_processor (DataProcessor): Data processor object
+        num_workers (int, opt): Number of parallel workers
+        output_path (Path, str, opt): Path to the consolidated output file. Defaults to
+                                      *experiment_dir/reprocessed_data.npz*
+        use_cache (bool, opt): Skip jobs whose output files did not change since the last run
+        data_processor_config (dict, opt): Configuration the data processor was created from. It
+                                           identifies the cache. Defaults to the attributes of
+                                           the data processor.
+
+    Returns:
+        job_ids (np.ndarray): Ids of the processed jobs
+        data (np.ndarray): Processed data of the jobs stacked along the first axis
+    """
+    experiment_dir = Path(experiment_dir)
+    if output_path is None:
+        output_path = experiment_dir / "reprocessed_data.npz"
+    output_path = Path(output_path)
+    if output_path.suffix not in [".npz", ".parquet"]:
+        raise FileTypeError(
+            f"Only npz or parquet output files allowed, not of type '{output_path.suffix}'."
+        )
+    if data_processor.files_to_be_deleted_regex_lst:
+        raise ValueError(
+            "Data processors with 'files_to_be_deleted_regex_lst' are not allowed for the "
+            "re-processing of existing experiment directories."
+        )
+
+    if data_processor_config is None:
+        data_processor_config = data_processor_to_config(data_processor)
+    cache_name = f"{CACHE_FILE_PREFIX}_{data_processor_hash(data_processor_config)}.pickle"
+    cache_path = experiment_dir / cache_name
+    cache = load_cache(cache_path) if use_cache else {}
+
+    job_dirs = job_dirs_in_experiment_dir(experiment_dir)
+    job_dirs_to_process = []
+    for job_dir in job_dirs:
+        job_id = int(job_dir.name)
+        output_dir = job_dir / OUTPUT_FOLDER_NAME
+        mtime = output_files_mtime(output_dir, data_processor.file_name_identifier)
+        if mtime is None or cache.get(job_id, {}).get("mtime") != mtime:
+            job_dirs_to_process.append(job_dir)
+
+    _logger.info(
+        "Re-processing %s jobs in %s (%s jobs unchanged).",
+        len(job_dirs_to_process),
+        experiment_dir,
+        len(job_dirs) - len(job_dirs_to_process),
+    )
+
+    process_job = partial(_process_job, data_processor=data_processor)
+    pool = create_pool(num_workers)
+    if pool:
+        try:
+            results = pool.map(process_job, job_dirs_to_process)
+        finally:
+            pool.close()
+            pool.join()
+            pool.clear()
+    else:
+        results = list(map(process_job, job_dirs_to_process))
+
+    for job_id, mtime, data in results:
+        if data is None:
+            cache.pop(job_id, None)
+            _logger.warning("No data could be extracted for job %s.", job_id)
+        else:
+            cache[job_id] = {"mtime": mtime, "data": data}
+
+    existing_job_ids = {int(job_dir.name) for job_dir in job_dirs}
+    cache = {job_id: entry for job_id, entry in cache.items() if job_id in existing_job_ids}
+    if use_cache:
+        write_cache(cache_path, cache)
+
+    job_ids = np.array(sorted(cache), dtype=int)
+    data = _stack_data(cache, job_ids)
+    write_reprocessed_data(output_path, job_ids, data)
+    _logger.info("Wrote re-processed data of %s jobs to %s.", len(job_ids), output_path)
+
+    return job_ids, data
+
+
+def write_reprocessed_data(output_path, job_ids, data):
+    """Write the consolidated data of all jobs.
+
+    Args:
+        output_path (Path): Path to the output file (*.npz* or *.parquet*)
+        job_ids (np.ndarray): Ids of the processed jobs
+        data (np.ndarray): Processed data of the jobs stacked along the first axis
+    """
+    if output_path.suffix == ".npz":
+        np.savez_compressed(output_path, job_ids=job_ids, data=data)
+    else:
+        data_frame = pd.DataFrame({"job_id": job_ids})
+        if len(job_ids) > 0:
+            flattened_data = data.reshape(len(job_ids), -1)
+            data_columns = pd.DataFrame(
+                flattened_data, columns=[f"data_{i}" for i in range(flattened_data.shape[1])]
+            )
+            data_frame = pd.concat([data_frame, data_columns], axis=1)
+        data_frame.to_parquet(output_path, index=False)
+
+
+def reprocess_experiment_dir_from_config(
+    experiment_dir, data_processor_config_path, num_workers=1, output_path=None, use_cache=True
+):
+    """Re-process an experiment directory with a data processor from a yaml/json file.
+
+    Args:
+        experiment_dir (Path, str): Experiment directory containing the job directories
+        data_processor_config_path (Path, str): Path to the data processor configuration file
+        num_workers (int, opt): Number of parallel workers
+        output_path (Path, str, opt): Path to the consolidated output file
+        use_cache (bool, opt): Skip jobs whose output files did not change since the last run
+
+    Returns:
+        job_ids (np.ndarray): Ids of the processed jobs
+        data (np.ndarray): Processed data of the jobs stacked along the first axis
+    """
+    config = load_input_file(Path(data_processor_config_path))
+    data_processor = data_processor_from_config(config)
+    return reprocess_experiment_dir(
+        experiment_dir,
+        data_processor,
+        num_workers=num_workers,
+        output_path=output_path,
+        use_cache=use_cache,
+        data_processor_config=config,
+    )
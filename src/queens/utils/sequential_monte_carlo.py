@@ -19,6 +19,8 @@ import math
 import numpy as np
 from particles import smc_samplers as ssp
 
+from queens.utils.random_generator import get_random_generator
+
 
 def temper_logpdf_bayes(log_prior, log_like, tempering_parameter=1.0):
     """Bayesian tempering function.
@@ -159,6 +161,150 @@ def calc_ess(weights):
     return ess
 
 
+def _normalize(weights):
+    """Normalize weights to sum up to one.
+
+    Args:
+        weights (np.array): Non-negative weights
+
+    Returns:
+        np.array: Normalized weights
+    """
+    weights = np.asarray(weights, dtype=float).reshape(-1)
+    return weights / np.sum(weights)
+
+
+def _inverse_cdf_indices(weights, uniforms):
+    """Indices of the weights at sorted uniform positions of their cumulative sum.
+
+    Args:
+        weights (np.array): Normalized weights
+        uniforms (np.array): Sorted positions in [0, 1)
+
+    Returns:
+        np.array: Resampled indices
+    """
+    cumulative_weights = np.cumsum(weights)
+    cumulative_weights[-1] = 1.0
+    return np.searchsorted(cumulative_weights, uniforms, side="right")
+
+
+def multinomial_resampling(weights, num_samples=None, rng=None):
+    """Multinomial resampling.
+
+    Each index is drawn independently with probability proportional to its weight.
+
+    Args:
+        weights (np.array): Importance weights
+        num_samples (int, opt): Number of resampled indices (default: number of weights)
+        rng (np.random.Generator, opt): Random number generator
+
+    Returns:
+        np.array: Sorted resampled indices
+    """
+    weights = _normalize(weights)
+    num_samples = len(weights) if num_samples is None else num_samples
+    counts = get_random_generator(rng).multinomial(num_samples, weights)
+    return np.repeat(np.arange(len(weights)), counts)
+
+
+def systematic_resampling(weights, num_samples=None, rng=None):
+    """Systematic resampling.
+
+    A single uniform offset is shared by all equidistant positions of the cumulative weights, which
+    yields the lowest resampling variance among the implemented schemes.
+
+    Args:
+        weights (np.array): Importance weights
+        num_samples (int, opt): Number of resampled indices (default: number of weights)
+        rng (np.random.Generator, opt): Random number generator
+
+    Returns:
+        np.array: Sorted resampled indices
+    """
+    weights = _normalize(weights)
+    num_samples = len(weights) if num_samples is None else num_samples
+    uniforms = (get_random_generator(rng).random() + np.arange(num_samples)) / num_samples
+    return _inverse_cdf_indices(weights, uniforms)
+
+
+def stratified_resampling(weights, num_samples=None, rng=None):
+    """Stratified resampling.
+
+    One uniform position is drawn independently in each of the equidistant strata of [0, 1).
+
+    Args:
+        weights (np.array): Importance weights
+        num_samples (int, opt): Number of resampled indices (default: number of weights)
+        rng (np.random.Generator, opt): Random number generator
+
+    Returns:
+        np.array: Sorted resampled indices
+    """
+    weights = _normalize(weights)
+    num_samples = len(weights) if num_samples is None else num_samples
+    offsets = get_random_generator(rng).random(num_samples)
+    uniforms = (offsets + np.arange(num_samples)) / num_samples
+    return _inverse_cdf_indices(weights, uniforms)
+
+
+def residual_resampling(weights, num_samples=None, rng=None):
+    """Residual resampling.
+
+    Each index is first copied deterministically according to the integer part of its expected
+    number of copies. The remaining indices are drawn by multinomial resampling from the residual
+    weights.
+
+    Args:
+        weights (np.array): Importance weights
+        num_samples (int, opt): Number of resampled indices (default: number of weights)
+        rng (np.random.Generator, opt): Random number generator
+
+    Returns:
+        np.array: Sorted resampled indices
+    """
+    weights = _normalize(weights)
+    num_samples = len(weights) if num_samples is None else num_samples
+    expected_counts = num_samples * weights
+    counts = np.floor(expected_counts).astype(int)
+    num_residual = num_samples - np.sum(counts)
+    if num_residual > 0:
+        counts += get_random_generator(rng).multinomial(
+            num_residual, _normalize(expected_counts - counts)
+        )
+    return np.repeat(np.arange(len(weights)), counts)
+
+
+VALID_RESAMPLING_TYPES = {
+    "multinomial": multinomial_resampling,
+    "systematic": systematic_resampling,
+    "stratified": stratified_resampling,
+    "residual": residual_resampling,
+}
+
+
+def resampling_factory(resampling_type):
+    """Return the resampling function of the specified type.
+
+    Args:
+        resampling_type (str): Type of the resampling scheme. Valid options are "multinomial",
+                               "systematic", "stratified" and "residual".
+
+    Returns:
+        function: Resampling function returning the resampled indices for given weights
+
+    Raises:
+        ValueError: If `resampling_type` is not one of the valid options.
+    """
+    if resampling_type in VALID_RESAMPLING_TYPES:
+        return VALID_RESAMPLING_TYPES[resampling_type]
+
+    raise ValueError(
+        f"Unknown type of resampling: {resampling_type}.\n"
+        f"Valid choices are {set(VALID_RESAMPLING_TYPES)}."
+    )
+
+
 class StaticStateSpaceModel(ssp.StaticModel):
     """Model needed for the particles library implementation of SMC.
 
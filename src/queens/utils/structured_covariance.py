@@ -0,0 +1,399 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Factorized covariance matrices with structure-exploiting operations.
+
+All operations act on row vectors, i.e., arrays of shape (num_vectors, dimension). The
+factorization is computed once at construction, such that solves, log-determinants and products
+with the Cholesky factor do not require any further factorization.
+"""
+
+import abc
+
+import numpy as np
+import scipy.linalg
+
+from queens.utils.numpy_array import at_least_2d
+from queens.utils.numpy_linalg import safe_cholesky
+from queens.utils.valid_options import get_option
+
+
+class Covariance(metaclass=abc.ABCMeta):
+    """Base class for factorized covariance matrices.
+
+    Attributes:
+        dimension (int): Dimension of the covariance matrix
+        logdet (float): Log-determinant of the covariance matrix
+    """
+
+    def __init__(self, dimension, logdet):
+        """Initialize covariance.
+
+        Args:
+            dimension (int): Dimension of the covariance matrix
+            logdet (float): Log-determinant of the covariance matrix
+        """
+        self.dimension = dimension
+        self.logdet = logdet
+
+    @abc.abstractmethod
+    def solve(self, x):
+        """Multiply row vectors with the precision matrix.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+        """
+
+    @abc.abstractmethod
+    def cholesky_matmul(self, x):
+        """Multiply row vectors with the transposed lower Cholesky factor, i.e., x L^T.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+        """
+
+    @abc.abstractmethod
+    def to_dense(self):
+        """Dense covariance matrix."""
+
+    @abc.abstractmethod
+    def cholesky_to_dense(self):
+        """Dense lower Cholesky factor of the covariance matrix."""
+
+    def quadratic_form(self, x):
+        """Evaluate the quadratic form x^T C^-1 x for row vectors.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+
+        Returns:
+            np.ndarray: Quadratic form of each row vector
+        """
+        return np.sum(x * self.solve(x), axis=1)
+
+    def precision_to_dense(self):
+        """Dense precision matrix.
+
+        Returns:
+            np.ndarray: Precision matrix
+        """
+        return self.solve(np.eye(self.dimension))
+
+
+class DenseCovariance(Covariance):
+    """Dense covariance matrix with cached Cholesky factor.
+
+    Attributes:
+        covariance (np.ndarray): Covariance matrix
+        low_chol (np.ndarray): Lower Cholesky factor of the covariance matrix
+    """
+
+    def __init__(self, covariance):
+        """Initialize dense covariance.
+
+        Args:
+            covariance (np.ndarray): Covariance matrix
+        """
+        self.covariance = at_least_2d(np.array(covariance, dtype=float))
+        self.low_chol = safe_cholesky(self.covariance)
+        logdet = 2.0 * np.sum(np.log(np.diag(self.low_chol)))
+        super().__init__(self.covariance.shape[0], logdet)
+
+    def solve(self, x):
+        """Multiply row vectors with the precision matrix.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+
+        Returns:
+            np.ndarray: Row vectors multiplied with the precision matrix
+        """
+        return scipy.linalg.cho_solve((self.low_chol, True), x.T).T
+
+    def cholesky_matmul(self, x):
+        """Multiply row vectors with the transposed lower Cholesky factor.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+
+        Returns:
+            np.ndarray: Product x L^T
+        """
+        return np.dot(x, self.low_chol.T)
+
+    def to_dense(self):
+        """Dense covariance matrix.
+
+        Returns:
+            np.ndarray: Covariance matrix
+        """
+        return self.covariance
+
+    def cholesky_to_dense(self):
+        """Dense lower Cholesky factor of the covariance matrix.
+
+        Returns:
+            np.ndarray: Lower Cholesky factor
+        """
+        return self.low_chol
+
+
+class DiagonalCovariance(Covariance):
+    """Diagonal covariance matrix.
+
+    Attributes:
+        variances (np.ndarray): Diagonal of the covariance matrix
+        std (np.ndarray): Square root of the variances
+    """
+
+    def __init__(self, variances):
+        """Initialize diagonal covariance.
+
+        Args:
+            variances (np.ndarray): Diagonal of the covariance matrix (or the diagonal matrix)
+        """
+        variances = np.array(variances, dtype=float)
+        if variances.ndim == 2:
+            variances = np.diag(variances)
+        self.variances = variances.reshape(-1)
+        if np.any(self.variances <= 0):
+            raise ValueError("The variances of a diagonal covariance have to be positive.")
+        self.std = np.sqrt(self.variances)
+        super().__init__(self.variances.size, np.sum(np.log(self.variances)))
+
+    def solve(self, x):
+        """Multiply row vectors with the precision matrix.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+
+        Returns:
+            np.ndarray: Row vectors multiplied with the precision matrix
+        """
+        return x / self.variances
+
+    def cholesky_matmul(self, x):
+        """Multiply row vectors with the transposed lower Cholesky factor.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+
+        Returns:
+            np.ndarray: Product x L^T
+        """
+        return x * self.std
+
+    def to_dense(self):
+        """Dense covariance matrix.
+
+        Returns:
+            np.ndarray: Covariance matrix
+        """
+        return np.diag(self.variances)
+
+    def cholesky_to_dense(self):
+        """Dense lower Cholesky factor of the covariance matrix.
+
+        Returns:
+            np.ndarray: Lower Cholesky factor
+        """
+        return np.diag(self.std)
+
+
+class BlockDiagonalCovariance(Covariance):
+    """Block-diagonal covariance matrix.
+
+    Attributes:
+        blocks (list): Dense covariances of the diagonal blocks
+        offsets (np.ndarray): Start index of each block
+    """
+
+    def __init__(self, blocks):
+        """Initialize block-diagonal covariance.
+
+        Args:
+            blocks (list): Covariance matrices of the diagonal blocks
+        """
+        self.blocks = [DenseCovariance(block) for block in blocks]
+        dimensions = [block.dimension for block in self.blocks]
+        self.offsets = np.concatenate([[0], np.cumsum(dimensions)])
+        super().__init__(int(self.offsets[-1]), sum(block.logdet for block in self.blocks))
+
+    def _blockwise(self, x, operation):
+        """Apply an operation to each block of row vectors.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+            operation (str): Name of the method of the blocks
+
+        Returns:
+            np.ndarray: Blockwise result
+        """
+        result = np.empty(x.shape)
+        for block, start, end in zip(self.blocks, self.offsets[:-1], self.offsets[1:]):
+            result[:, start:end] = getattr(block, operation)(x[:, start:end])
+        return result
+
+    def solve(self, x):
+        """Multiply row vectors with the precision matrix.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+
+        Returns:
+            np.ndarray: Row vectors multiplied with the precision matrix
+        """
+        return self._blockwise(x, "solve")
+
+    def cholesky_matmul(self, x):
+        """Multiply row vectors with the transposed lower Cholesky factor.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+
+        Returns:
+            np.ndarray: Product x L^T
+        """
+        return self._blockwise(x, "cholesky_matmul")
+
+    def to_dense(self):
+        """Dense covariance matrix.
+
+        Returns:
+            np.ndarray: Covariance matrix
+        """
+        return scipy.linalg.block_diag(*[block.to_dense() for block in self.blocks])
+
+    def cholesky_to_dense(self):
+        """Dense lower Cholesky factor of the covariance matrix.
+
+        Returns:
+            np.ndarray: Lower Cholesky factor
+        """
+        return scipy.linalg.block_diag(*[block.cholesky_to_dense() for block in self.blocks])
+
+
+class KroneckerCovariance(Covariance):
+    """Kronecker product covariance matrix, e.g., of separable space-time processes.
+
+    The covariance matrix is C = C_1 ⊗ C_2 ⊗ ... ⊗ C_k. Vectors are ordered accordingly, i.e., the
+    index of the last factor runs fastest (e.g., space × time: all time steps of the first spatial
+    point, then all time steps of the second spatial point, ...). Operations are applied factor by
+    factor without assembling the Kronecker product.
+
+    Attributes:
+        factors (list): Dense covariances of the factors
+        shape (tuple): Dimensions of the factors
+    """
+
+    def __init__(self, factors):
+        """Initialize Kronecker covariance.
+
+        Args:
+            factors (list): Covariance matrices of the factors
+        """
+        self.factors = [DenseCovariance(factor) for factor in factors]
+        self.shape = tuple(factor.dimension for factor in self.factors)
+        dimension = int(np.prod(self.shape))
+        logdet = sum(dimension / factor.dimension * factor.logdet for factor in self.factors)
+        super().__init__(dimension, logdet)
+
+    def _factorwise(self, x, operation):
+        """Apply an operation of each factor along the corresponding axis.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+            operation (str): Name of the method of the factors
+
+        Returns:
+            np.ndarray: Factorwise result
+        """
+        result = x.reshape(-1, *self.shape)
+        for axis, factor in enumerate(self.factors, start=1):
+            result = np.moveaxis(result, axis, -1)
+            moved_shape = result.shape
+            result = getattr(factor, operation)(result.reshape(-1, factor.dimension))
+            result = np.moveaxis(result.reshape(moved_shape), -1, axis)
+        return result.reshape(-1, self.dimension)
+
+    def solve(self, x):
+        """Multiply row vectors with the precision matrix.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+
+        Returns:
+            np.ndarray: Row vectors multiplied with the precision matrix
+        """
+        return self._factorwise(x, "solve")
+
+    def cholesky_matmul(self, x):
+        """Multiply row vectors with the transposed lower Cholesky factor.
+
+        The Cholesky factor of a Kronecker product is the Kronecker product of the Cholesky
+        factors.
+
+        Args:
+            x (np.ndarray): Row vectors of shape (num_vectors, dimension)
+
+        Returns:
+            np.ndarray: Product x L^T
+        """
+        return self._factorwise(x, "cholesky_matmul")
+
+    def to_dense(self):
+        """Dense covariance matrix.
+
+        Returns:
+            np.ndarray: Covariance matrix
+        """
+        dense = np.ones((1, 1))
+        for factor in self.factors:
+            dense = np.kron(dense, factor.to_dense())
+        return dense
+
+    def cholesky_to_dense(self):
+        """Dense lower Cholesky factor of the covariance matrix.
+
+        Returns:
+            np.ndarray: Lower Cholesky factor
+        """
+        dense = np.ones((1, 1))
+        for factor in self.factors:
+            dense = np.kron(dense, factor.cholesky_to_dense())
+        return dense
+
+
+VALID_TYPES = {
+    "dense": DenseCovariance,
+    "diagonal": DiagonalCovariance,
+    "block_diagonal": BlockDiagonalCovariance,
+    "kronecker": KroneckerCovariance,
+}
+
+
+def create_covariance(covariance, covariance_structure="dense"):
+    """Create a factorized covariance.
+
+    Args:
+        covariance (array_like, list): Covariance matrix for *dense*, variances for *diagonal*,
+                                       list of blocks for *block_diagonal* and list of factors for
+                                       *kronecker* covariances
+        covariance_structure (str): Structure of the covariance matrix
+
+    Returns:
+        Covariance: Factorized covariance
+    """
+    covariance_class = get_option(VALID_TYPES, covariance_structure)
+    return covariance_class(covariance)
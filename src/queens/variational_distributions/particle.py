@@ -147,15 +147,7 @@ class Particle(Variational):
             score_function (np.ndarray): Score functions at the locations x
         """
         self.reconstruct_distribution_parameters(variational_parameters)
-        index = np.array(
-            [(self.particles_obj.sample_space == xi).all(axis=1).nonzero()[0] for xi in x]
-        ).flatten()
-
-        if len(index) != len(x):
-            raise ValueError(
-                f"At least one event is not part of the sample space "
-                f"{self.particles_obj.sample_space}"
-            )
+        index = self.particles_obj.event_index(x)
         sample_scores = np.eye(len(variational_parameters)) - np.exp(
             variational_parameters
         ) / np.sum(np.exp(variational_parameters))
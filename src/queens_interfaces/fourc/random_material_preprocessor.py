@@ -13,8 +13,6 @@
 # see <https://www.gnu.org/licenses/>.
 #
 """4C random material fields preprocessor."""
-from pathlib import Path
-
 import numpy as np
 
 try:
@@ -26,27 +24,29 @@ except ImportError as exc:
     ) from exc
 
 
-def get_node_coordinates(fourc_input, node_ids):
-    """Get node coordinates by id.
+def get_node_coordinates_by_id(fourc_input):
+    """Get the coordinates of all nodes indexed by the node id.
+
+    The *NODE COORDS* section is only traversed once, such that the coordinates of arbitrary
+    nodes can afterwards be looked up by indexing with their ids.
 
     Args:
         fourc_input (FourCInput): 4C input data
-        node_ids (list): List of node ids
 
     Returns:
-        np.ndarray: Nodes coordintes
+        np.ndarray: Node coordinates, where row *i* contains the coordinates of node id *i*. Rows
+        without a corresponding node are *NaN*.
     """
-    n_ids = len(node_ids)
-    coordinates = {i: None for i in node_ids}
-    counter = 0
+    node_ids = []
+    node_coordinates = []
     for node in fourc_input["NODE COORDS"]:
-        if node["id"] in node_ids:
-            coordinates[node["id"]] = node["COORD"]
-            counter += 1
-        if counter == n_ids:
-            break
+        node_ids.append(node["id"])
+        node_coordinates.append(node["COORD"])
 
-    return np.array(list(coordinates.values()))
+    node_coordinates = np.array(node_coordinates, dtype=float)
+    coordinates_by_id = np.full((max(node_ids) + 1, node_coordinates.shape[1]), np.nan)
+    coordinates_by_id[node_ids] = node_coordinates
+    return coordinates_by_id
 
 
 def extract_elements(fourc_input, elements_section, extracting_condition):
@@ -63,14 +63,24 @@ def extract_elements(fourc_input, elements_section, extracting_condition):
         tuple: element ids and representative element location
     """
     element_ids = []
-    representative_locations = []
+    connectivities = []
     for element in fourc_input[elements_section]:
         if extracting_condition(element):
-            nodes_coordinates = get_node_coordinates(fourc_input, element["cell"]["connectivity"])
             element_ids.append(element["id"])
-            representative_locations.append(np.mean(nodes_coordinates, axis=0))
-
-    representative_locations = np.array(representative_locations)
+            connectivities.append(element["cell"]["connectivity"])
+
+    if not element_ids:
+        return element_ids, np.array([])
+
+    # the centroids of all elements are computed at once, elements may have different numbers
+    # of nodes
+    coordinates_by_id = get_node_coordinates_by_id(fourc_input)
+    num_element_nodes = np.array([len(connectivity) for connectivity in connectivities])
+    element_offsets = np.concatenate([[0], np.cumsum(num_element_nodes)[:-1]])
+    nodes_coordinates = coordinates_by_id[np.concatenate(connectivities)]
+    representative_locations = (
+        np.add.reduceat(nodes_coordinates, element_offsets, axis=0) / num_element_nodes[:, None]
+    )
     return element_ids, representative_locations
 
 
@@ -83,12 +93,13 @@ def create_jinja_json_template(parameter_name, element_ids, keys, template_path)
         keys (list): List of parameter key
         template_path (pathlib.Path): Path to create the template
     """
-    template_data = "{" + f'"{parameter_name}"' + ":{"
-    for element_id, key in zip(element_ids, keys):
-        template_data += f'\n"{element_id}": {{{{ {key} }}}},'
-    template_data = template_data[:-1]
-    template_data += "}}"
-    Path(template_path).write_text(template_data)
+    with open(template_path, "w", encoding="utf-8") as template_file:
+        template_file.write("{" + f'"{parameter_name}"' + ":{")
+        separator = ""
+        for element_id, key in zip(element_ids, keys):
+            template_file.write(f'{separator}\n"{element_id}": {{{{ {key} }}}}')
+            separator = ","
+        template_file.write("}}")
 
 
 def extract_by_material_id(material_id):
@@ -123,7 +134,6 @@ def create_random_elemenentwise_material_field(
         dict: with parameter names and element locations
     """
     fourc_input = FourCInput.from_4C_yaml(path_to_template)
-    extract_elements(fourc_input, elements_section, extracting_condition)
 
     element_ids, element_locations = extract_elements(
         fourc_input, elements_section, extracting_condition
@@ -142,3 +142,29 @@ def test_control_variates_with_optimal_num_samples(
     assert res["std_cv_mean_estimator"] == pytest.approx(0.03117012579709094)
     assert res["cv_influence_coeff"] == pytest.approx(1.2566383731008297)
     assert res["sample_ratio"] == pytest.approx(338316.21441286104)
+
+
+def test_control_variates_with_randomized_quasi_monte_carlo(
+    global_settings, parameters, model_main, control_variate
+):
+    """Test function for control variates with randomized quasi-Monte Carlo samples."""
+    # Set up iterator.
+    iterator = ControlVariates(
+        model=model_main,
+        control_variate=control_variate,
+        parameters=parameters,
+        global_settings=global_settings,
+        seed=42,
+        num_samples=128,
+        num_samples_cv=1024,
+        qmc_sequence="sobol",
+        num_randomizations=8,
+    )
+
+    # Run iterator and load results.
+    run_iterator(iterator=iterator, global_settings=global_settings)
+    res = load_result(global_settings.result_file(".pickle"))
+
+    # Test outputs.
+    assert res["mean"] == pytest.approx(77.0, abs=1.0)
+    assert res["std_rqmc"] < res["std"]
@@ -115,7 +115,7 @@ def test_mlmc_borehole_bootstrap(global_settings, parameters, models):
     assert result["mean_estimators"] == pytest.approx([60.4546131, 16.06763486])
     assert result["var_estimators"] == pytest.approx([1266.89995688, 78.42313115])
     assert result["num_samples"] == pytest.approx([1000, 100])
-    assert result["std_bootstrap"] == pytest.approx(1.4177144502392238)
+    assert result["std_bootstrap"] == pytest.approx(1.456750890049108)
 
 
 def test_mlmc_borehole_optimal_num_samples(global_settings, parameters, models):
@@ -142,3 +142,25 @@ def test_mlmc_borehole_optimal_num_samples(global_settings, parameters, models):
     assert result["mean_estimators"] == pytest.approx([61.89127335, 16.06763486])
     assert result["var_estimators"] == pytest.approx([1290.91108238, 78.42313115])
     assert result["num_samples"] == pytest.approx([12716, 100])
+
+
+def test_mlmc_borehole_target_rmse(global_settings, parameters, models):
+    """Test case for the iterator in continuation mode."""
+    # Set up iterator.
+    iterator = MLMC(
+        seed=42,
+        num_samples=[1000, 100],
+        models=models,
+        parameters=parameters,
+        global_settings=global_settings,
+        target_rmse=0.5,
+        cost_models=[1, 1000],
+    )
+
+    # Run iterator and load results.
+    run_iterator(iterator=iterator, global_settings=global_settings)
+    result = load_result(path_to_result_file=global_settings.result_file(".pickle"))
+
+    # Test outputs.
+    assert result["std"] <= 0.5
+    assert result["num_samples"][0] > 1000
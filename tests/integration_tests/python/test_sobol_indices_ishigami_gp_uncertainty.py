@@ -262,3 +262,63 @@ def test_sobol_indices_ishigami_gp_mean(global_settings):
 
     np.testing.assert_allclose(results["first_order"].values, expected_s1, atol=1e-05)
     np.testing.assert_allclose(results["total_order"].values, expected_st, atol=1e-05)
+
+
+def test_sobol_indices_ishigami_gp_pathwise(global_settings):
+    """Test case for Sobol indices based on pathwise GP realizations."""
+    # Parameters
+    x1 = Uniform(lower_bound=-3.14159265359, upper_bound=3.14159265359)
+    x2 = Uniform(lower_bound=-3.14159265359, upper_bound=3.14159265359)
+    x3 = Uniform(lower_bound=-3.14159265359, upper_bound=3.14159265359)
+    parameters = Parameters(x1=x1, x2=x2, x3=x3)
+
+    # Setup iterator
+    driver = Function(parameters=parameters, function="ishigami90")
+    scheduler = Pool(experiment_name=global_settings.experiment_name)
+    simulation_model = Simulation(scheduler=scheduler, driver=driver)
+    training_iterator = LatinHypercubeSampling(
+        seed=42,
+        num_samples=100,
+        num_iterations=10,
+        model=simulation_model,
+        parameters=parameters,
+        global_settings=global_settings,
+    )
+    gpflow_regression_model = GaussianProcess(
+        train_likelihood_variance=False,
+        number_restarts=5,
+        number_training_iterations=1000,
+        dimension_lengthscales=3,
+        training_iterator=training_iterator,
+    )
+    iterator = SobolIndexGPUncertainty(
+        seed_monte_carlo=42,
+        number_monte_carlo_samples=1000,
+        number_gp_realizations=50,
+        number_bootstrap_samples=2,
+        sampling_approach="pseudo_random",
+        second_order=False,
+        num_procs=2,
+        first_order_estimator="Janon2014",
+        posterior_sampling="pathwise",
+        seed_posterior_samples=42,
+        prediction_chunk_size=500,
+        result_description={"write_results": True},
+        model=gpflow_regression_model,
+        parameters=parameters,
+        global_settings=global_settings,
+    )
+
+    # Actual analysis
+    run_iterator(iterator, global_settings=global_settings)
+
+    # Load results
+    results = load_result(global_settings.result_file(".pickle"))
+
+    # the mean over the realizations is close to the estimate based on the GP mean
+    np.testing.assert_allclose(
+        results["first_order"].values[:, 0], [0.28879163, 0.45303182, 0.07601656], atol=0.05
+    )
+    np.testing.assert_allclose(
+        results["total_order"].values[:, 0], [0.47333086, 0.48403078, 0.23926036], atol=0.05
+    )
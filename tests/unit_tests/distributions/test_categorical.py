@@ -71,16 +71,15 @@ def test_logpmf(reference_distribution_data, categorical_distribution):
 def test_draw(mocker, reference_distribution_data, categorical_distribution):
     """Test drawing."""
     _, categories, _ = reference_distribution_data
-    first_category_samples = 2
-    second_category_samples = 3
     mocker.patch(
-        "queens.distributions.categorical.np.random.multinomial",
-        return_value=np.array([first_category_samples, second_category_samples]),
+        "queens.utils.alias_table.AliasTable.draw",
+        return_value=np.array([0, 1, 1, 0, 1]),
     )
-    mocker.patch(
-        "queens.distributions.categorical.np.random.shuffle",
-    )
-    reference_samples = [categories[0]] * first_category_samples
-    reference_samples.extend([categories[1]] * second_category_samples)
-    reference_samples = np.array(reference_samples, dtype=object).reshape(-1, 1)
+    reference_samples = np.array(categories, dtype=object)[[0, 1, 1, 0, 1]].reshape(-1, 1)
     np.testing.assert_equal(reference_samples, categorical_distribution.draw(5))
+
+
+def test_pmf_failure_unknown_category(categorical_distribution):
+    """Test if unknown categories lead to errors."""
+    with pytest.raises(ValueError, match="At least one event is not part of the categories"):
+        categorical_distribution.pdf(np.array([["b"]], dtype=object))
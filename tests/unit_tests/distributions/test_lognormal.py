@@ -132,7 +132,7 @@ def test_cdf_lognormal_1d(lognormal_1d, mean_1d, covariance_1d, sample_pos_1d):
 
 def test_draw_lognormal_1d(lognormal_1d, mean_1d, covariance_1d, uncorrelated_vector_1d, mocker):
     """Test the draw method of lognormal distribution."""
-    mocker.patch("numpy.random.randn", return_value=uncorrelated_vector_1d)
+    mocker.patch("numpy.random.standard_normal", return_value=uncorrelated_vector_1d)
     draw = lognormal_1d.draw()
     ref_sol = np.exp(mean_1d + covariance_1d ** (1 / 2) * uncorrelated_vector_1d.T).reshape(-1, 1)
     np.testing.assert_equal(draw, ref_sol)
@@ -218,7 +218,7 @@ def test_cdf_lognormal_2d(lognormal_2d, mean_2d, covariance_2d, sample_pos_2d):
 
 def test_draw_lognormal_2d(lognormal_2d, mean_2d, covariance_2d, uncorrelated_vector_2d, mocker):
     """Test the draw method of lognormal distribution."""
-    mocker.patch("numpy.random.randn", return_value=uncorrelated_vector_2d)
+    mocker.patch("numpy.random.standard_normal", return_value=uncorrelated_vector_2d)
     draw = lognormal_2d.draw()
     ref_sol = np.exp(mean_2d + np.dot(np.sqrt(covariance_2d), uncorrelated_vector_2d).T)
     np.testing.assert_equal(draw, ref_sol)
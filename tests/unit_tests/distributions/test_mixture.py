@@ -171,3 +171,33 @@ def test_ppf(mixture_model):
     """Test PPF."""
     with pytest.raises(NotImplementedError, match="PPF not available"):
         mixture_model.ppf(None)
+
+
+def test_stacked_normal_components(mixture_model, reference_mixture_model_data):
+    """Test the stacked evaluation against the evaluation component by component."""
+    weights, normal0, normal1 = reference_mixture_model_data
+    generic_mixture_model = Mixture(weights, (normal0, normal1))
+    generic_mixture_model.stacked_normal_components = None
+    sample_location = np.random.default_rng(0).normal(size=(10, normal0.dimension))
+
+    assert mixture_model.stacked_normal_components is not None
+    np.testing.assert_allclose(
+        mixture_model.logpdf(sample_location), generic_mixture_model.logpdf(sample_location)
+    )
+    np.testing.assert_allclose(
+        mixture_model.grad_logpdf(sample_location),
+        generic_mixture_model.grad_logpdf(sample_location),
+    )
+    np.testing.assert_allclose(
+        mixture_model.responsibilities(sample_location),
+        generic_mixture_model.responsibilities(sample_location),
+    )
+
+
+def test_logpdf_far_from_components(mixture_model, reference_mixture_model_data):
+    """Test that the log pdf and responsibilities are stable far from all components."""
+    _, normal0, _ = reference_mixture_model_data
+    sample_location = 1e3 * np.ones((2, normal0.dimension))
+
+    assert np.all(np.isfinite(mixture_model.logpdf(sample_location)))
+    np.testing.assert_allclose(np.sum(mixture_model.responsibilities(sample_location), axis=1), 1)
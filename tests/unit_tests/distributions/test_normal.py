@@ -17,6 +17,7 @@
 import jax.numpy as jnp
 import numpy as np
 import pytest
+import scipy.linalg
 import scipy.stats
 from jax import grad
 
@@ -129,7 +130,7 @@ def test_cdf_normal_1d(normal_1d, mean_1d, covariance_1d, sample_pos_1d):
 
 def test_draw_normal_1d(normal_1d, mean_1d, covariance_1d, uncorrelated_vector_1d, mocker):
     """Test the draw method of normal distribution."""
-    mocker.patch("numpy.random.randn", return_value=uncorrelated_vector_1d)
+    mocker.patch("numpy.random.standard_normal", return_value=uncorrelated_vector_1d)
     draw = normal_1d.draw()
     ref_sol = mean_1d + covariance_1d ** (1 / 2) * uncorrelated_vector_1d.T
     np.testing.assert_equal(draw, ref_sol)
@@ -189,7 +190,7 @@ def test_cdf_normal_3d(normal_3d, mean_3d, covariance_3d, sample_pos_3d):
 
 def test_draw_normal_3d(normal_3d, mean_3d, low_chol_3d, uncorrelated_vector_3d, mocker):
     """Test the draw method of normal distribution."""
-    mocker.patch("numpy.random.randn", return_value=uncorrelated_vector_3d)
+    mocker.patch("numpy.random.standard_normal", return_value=uncorrelated_vector_3d)
     draw = normal_3d.draw()
     ref_sol = mean_3d + np.dot(low_chol_3d, uncorrelated_vector_3d).T
     np.testing.assert_equal(draw, ref_sol)
@@ -250,6 +251,67 @@ def test_init_normal_not_symmetric(mean_3d):
         Normal(mean=mean_3d, covariance=covariance)
 
 
+@pytest.fixture(
+    name="structured_covariance",
+    params=[
+        ("diagonal", [0.5, 2.0, 1.0, 3.0]),
+        ("block_diagonal", [[[2.0, 0.5], [0.5, 1.0]], [[1.0]], [[3.0]]]),
+        ("kronecker", [[[2.0, 0.5], [0.5, 1.0]], [[1.0, -0.3], [-0.3, 0.5]]]),
+    ],
+)
+def fixture_structured_covariance(request):
+    """Covariance structure, its representation and the dense covariance matrix."""
+    covariance_structure, covariance = request.param
+    if covariance_structure == "diagonal":
+        dense_covariance = np.diag(covariance)
+    elif covariance_structure == "block_diagonal":
+        dense_covariance = scipy.linalg.block_diag(*covariance)
+    else:
+        dense_covariance = np.kron(*covariance)
+    return covariance_structure, covariance, dense_covariance
+
+
+def test_structured_covariance(structured_covariance):
+    """Test structured covariances against the dense covariance matrix."""
+    covariance_structure, covariance, dense_covariance = structured_covariance
+    mean = np.array([0.0, 1.0, -1.0, 2.0])
+    normal = Normal(mean, covariance, covariance_structure=covariance_structure)
+    normal_dense = Normal(mean, dense_covariance)
+    samples = np.random.default_rng(0).normal(size=(5, 4))
+
+    assert normal.structured_covariance is covariance
+    np.testing.assert_allclose(normal.covariance, dense_covariance)
+    np.testing.assert_allclose(normal.logpdf(samples), normal_dense.logpdf(samples))
+    np.testing.assert_allclose(normal.grad_logpdf(samples), normal_dense.grad_logpdf(samples))
+    np.testing.assert_allclose(normal.precision, np.linalg.inv(dense_covariance), atol=1e-12)
+    np.testing.assert_allclose(normal.low_chol, np.linalg.cholesky(dense_covariance), atol=1e-12)
+
+    np.random.seed(42)
+    draws = normal.draw(3)
+    np.random.seed(42)
+    np.testing.assert_allclose(draws, normal_dense.draw(3))
+
+    # scale the covariance matrix by two
+    if covariance_structure == "kronecker":
+        scaled_covariance = [2.0 * np.array(covariance[0]), covariance[1]]
+    else:
+        scaled_covariance = [2.0 * np.array(entry) for entry in covariance]
+    normal.update_covariance(scaled_covariance)
+    normal_dense.update_covariance(2.0 * dense_covariance)
+    np.testing.assert_allclose(normal.covariance, 2.0 * dense_covariance)
+    np.testing.assert_allclose(normal.logpdf(samples), normal_dense.logpdf(samples))
+    np.testing.assert_allclose(normal.grad_logpdf(samples), normal_dense.grad_logpdf(samples))
+
+
+def test_update_covariance_normal(normal_3d, covariance_3d, sample_pos_3d):
+    """Test that the cached factorization is updated."""
+    normal = Normal(mean=normal_3d.mean, covariance=np.eye(3))
+    normal.update_covariance(covariance_3d)
+    np.testing.assert_allclose(normal.logpdf(sample_pos_3d), normal_3d.logpdf(sample_pos_3d))
+    np.testing.assert_allclose(normal.precision, normal_3d.precision)
+    assert normal.logpdf_const == pytest.approx(normal_3d.logpdf_const)
+
+
 def logpdf(x, logpdf_const, mean, precision):
     """Log pdf of normal distribution.
 
@@ -137,23 +137,32 @@ def test_init_failure_mismatching_dimension():
 def test_draw(mocker, reference_data, distribution):
     """Test draw."""
     _, _, reference_sample_space, _, _ = reference_data
-    first_sample_event = 2
-    second_sample_event = 3
-    third_sample_event = 1
     mocker.patch(
-        "queens.distributions.categorical.np.random.multinomial",
-        return_value=np.array([first_sample_event, second_sample_event, third_sample_event]),
+        "queens.utils.alias_table.AliasTable.draw",
+        return_value=np.array([0, 0, 1, 1, 1, 2]),
     )
-    mocker.patch(
-        "queens.distributions.categorical.np.random.shuffle",
-    )
-    reference_samples = [reference_sample_space[0]] * first_sample_event
-    reference_samples.extend([reference_sample_space[1]] * second_sample_event)
-    reference_samples.extend([reference_sample_space[2]] * third_sample_event)
-    reference_samples = np.array(reference_samples, dtype=object).reshape(-1, 1)
+    reference_samples = np.array(reference_sample_space)[[0, 0, 1, 1, 1, 2]]
     np.testing.assert_equal(reference_samples, distribution.draw(6))
 
 
+def test_draw_frequencies(reference_data, distribution):
+    """Test the relative frequencies of the drawn events."""
+    _, reference_probabilities, reference_sample_space, _, _ = reference_data
+    np.random.seed(1)
+    num_draws = 100_000
+    samples = distribution.draw(num_draws)
+    assert samples.shape == (num_draws, len(reference_sample_space[0]))
+    frequencies = np.bincount(distribution.event_index(samples), minlength=4) / num_draws
+    np.testing.assert_allclose(frequencies, reference_probabilities, atol=1e-2)
+
+
+def test_pdf_failure_unknown_event(reference_data, distribution):
+    """Test if events outside of the sample space lead to errors."""
+    _, _, _, reference_dimension, _ = reference_data
+    with pytest.raises(ValueError, match="At least one event is not part of the sample space"):
+        distribution.pdf(np.full((1, reference_dimension), 7))
+
+
 def test_pdf(reference_data, distribution):
     """Test pdf."""
     _, reference_probabilities, reference_sample_space, _, _ = reference_data
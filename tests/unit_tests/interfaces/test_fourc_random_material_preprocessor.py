@@ -0,0 +1,76 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the 4C random material preprocessor."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("fourcipp")
+
+# pylint: disable=wrong-import-position
+from queens_interfaces.fourc.random_material_preprocessor import (
+    extract_by_material_id,
+    extract_elements,
+    get_node_coordinates_by_id,
+)
+
+
+@pytest.fixture(name="fourc_input")
+def fixture_fourc_input():
+    """Minimal 4C input with unordered node ids and mixed element types."""
+    return {
+        "NODE COORDS": [
+            {"id": 3, "COORD": [1.0, 1.0]},
+            {"id": 1, "COORD": [0.0, 0.0]},
+            {"id": 2, "COORD": [1.0, 0.0]},
+            {"id": 5, "COORD": [2.0, 0.0]},
+            {"id": 4, "COORD": [0.0, 1.0]},
+        ],
+        "STRUCTURE ELEMENTS": [
+            {"id": 1, "cell": {"connectivity": [1, 2, 3, 4]}, "data": {"MAT": 1}},
+            {"id": 2, "cell": {"connectivity": [2, 5, 3]}, "data": {"MAT": 2}},
+            {"id": 3, "cell": {"connectivity": [5, 3, 2]}, "data": {"MAT": 1}},
+        ],
+    }
+
+
+def test_get_node_coordinates_by_id(fourc_input):
+    """Test that the node coordinates are indexed by the node id."""
+    coordinates_by_id = get_node_coordinates_by_id(fourc_input)
+
+    assert coordinates_by_id.shape == (6, 2)
+    assert np.all(np.isnan(coordinates_by_id[0]))
+    for node in fourc_input["NODE COORDS"]:
+        np.testing.assert_array_equal(coordinates_by_id[node["id"]], node["COORD"])
+
+
+def test_extract_elements(fourc_input):
+    """Test the centroids of elements with different numbers of nodes."""
+    element_ids, locations = extract_elements(
+        fourc_input, "STRUCTURE ELEMENTS", extract_by_material_id(1)
+    )
+
+    assert element_ids == [1, 3]
+    np.testing.assert_allclose(locations, [[0.5, 0.5], [4.0 / 3.0, 1.0 / 3.0]])
+
+
+def test_extract_elements_without_match(fourc_input):
+    """Test that no locations are returned if no element matches."""
+    element_ids, locations = extract_elements(
+        fourc_input, "STRUCTURE ELEMENTS", extract_by_material_id(3)
+    )
+
+    assert element_ids == []
+    assert locations.size == 0
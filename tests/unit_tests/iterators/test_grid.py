@@ -203,7 +203,7 @@ def test_pre_run_one(
         grid_design=grid_dict_one,
     )
     grid_iterator.pre_run()
-    np.testing.assert_array_equal(grid_iterator.samples, expected_samples_one)
+    np.testing.assert_array_equal(grid_iterator.grid_points(), expected_samples_one)
 
 
 def test_pre_run_two(
@@ -222,7 +222,7 @@ def test_pre_run_two(
         grid_design=grid_dict_two,
     )
     grid_iterator.pre_run()
-    np.testing.assert_array_equal(grid_iterator.samples, expected_samples_two)
+    np.testing.assert_array_equal(grid_iterator.grid_points(), expected_samples_two)
 
 
 def test_pre_run_mixed_data_types(
@@ -242,10 +242,10 @@ def test_pre_run_mixed_data_types(
     )
     grid_iterator.pre_run()
 
-    # assert if the columns possess the required datatypes and if the
-    # sample arrays match
-    assert grid_iterator.samples.dtype == object
-    np.testing.assert_array_equal(grid_iterator.samples, expected_samples_mixed_datatypes)
+    # assert that the grid points are floats and that integer axes hold integer values
+    samples = grid_iterator.grid_points()
+    assert samples.dtype == float
+    np.testing.assert_array_equal(samples, expected_samples_mixed_datatypes)
 
 
 def test_pre_run_three(
@@ -265,15 +265,15 @@ def test_pre_run_three(
         grid_design=grid_dict_three,
     )
     grid_iterator.pre_run()
-    np.testing.assert_array_equal(grid_iterator.samples, expected_samples_three)
+    np.testing.assert_array_equal(grid_iterator.grid_points(), expected_samples_three)
 
 
 def test_core_run(mocker, default_grid_iterator, expected_samples_two):
     """Test the core_run method of the Grid class."""
-    mocker.patch("queens.models.simulation.Simulation.evaluate", return_value=2)
-    default_grid_iterator.samples = expected_samples_two
+    mp = mocker.patch("queens.models.simulation.Simulation.evaluate", return_value=2)
+    default_grid_iterator.pre_run()
     default_grid_iterator.core_run()
-    np.testing.assert_array_equal(default_grid_iterator.samples, expected_samples_two)
+    np.testing.assert_array_equal(mp.call_args[0][0], expected_samples_two)
     assert default_grid_iterator.output == 2
 
 
@@ -286,6 +286,49 @@ def test_post_run(mocker, default_grid_iterator):
     mp1 = mocker.patch("queens.iterators.grid.write_results", return_value=None)
     default_grid_iterator.visualization = visualization
 
+    default_grid_iterator.pre_run()
     default_grid_iterator.post_run()
     mp1.assert_called_once()
     mp2.assert_called_once()
+
+
+def test_chunked_core_run_with_resume(
+    grid_dict_three, parameters_three, expected_samples_three, global_settings
+):
+    """Test the chunked evaluation and the resume from the written chunks."""
+
+    def evaluate(samples):
+        # simulation models without gradients return an array of None
+        return {
+            "result": np.sum(samples, axis=1, keepdims=True),
+            "gradient": np.full(len(samples), None),
+        }
+
+    model = Mock()
+    model.evaluate = Mock(side_effect=evaluate)
+    grid_iterator = Grid(
+        model=model,
+        parameters=parameters_three,
+        global_settings=global_settings,
+        result_description={},
+        grid_design=grid_dict_three,
+        chunk_size=40,
+    )
+    grid_iterator.pre_run()
+    grid_iterator.core_run()
+
+    assert model.evaluate.call_count == 4
+    np.testing.assert_array_equal(
+        grid_iterator.output["result"], evaluate(expected_samples_three)["result"]
+    )
+
+    # resume after the results of the last chunk got lost
+    global_settings.result_file(".npz", suffix="_grid_chunk_3").unlink()
+    grid_iterator.resume = True
+    grid_iterator.core_run()
+
+    assert model.evaluate.call_count == 5
+    np.testing.assert_array_equal(model.evaluate.call_args[0][0], expected_samples_three[120:])
+    np.testing.assert_array_equal(
+        grid_iterator.output["result"], evaluate(expected_samples_three)["result"]
+    )
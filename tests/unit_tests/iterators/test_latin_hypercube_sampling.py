@@ -77,3 +77,36 @@ def test_correct_results(default_lhs_iterator, ref_result_iterator):
     np.testing.assert_allclose(
         default_lhs_iterator.output["result"][0:10], ref_result_iterator, 1e-09, 1e-09
     )
+
+
+def test_native_generator(default_lhs_iterator):
+    """Test that the native generator creates a reproducible Latin hypercube."""
+    default_lhs_iterator.generator = "native"
+    default_lhs_iterator.pre_run()
+    samples = default_lhs_iterator.samples
+
+    default_lhs_iterator.pre_run()
+    np.testing.assert_array_equal(default_lhs_iterator.samples, samples)
+
+    # one sample per cell of each dimension
+    quantiles = np.column_stack(
+        [
+            parameter.cdf(samples[:, i])
+            for i, parameter in enumerate(default_lhs_iterator.parameters.to_list())
+        ]
+    )
+    for column in (quantiles * 100).astype(int).T:
+        np.testing.assert_array_equal(np.sort(column), np.arange(100))
+
+
+def test_invalid_generator(global_settings, default_simulation_model, default_parameters_mixed):
+    """Test that an unknown generator raises an error."""
+    with pytest.raises(ValueError, match="Unknown generator"):
+        LatinHypercubeSampling(
+            model=default_simulation_model,
+            parameters=default_parameters_mixed,
+            global_settings=global_settings,
+            seed=42,
+            num_samples=10,
+            generator="unknown",
+        )
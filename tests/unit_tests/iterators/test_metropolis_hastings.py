@@ -0,0 +1,165 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the Metropolis-Hastings iterator."""
+
+import numpy as np
+import pytest
+from mock import Mock
+
+from queens.distributions.normal import Normal
+from queens.iterators.metropolis_hastings import MetropolisHastings
+from queens.models.surrogates._surrogate import Surrogate
+from queens.parameters.parameters import Parameters
+
+
+class QuadraticSurrogate(Surrogate):
+    """Quadratic least-squares fit of a one-dimensional function."""
+
+    def __init__(self):
+        """Initialize the surrogate."""
+        super().__init__()
+        self.coefficients = None
+
+    def grad(self, samples, upstream_gradient):
+        """Gradient is not needed."""
+        raise NotImplementedError
+
+    def predict(self, x_test, support="y"):
+        """Evaluate the fitted polynomial."""
+        return {"result": np.polyval(self.coefficients, x_test[:, 0])}
+
+    def setup(self, x_train, y_train):
+        """Store the training data."""
+        self.x_train = x_train
+        self.y_train = y_train
+
+    def train(self):
+        """Fit the polynomial."""
+        self.coefficients = np.polyfit(self.x_train[:, 0], self.y_train[:, 0], deg=2)
+
+
+def gaussian_log_likelihood(samples):
+    """Gaussian log-likelihood with mean 0 and variance 1."""
+    return {"result": -0.5 * samples[:, 0] ** 2}
+
+
+@pytest.fixture(name="delayed_acceptance_iterator")
+def fixture_delayed_acceptance_iterator(global_settings):
+    """Metropolis-Hastings iterator with delayed acceptance."""
+    model = Mock()
+    model.evaluate.side_effect = gaussian_log_likelihood
+    return MetropolisHastings(
+        model=model,
+        parameters=Parameters(x=Normal(mean=2.0, covariance=1.0)),
+        global_settings=global_settings,
+        result_description=None,
+        proposal_distribution=Normal(mean=0.0, covariance=1.0),
+        num_samples=4000,
+        seed=42,
+        num_burn_in=100,
+        num_chains=2,
+        surrogate=QuadraticSurrogate(),
+        surrogate_update_interval=50,
+    )
+
+
+def test_delayed_acceptance(delayed_acceptance_iterator):
+    """Test delayed acceptance against the analytical posterior N(1, 0.5)."""
+    delayed_acceptance_iterator.pre_run()
+    delayed_acceptance_iterator.core_run()
+    samples = delayed_acceptance_iterator.chains[delayed_acceptance_iterator.num_burn_in + 1 :]
+
+    assert delayed_acceptance_iterator.surrogate.is_trained
+    np.testing.assert_allclose(np.mean(samples), 1.0, atol=0.1)
+    np.testing.assert_allclose(np.var(samples), 0.5, atol=0.1)
+
+    # proposals rejected by the surrogate are not evaluated by the model
+    num_proposals = 2 * (delayed_acceptance_iterator.tot_num_samples - 1)
+    assert delayed_acceptance_iterator.num_model_evaluations < 0.8 * num_proposals
+
+
+def test_delayed_acceptance_exact_surrogate(delayed_acceptance_iterator):
+    """Test that the second stage accepts all proposals for an exact surrogate."""
+    delayed_acceptance_iterator.pre_run()
+    for step_id in range(1, 101):
+        delayed_acceptance_iterator.do_mh_step(step_id)
+    delayed_acceptance_iterator.accepted = np.zeros(2)
+    num_model_evaluations = delayed_acceptance_iterator.num_model_evaluations
+
+    for step_id in range(101, 201):
+        delayed_acceptance_iterator.do_mh_step(step_id)
+
+    np.testing.assert_array_equal(
+        np.sum(delayed_acceptance_iterator.accepted),
+        delayed_acceptance_iterator.num_model_evaluations - num_model_evaluations,
+    )
+
+
+def test_independent_streams(global_settings):
+    """Test that the chains with independent streams do not depend on the global random state."""
+    chains = []
+    for global_seed in [0, 1]:
+        model = Mock()
+        model.evaluate.side_effect = gaussian_log_likelihood
+        iterator = MetropolisHastings(
+            model=model,
+            parameters=Parameters(x=Normal(mean=2.0, covariance=1.0)),
+            global_settings=global_settings,
+            result_description=None,
+            proposal_distribution=Normal(mean=0.0, covariance=1.0),
+            num_samples=50,
+            seed=42,
+            num_chains=2,
+            independent_streams=True,
+        )
+        iterator.pre_run()
+        np.random.seed(global_seed)
+        iterator.core_run()
+        chains.append(iterator.chains)
+
+    np.testing.assert_array_equal(chains[0], chains[1])
+
+
+def test_surrogate_adaptation_cutoff(delayed_acceptance_iterator, mocker):
+    """Test the bounded training data and the freezing of the surrogate after the burn-in."""
+    delayed_acceptance_iterator.num_samples = 200
+    delayed_acceptance_iterator.max_surrogate_training_size = 60
+    spy = mocker.spy(delayed_acceptance_iterator.surrogate, "setup")
+
+    delayed_acceptance_iterator.pre_run()
+    delayed_acceptance_iterator.core_run()
+
+    # the surrogate is only trained during the burn-in on at most 60 evaluations
+    assert spy.call_count == 2
+    assert len(spy.call_args.args[0]) == 60
+    assert delayed_acceptance_iterator.surrogate_frozen
+    assert not delayed_acceptance_iterator.surrogate_x_train
+
+
+def test_surrogate_never_trained(global_settings):
+    """Test that a frozen surrogate requires a burn-in to be trained."""
+    with pytest.raises(ValueError, match="never be trained"):
+        MetropolisHastings(
+            model=Mock(),
+            parameters=Parameters(x=Normal(mean=2.0, covariance=1.0)),
+            global_settings=global_settings,
+            result_description=None,
+            proposal_distribution=Normal(mean=0.0, covariance=1.0),
+            num_samples=100,
+            seed=42,
+            num_burn_in=5,
+            surrogate=QuadraticSurrogate(),
+            surrogate_update_interval=10,
+        )
@@ -0,0 +1,149 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the multilevel Monte Carlo iterator."""
+
+import numpy as np
+import pytest
+import yaml
+
+from queens.distributions.uniform import Uniform
+from queens.drivers.function import Function
+from queens.iterators.mlmc import MLMC
+from queens.models.simulation import Simulation
+from queens.parameters.parameters import Parameters
+from queens.schedulers.pool import Pool
+
+
+def level_0(x1, x2):
+    """Coarse model."""
+    return x1 + x2
+
+
+def level_1(x1, x2):
+    """Fine model."""
+    return x1 + x2 + 0.1 * np.sin(10 * x1 * x2)
+
+
+@pytest.fixture(name="parameters")
+def fixture_parameters():
+    """Parameters of the models."""
+    return Parameters(x1=Uniform(lower_bound=0, upper_bound=1), x2=Uniform(0, 1))
+
+
+@pytest.fixture(name="models")
+def fixture_models(parameters, global_settings):
+    """Models of two levels sharing a scheduler."""
+    scheduler = Pool(experiment_name=global_settings.experiment_name, verbose=False)
+    return [
+        Simulation(scheduler=scheduler, driver=Function(parameters=parameters, function=level))
+        for level in (level_0, level_1)
+    ]
+
+
+def test_concurrent_evaluation_of_estimators(models, parameters, global_settings):
+    """Test the concurrent evaluation against the level by level evaluation."""
+    iterator = MLMC(models, parameters, global_settings, seed=1, num_samples=[20, 5])
+    iterator.pre_run()
+    results_estimators = iterator._evaluate_estimators(iterator.samples)
+
+    samples_0, samples_1 = iterator.samples
+    np.testing.assert_allclose(results_estimators[0], models[0].evaluate(samples_0)["result"])
+    np.testing.assert_allclose(
+        results_estimators[1],
+        models[1].evaluate(samples_1)["result"] - models[0].evaluate(samples_1)["result"],
+    )
+    # the coarse model evaluates the samples of both estimators in one batch
+    assert len(models[0].job_ids) == 25
+
+
+def test_continuation_reaches_target_rmse(models, parameters, global_settings):
+    """Test that the continuation mode refines until the target RMSE is reached."""
+    iterator = MLMC(
+        models,
+        parameters,
+        global_settings,
+        seed=1,
+        num_samples=[20, 5],
+        cost_models=[1.0, 10.0],
+        target_rmse=0.02,
+    )
+    iterator.pre_run()
+    iterator.core_run()
+
+    assert iterator.output["std"] <= 0.02
+    assert iterator.num_samples[0] > 20
+    assert iterator.cost_estimators == [1.0, 11.0]
+
+
+def test_continuation_uses_measured_costs(models, parameters, global_settings):
+    """Test that the run times from the job metadata replace the provided costs."""
+    iterator = MLMC(models, parameters, global_settings, seed=1, num_samples=[4, 2])
+    experiment_dir = models[0].scheduler.experiment_dir
+    for job_id in range(10):
+        (experiment_dir / str(job_id)).mkdir()
+        times = {"run_jobscript": {"time": 1.0 + 3.0 * (job_id >= 6)}, "data_processing": {}}
+        (experiment_dir / str(job_id) / "metadata.yaml").write_text(
+            yaml.safe_dump({"times": times})
+        )
+
+    iterator.pre_run()
+    iterator._evaluate_estimators(iterator.samples)
+
+    assert iterator._measured_cost_models() == [1.0, 4.0]
+
+
+def test_continuation_without_costs(models, parameters, global_settings):
+    """Test the error if no costs are available."""
+    iterator = MLMC(models, parameters, global_settings, seed=1, num_samples=[4, 2])
+    with pytest.raises(ValueError, match="No run times"):
+        iterator._measured_cost_models()
+
+
+def test_optimal_num_samples_and_target_rmse(models, parameters, global_settings):
+    """Test that the two modes exclude each other."""
+    with pytest.raises(ValueError, match="either"):
+        MLMC(
+            models,
+            parameters,
+            global_settings,
+            seed=1,
+            num_samples=[4, 2],
+            cost_models=[1.0, 2.0],
+            use_optimal_num_samples=True,
+            target_rmse=0.1,
+        )
+
+
+def test_randomized_quasi_monte_carlo(models, parameters, global_settings):
+    """Test the MLMC estimator with randomized quasi-Monte Carlo samples."""
+    iterator = MLMC(
+        models,
+        parameters,
+        global_settings,
+        seed=1,
+        num_samples=[64, 16],
+        cost_models=[1.0, 10.0],
+        use_optimal_num_samples=True,
+        qmc_sequence="sobol",
+        num_randomizations=4,
+    )
+    iterator.pre_run()
+    iterator.core_run()
+
+    assert all(num_samples % 4 == 0 for num_samples in iterator.num_samples)
+    assert [len(ids) for ids in iterator.randomization_ids] == list(iterator.num_samples)
+    # reference: 1 + 0.1 * E[sin(10 x1 x2)]
+    assert iterator.output["mean"] == pytest.approx(1.0293, abs=0.05)
+    assert iterator.output["std_rqmc"] > 0
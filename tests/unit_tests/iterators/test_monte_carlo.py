@@ -18,6 +18,7 @@ import numpy as np
 import pytest
 
 from queens.iterators.monte_carlo import MonteCarlo
+from queens.utils.io import load_result
 
 
 @pytest.fixture(name="default_mc_iterator")
@@ -84,3 +85,81 @@ def test_correct_results(default_mc_iterator):
     np.testing.assert_allclose(
         default_mc_iterator.output["result"][0:10], ref_results, 1e-09, 1e-09
     )
+
+
+def test_sampling_from_independent_streams(default_mc_iterator):
+    """Test that samples from random streams do not depend on the global random state."""
+    default_mc_iterator.num_streams = 4
+    default_mc_iterator.pre_run()
+    samples = default_mc_iterator.samples
+
+    np.random.seed(1)
+    default_mc_iterator.pre_run()
+    np.testing.assert_array_equal(samples, default_mc_iterator.samples)
+    assert samples.shape == (100, 3)
+
+
+def test_streaming_with_precision_stopping(default_mc_iterator):
+    """Test that the streaming mode stops once the target standard error is reached."""
+    default_mc_iterator.pre_run()
+    samples = default_mc_iterator.samples.copy()
+    default_mc_iterator.core_run()
+    output = default_mc_iterator.output["result"]
+
+    default_mc_iterator.chunk_size = 10
+    default_mc_iterator.target_standard_error = 2.5 * np.std(output[:40], ddof=1) / np.sqrt(40)
+    default_mc_iterator.quantiles = [0.5]
+    default_mc_iterator.core_run()
+
+    num_samples = default_mc_iterator.moments.num_samples
+    assert num_samples < 100
+    np.testing.assert_array_equal(default_mc_iterator.samples, samples[:num_samples])
+    np.testing.assert_allclose(default_mc_iterator.output["result"], output[:num_samples])
+    np.testing.assert_allclose(default_mc_iterator.moments.mean, np.mean(output[:num_samples]))
+    np.testing.assert_allclose(
+        default_mc_iterator.streaming_statistics()["quantiles"],
+        np.median(output[:num_samples]).reshape(1, 1),
+    )
+
+    num_chunks = num_samples // 10
+    partial_results = load_result(
+        default_mc_iterator.global_settings.result_file(
+            ".pickle", suffix=f"_partial_chunk_{num_chunks - 1}"
+        )
+    )
+    assert partial_results["streaming_statistics"]["num_samples"] == num_samples
+    np.testing.assert_array_equal(
+        partial_results["input_data"], samples[num_samples - 10 : num_samples]
+    )
+    np.testing.assert_allclose(
+        partial_results["raw_output_data"]["result"], output[num_samples - 10 : num_samples]
+    )
+
+
+def test_randomized_quasi_monte_carlo(default_mc_iterator):
+    """Test the randomized quasi-Monte Carlo sampling."""
+    default_mc_iterator.num_samples = 64
+    default_mc_iterator.qmc_sequence = "sobol"
+    default_mc_iterator.num_randomizations = 4
+    default_mc_iterator.pre_run()
+    default_mc_iterator.core_run()
+
+    assert default_mc_iterator.samples.shape == (64, 3)
+    statistics = default_mc_iterator.rqmc_statistics()
+    np.testing.assert_allclose(statistics["mean"], default_mc_iterator.output["result"].mean(0))
+    assert statistics["standard_error"] > 0
+
+
+def test_streaming_with_quasi_monte_carlo(global_settings, default_parameters_mixed):
+    """Test that the streaming mode is rejected for randomized quasi-Monte Carlo sampling."""
+    with pytest.raises(ValueError, match="streaming mode"):
+        MonteCarlo(
+            model=None,
+            parameters=default_parameters_mixed,
+            global_settings=global_settings,
+            seed=42,
+            num_samples=64,
+            chunk_size=16,
+            qmc_sequence="sobol",
+            num_randomizations=4,
+        )
@@ -0,0 +1,118 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the optimization iterator."""
+
+import numpy as np
+import pytest
+from mock import Mock
+
+from queens.iterators.optimization import Optimization
+
+
+@pytest.fixture(name="model")
+def fixture_model():
+    """Model returning the squared norm of the positions."""
+    model = Mock()
+    model.evaluate = Mock(side_effect=lambda x: {"result": np.sum(x**2, axis=1, keepdims=True)})
+    return model
+
+
+@pytest.fixture(name="optimization")
+def fixture_optimization(model, default_parameters_uniform_2d, global_settings):
+    """Optimization iterator with a bounded number of precalculated positions."""
+    return Optimization(
+        model=model,
+        parameters=default_parameters_uniform_2d,
+        global_settings=global_settings,
+        initial_guess=[0.5, 0.5],
+        result_description=None,
+        max_precalculated_positions=2,
+    )
+
+
+def test_eval_model_reuses_precalculated_positions(optimization, model):
+    """Test that positions are only evaluated once."""
+    positions = np.array([[0.0, 1.0], [1.0, 2.0], [0.0, 1.0]])
+    np.testing.assert_array_equal(optimization.eval_model(positions), [1.0, 5.0, 1.0])
+
+    np.testing.assert_array_equal(model.evaluate.call_args[0][0], positions[:2])
+    np.testing.assert_array_equal(optimization.eval_model(np.array([[-0.0, 1.0]])), 1.0)
+    assert model.evaluate.call_count == 1
+
+
+def test_precalculated_positions_are_bounded(optimization):
+    """Test that the least recently used position is discarded."""
+    optimization.store_precalculated(np.array([0.0, 1.0]), 1.0)
+    optimization.store_precalculated(np.array([1.0, 2.0]), 5.0)
+    assert optimization.check_precalculated(np.array([0.0, 1.0])) == 1.0
+
+    optimization.store_precalculated(np.array([2.0, 2.0]), 8.0)
+    assert len(optimization.precalculated_positions) == 2
+    assert optimization.check_precalculated(np.array([1.0, 2.0])) is None
+    assert optimization.check_precalculated(np.array([0.0, 1.0])) == 1.0
+
+
+def test_multi_start_in_lockstep(default_parameters_uniform_2d, global_settings):
+    """Test that a multi-start optimization batches the evaluations of all starting points."""
+    model = Mock()
+    model.evaluate = Mock(
+        side_effect=lambda x: {
+            "result": ((x[:, 0] ** 2 - 1) ** 2 + (x[:, 1] - 0.5) ** 2).reshape(-1, 1)
+        }
+    )
+    optimization = Optimization(
+        model=model,
+        parameters=default_parameters_uniform_2d,
+        global_settings=global_settings,
+        initial_guess=[[-1.5, 0.0], [1.2, 1.0], [1.8, 0.0]],
+        result_description=None,
+        algorithm="L-BFGS-B",
+    )
+    optimization.core_run()
+
+    assert len(optimization.local_optima) == 3
+    np.testing.assert_allclose(optimization.local_optima[0].x, [-1.0, 0.5], atol=1e-4)
+    np.testing.assert_allclose(optimization.local_optima[2].x, [1.0, 0.5], atol=1e-4)
+    assert optimization.solution.fun == min(solution.fun for solution in optimization.local_optima)
+    # the first batch contains the objective and Jacobian positions of all starting points
+    first_batch = model.evaluate.call_args_list[0][0][0]
+    assert len(first_batch) == 3
+    assert model.evaluate.call_count < sum(
+        solution.nfev + solution.njev for solution in optimization.local_optima
+    )
+
+
+def test_lockstep_evaluates_model_once_per_step(
+    default_parameters_uniform_2d, global_settings, mocker
+):
+    """Test that each lockstep iteration evaluates the model once without a large cache."""
+    model = Mock()
+    model.evaluate = Mock(
+        side_effect=lambda x: {"result": np.sum((x - 0.2) ** 2, axis=1, keepdims=True)}
+    )
+    optimization = Optimization(
+        model=model,
+        parameters=default_parameters_uniform_2d,
+        global_settings=global_settings,
+        initial_guess=[[-1.0, 0.0], [1.0, 1.0]],
+        result_description=None,
+        algorithm="L-BFGS-B",
+        max_precalculated_positions=1,
+    )
+    spy = mocker.spy(optimization, "_evaluate_positions")
+    optimization.core_run()
+
+    np.testing.assert_allclose(optimization.solution.x, [0.2, 0.2], atol=1e-4)
+    assert model.evaluate.call_count == spy.call_count
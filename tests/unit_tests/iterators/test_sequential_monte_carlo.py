@@ -0,0 +1,117 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the Sequential Monte Carlo iterator."""
+
+import numpy as np
+import pytest
+from mock import Mock
+
+from queens.distributions.normal import Normal
+from queens.iterators.sequential_monte_carlo import SequentialMonteCarlo
+from queens.parameters.parameters import Parameters
+
+
+def gaussian_log_likelihood(samples):
+    """Gaussian log-likelihood with mean 0 and variance 1."""
+    return {"result": -0.5 * samples[:, 0] ** 2}
+
+
+@pytest.fixture(name="smc_iterator")
+def fixture_smc_iterator(global_settings):
+    """Sequential Monte Carlo iterator with adaptive rejuvenation."""
+    model = Mock()
+    model.evaluate.side_effect = gaussian_log_likelihood
+    return SequentialMonteCarlo(
+        model=model,
+        parameters=Parameters(x=Normal(mean=2.0, covariance=1.0)),
+        global_settings=global_settings,
+        num_particles=500,
+        result_description=None,
+        seed=42,
+        temper_type="bayes",
+        mcmc_proposal_distribution=Normal(mean=0.0, covariance=1.0),
+        num_rejuvenation_steps=2,
+        resampling_type="systematic",
+        max_rejuvenation_steps=20,
+        min_move_probability=0.99,
+    )
+
+
+def test_num_required_rejuvenation_steps(smc_iterator):
+    """Test the number of MH steps required to move the particles."""
+    assert smc_iterator.num_required_rejuvenation_steps(0.0) == np.inf
+    assert smc_iterator.num_required_rejuvenation_steps(1.0) == 1
+    assert smc_iterator.num_required_rejuvenation_steps(0.5) == 7
+
+
+def test_rejuvenate_stopping_rule(smc_iterator, mocker):
+    """Test that rounds of MH steps are repeated until the stopping rule is fulfilled."""
+    smc_iterator.pre_run()
+    mocker.patch.object(smc_iterator.mcmc_kernel, "core_run")
+    mocker.patch.object(
+        smc_iterator.mcmc_kernel,
+        "post_run",
+        return_value=[
+            smc_iterator.particles,
+            smc_iterator.log_likelihood,
+            smc_iterator.log_prior,
+            smc_iterator.log_posterior,
+            0.5,
+        ],
+    )
+    avg_accept = smc_iterator.rejuvenate(np.eye(1))
+
+    # 7 steps are required for an acceptance rate of 0.5, i.e., 4 rounds of 2 steps
+    assert smc_iterator.mcmc_kernel.core_run.call_count == 4
+    assert avg_accept == 0.5
+
+
+def test_adaptive_rejuvenation(smc_iterator):
+    """Test the posterior N(1, 0.5) with adaptive rejuvenation."""
+    smc_iterator.pre_run()
+    smc_iterator.core_run()
+
+    weights = smc_iterator.weights / np.sum(smc_iterator.weights)
+    mean = np.sum(weights * smc_iterator.particles[:, 0])
+    var = np.sum(weights * (smc_iterator.particles[:, 0] - mean) ** 2)
+    np.testing.assert_allclose(mean, 1.0, atol=0.1)
+    np.testing.assert_allclose(var, 0.5, atol=0.1)
+
+
+def test_independent_streams(global_settings):
+    """Test that SMC with independent streams does not depend on the global random state."""
+    particles = []
+    for global_seed in [0, 1]:
+        model = Mock()
+        model.evaluate.side_effect = gaussian_log_likelihood
+        smc_iterator = SequentialMonteCarlo(
+            model=model,
+            parameters=Parameters(x=Normal(mean=2.0, covariance=1.0)),
+            global_settings=global_settings,
+            num_particles=100,
+            result_description=None,
+            seed=42,
+            temper_type="bayes",
+            mcmc_proposal_distribution=Normal(mean=0.0, covariance=1.0),
+            num_rejuvenation_steps=2,
+            resampling_type="systematic",
+            independent_streams=True,
+        )
+        smc_iterator.pre_run()
+        np.random.seed(global_seed)
+        smc_iterator.core_run()
+        particles.append(smc_iterator.particles)
+
+    np.testing.assert_array_equal(particles[0], particles[1])
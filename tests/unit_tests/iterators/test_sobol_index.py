@@ -105,3 +105,44 @@ def test_correct_sensitivity_indices(default_sobol_index_iterator):
 
     np.testing.assert_allclose(si["S2"], ref_s2, 1e-07, 1e-07)
     np.testing.assert_allclose(si["S2_conf"], ref_s2_conf, 1e-07, 1e-07)
+
+
+def test_chunked_evaluation(default_sobol_index_iterator, global_settings, mocker):
+    """Test that chunked evaluation reproduces the indices and can be resumed."""
+    default_sobol_index_iterator.num_samples = 8
+    default_sobol_index_iterator.pre_run()
+    default_sobol_index_iterator.core_run()
+    reference_indices = default_sobol_index_iterator.sensitivity_indices
+
+    default_sobol_index_iterator.chunk_size = 2
+    default_sobol_index_iterator.pre_run()
+    default_sobol_index_iterator.core_run()
+    np.testing.assert_array_equal(
+        default_sobol_index_iterator.sensitivity_indices["ST"], reference_indices["ST"]
+    )
+    history = default_sobol_index_iterator.convergence_history
+    assert [entry["num_samples"] for entry in history] == [2, 4, 6, 8]
+    np.testing.assert_array_equal(history[-1]["S1_conf"], reference_indices["S1_conf"])
+    assert global_settings.result_file(".npz", suffix="_sobol_chunk_3").is_file()
+
+    default_sobol_index_iterator.resume = True
+    evaluate = mocker.spy(default_sobol_index_iterator.model, "evaluate")
+    default_sobol_index_iterator.pre_run()
+    default_sobol_index_iterator.core_run()
+    evaluate.assert_not_called()
+    np.testing.assert_array_equal(
+        default_sobol_index_iterator.sensitivity_indices["S1"], reference_indices["S1"]
+    )
+
+
+def test_convergence_stop(default_sobol_index_iterator):
+    """Test that the chunked evaluation stops once the confidence intervals are small."""
+    default_sobol_index_iterator.num_samples = 8
+    default_sobol_index_iterator.chunk_size = 2
+    default_sobol_index_iterator.convergence_tolerance = np.inf
+    default_sobol_index_iterator.pre_run()
+    default_sobol_index_iterator.core_run()
+
+    assert len(default_sobol_index_iterator.convergence_history) == 1
+    assert default_sobol_index_iterator.samples.shape == (16, 3)
+    assert default_sobol_index_iterator.output["result"].shape[0] == 16
@@ -0,0 +1,99 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the Sobol index estimator with GP uncertainty."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+import xarray as xr
+
+from queens.iterators.sobol_index_gp_uncertainty import SobolIndexGPUncertainty
+from queens.iterators.sobol_index_gp_uncertainty_utils.estimator import SobolIndexEstimator
+from queens.iterators.sobol_index_gp_uncertainty_utils.utils_estimate_indices import (
+    calculate_indices_first_total_order,
+    calculate_indices_second_order_gp_mean,
+)
+
+PARAMETER_NAMES = ["x1", "x2", "x3"]
+
+
+def _create_estimator(second_order, number_gp_realizations):
+    """Create an estimator for random predictions."""
+    method_options = {
+        "number_monte_carlo_samples": 50,
+        "second_order": second_order,
+        "number_gp_realizations": number_gp_realizations,
+        "number_bootstrap_samples": 5,
+    }
+    estimator = SobolIndexEstimator.from_config_create(method_options, PARAMETER_NAMES)
+    number_sample_matrices = 2 * len(PARAMETER_NAMES) + 2 if second_order else 5
+    prediction = xr.DataArray(
+        data=np.random.default_rng(0).normal(
+            size=(50, number_sample_matrices, number_gp_realizations)
+        ),
+        dims=("monte_carlo", "sample_matrix", "gp_realization"),
+    )
+    return estimator, prediction
+
+
+@pytest.mark.parametrize("num_procs", [1, 2])
+def test_estimate_over_realizations(num_procs):
+    """Test the estimates parallelized over GP realizations."""
+    estimator, prediction = _create_estimator(second_order=False, number_gp_realizations=3)
+    estimates = estimator.estimate(prediction, num_procs)
+    estimator.close_pool()
+
+    bootstrap_idx = estimator._draw_bootstrap_index()  # pylint: disable=protected-access
+    for input_dim, parameter_name in enumerate(PARAMETER_NAMES):
+        for realization in range(3):
+            first_order, total_order = calculate_indices_first_total_order(
+                prediction.data[:, :, realization], bootstrap_idx, input_dim, 5, "Saltelli2010"
+            )
+            index = {"parameter": parameter_name, "gp_realization": realization}
+            np.testing.assert_allclose(estimates["first_order"].loc[index], first_order)
+            np.testing.assert_allclose(estimates["total_order"].loc[index], total_order)
+
+
+def test_estimate_over_bootstrap_samples():
+    """Test the estimates parallelized over bootstrap samples with a persistent pool."""
+    estimator, prediction = _create_estimator(second_order=True, number_gp_realizations=1)
+    estimator.estimate(prediction, 2)
+    pool = estimator.pool
+    estimates = estimator.estimate(prediction, 2)
+    assert estimator.pool is pool
+    estimator.close_pool()
+    assert estimator.pool is None
+
+    bootstrap_idx = estimator._draw_bootstrap_index()  # pylint: disable=protected-access
+    for bootstrap_sample in range(5):
+        first_order, total_order, second_order = calculate_indices_second_order_gp_mean(
+            prediction.data[:, :, 0], bootstrap_idx[bootstrap_sample], 0, 3, "Saltelli2010"
+        )
+        index = {"parameter": "x1", "gp_realization": 0, "bootstrap": bootstrap_sample}
+        np.testing.assert_allclose(estimates["first_order"].loc[index], first_order)
+        np.testing.assert_allclose(estimates["total_order"].loc[index], total_order)
+        np.testing.assert_allclose(
+            estimates["second_order"].loc[index | {"crossparameter": ["x2", "x3"]}], second_order
+        )
+
+
+def test_pool_closed_on_failed_core_run():
+    """Test that the worker pool is terminated if the index calculation fails."""
+    iterator = Mock()
+    iterator.calculate_index.side_effect = RuntimeError("calculation failed")
+    with pytest.raises(RuntimeError, match="calculation failed"):
+        SobolIndexGPUncertainty.core_run(iterator)
+    iterator.index_estimator.close_pool.assert_called_once()
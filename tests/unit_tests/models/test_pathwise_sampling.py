@@ -0,0 +1,62 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for pathwise sampling of Gaussian process posteriors."""
+
+import numpy as np
+import pytest
+
+from queens.models.surrogates.utils.pathwise_sampling import SquaredExponentialPosteriorPaths
+
+
+@pytest.fixture(name="posterior_paths")
+def fixture_posterior_paths():
+    """Posterior sample paths of a GP trained on a sine."""
+    x_train = np.linspace(0.0, 1.0, 5).reshape(-1, 1)
+    return SquaredExponentialPosteriorPaths(
+        x_train,
+        np.sin(2 * np.pi * x_train),
+        lengthscales=0.3,
+        variance=1.5,
+        noise_variance=1e-2,
+        number_paths=20000,
+        number_features=2000,
+        rng=np.random.default_rng(3),
+    )
+
+
+def test_posterior_moments(posterior_paths):
+    """Test the moments of the paths against the exact posterior."""
+    x_test = np.array([[0.1], [0.37], [0.8], [1.3]])
+    paths = posterior_paths.evaluate(x_test, chunk_size=3)
+
+    x_train = posterior_paths.x_train
+    y_train = np.sin(2 * np.pi * x_train)
+    kernel_matrix = posterior_paths.kernel(x_train, x_train) + 1e-2 * np.eye(5)
+    cross_kernel = posterior_paths.kernel(x_test, x_train)
+    posterior_mean = cross_kernel @ np.linalg.solve(kernel_matrix, y_train)
+    posterior_covariance = posterior_paths.kernel(x_test, x_test) - cross_kernel @ np.linalg.solve(
+        kernel_matrix, cross_kernel.T
+    )
+
+    np.testing.assert_allclose(np.mean(paths, axis=1), posterior_mean.ravel(), atol=0.03)
+    np.testing.assert_allclose(np.cov(paths), posterior_covariance, atol=0.05)
+
+
+def test_paths_are_functions(posterior_paths):
+    """Test that the paths do not depend on the chunking of the inputs."""
+    x_test = np.linspace(0.0, 1.0, 7).reshape(-1, 1)
+    np.testing.assert_allclose(
+        posterior_paths.evaluate(x_test, chunk_size=2), posterior_paths.evaluate(x_test[::-1])[::-1]
+    )
@@ -18,7 +18,7 @@ import numpy as np
 import pytest
 from mock import Mock
 
-from queens.models.simulation import Simulation
+from queens.models.simulation import Simulation, evaluate_concurrently
 
 
 # ------------------ actual unit tests --------------------------- #
@@ -59,3 +59,53 @@ def test_grad():
     model.response = {"mean": None}
     with pytest.raises(ValueError):
         model.grad(None, upstream_gradient=upstream_gradient)
+
+
+def test_evaluate_concurrently():
+    """Test that models sharing a scheduler submit their jobs at once."""
+    scheduler = Mock()
+    scheduler.get_job_ids = lambda num_samples: np.arange(num_samples)
+    scheduler.evaluate_batches = lambda batches: [
+        {"result": samples**2} for samples, _, _ in batches
+    ]
+    models = [Simulation(scheduler=scheduler, driver=Mock()) for _ in range(3)]
+    other_model = Mock()
+    other_model.evaluate = lambda samples: {"result": -samples}
+    samples = [np.ones((2, 1)), np.zeros((0, 1)), 2 * np.ones((1, 1)), 3 * np.ones((1, 1))]
+
+    responses = evaluate_concurrently(models + [other_model], samples)
+
+    assert responses[1] is None
+    np.testing.assert_array_equal(responses[0]["result"], samples[0] ** 2)
+    np.testing.assert_array_equal(responses[2]["result"], samples[2] ** 2)
+    np.testing.assert_array_equal(responses[3]["result"], -samples[3])
+    assert [model.num_evaluations for model in models] == [2, 0, 1]
+    assert models[2].response == responses[2]
+
+
+def test_evaluate_concurrently_subclass():
+    """Test that subclasses with their own evaluation are not submitted concurrently."""
+
+    class NegatedSimulation(Simulation):
+        """Simulation model with a custom evaluation."""
+
+        def _evaluate(self, samples):
+            """Negate the samples."""
+            self.response = {"result": -samples}
+            return self.response
+
+    scheduler = Mock()
+    scheduler.evaluate_batches = lambda batches: [
+        {"result": samples**2} for samples, _, _ in batches
+    ]
+    scheduler.get_job_ids = lambda num_samples: np.arange(num_samples)
+    models = [Simulation(scheduler=scheduler, driver=Mock())]
+    models.append(NegatedSimulation(scheduler=scheduler, driver=Mock()))
+    samples = [2 * np.ones((1, 1)), 3 * np.ones((2, 1))]
+
+    responses = evaluate_concurrently(models, samples)
+
+    np.testing.assert_array_equal(responses[0]["result"], samples[0] ** 2)
+    np.testing.assert_array_equal(responses[1]["result"], -samples[1])
+    assert models[1].num_evaluations == 2
+    assert models[1].job_ids is None
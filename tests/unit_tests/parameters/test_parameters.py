@@ -17,9 +17,13 @@
 import numpy as np
 import pytest
 
+from queens.distributions.beta import Beta
+from queens.distributions.exponential import Exponential
+from queens.distributions.lognormal import LogNormal
 from queens.distributions.normal import Normal
 from queens.distributions.uniform import Uniform
 from queens.parameters.parameters import Parameters
+from queens.utils.random_generator import spawn_random_generators
 
 
 @pytest.fixture(name="parameters_set_1", scope="module")
@@ -79,6 +83,24 @@ def test_draw_samples(parameters_set_1):
     np.testing.assert_almost_equal(variance, np.array([19.00948, 1.03104, 2.09257]), decimal=5)
 
 
+def test_draw_samples_with_generator(parameters_set_1):
+    """Test *draw_samples* with a random number generator."""
+    samples = parameters_set_1.draw_samples(5, rng=np.random.default_rng(7))
+    np.random.seed(0)
+    np.testing.assert_array_equal(
+        samples, parameters_set_1.draw_samples(5, rng=np.random.default_rng(7))
+    )
+
+
+def test_draw_samples_from_streams(parameters_set_4):
+    """Test that each chunk of samples can be redrawn from its own stream."""
+    samples = parameters_set_4.draw_samples_from_streams(10, seed=3, num_streams=3)
+    assert samples.shape == (10, parameters_set_4.num_parameters)
+
+    rng = spawn_random_generators(3, 3)[1]
+    np.testing.assert_array_equal(samples[4:7], parameters_set_4.draw_samples(3, rng=rng))
+
+
 def test_joint_logpdf(parameters_set_1):
     """Test *joint_logpdf* method."""
     samples = np.array([1, 2, 3])
@@ -120,6 +142,82 @@ def test_to_list(parameters_set_1):
     assert len(parameters_list) == 2
 
 
+@pytest.fixture(name="parameters_set_4", scope="module")
+def fixture_parameters_set_4():
+    """Parameters with interleaved families and a multivariate parameter."""
+    return Parameters(
+        x1=Normal(mean=1.0, covariance=2.0),
+        x2=Normal(mean=-1.0, covariance=0.5),
+        x3=Uniform(lower_bound=-1, upper_bound=3),
+        x4=LogNormal(normal_mean=0.2, normal_covariance=0.3),
+        x5=Normal(mean=[0, 1], covariance=[[1, 0.5], [0.5, 2]]),
+        x6=Uniform(lower_bound=0, upper_bound=1),
+        x7=Exponential(rate=1.5),
+        x8=Normal(mean=3.0, covariance=1.0),
+    )
+
+
+def test_fused_prior_groups(parameters_set_4):
+    """Test that one-dimensional parameters of the same family are grouped."""
+    fused_prior = parameters_set_4.fused_prior
+    assert len(fused_prior.groups) == 3
+    assert [parameter for parameter, _ in fused_prior.ungrouped] == [
+        parameters_set_4.dict["x5"],
+        parameters_set_4.dict["x7"],
+    ]
+    np.testing.assert_array_equal(fused_prior.groups[0].columns, [0, 1, 8])
+
+
+def test_fused_prior_matches_individual_evaluation(parameters_set_4):
+    """Test the fused prior against the evaluation parameter by parameter."""
+    np.random.seed(42)
+    samples = parameters_set_4.draw_samples(50)
+    np.random.seed(42)
+    expected_samples = np.column_stack(
+        [parameter.draw(50) for parameter in parameters_set_4.to_list()]
+    )
+    np.testing.assert_array_equal(samples, expected_samples)
+
+    columns = np.cumsum([0] + [parameter.dimension for parameter in parameters_set_4.to_list()])
+    parameter_samples = [
+        (parameter, samples[:, start:end])
+        for parameter, start, end in zip(parameters_set_4.to_list(), columns[:-1], columns[1:])
+    ]
+    np.testing.assert_allclose(
+        parameters_set_4.joint_logpdf(samples),
+        np.sum([parameter.logpdf(sample) for parameter, sample in parameter_samples], axis=0),
+    )
+    np.testing.assert_allclose(
+        parameters_set_4.grad_joint_logpdf(samples),
+        np.column_stack(
+            [parameter.grad_logpdf(sample.copy()) for parameter, sample in parameter_samples]
+        ),
+    )
+
+    samples[0, 2] = 4.0
+    assert parameters_set_4.joint_logpdf(samples)[0] == -np.inf
+
+
+def test_fused_prior_inverse_cdf_transform():
+    """Test the fused inverse cdf transform against the individual ppfs."""
+    parameters_list = [
+        Normal(mean=1.0, covariance=2.0),
+        Uniform(lower_bound=-1, upper_bound=3),
+        LogNormal(normal_mean=0.2, normal_covariance=0.3),
+        Beta(lower_bound=0, upper_bound=2, a=2, b=3),
+        Normal(mean=3.0, covariance=1.0),
+    ]
+    parameters = Parameters(**{f"x{i}": parameter for i, parameter in enumerate(parameters_list)})
+    quantiles = np.random.default_rng(0).random((10, len(parameters_list)))
+
+    np.testing.assert_allclose(
+        parameters.inverse_cdf_transform(quantiles),
+        np.column_stack(
+            [parameter.ppf(quantiles[:, i]) for i, parameter in enumerate(parameters_list)]
+        ),
+    )
+
+
 # -------------------------------------------------------------------------------
 # -------------------------   With random field   -------------------------------
 # -------------------------------------------------------------------------------
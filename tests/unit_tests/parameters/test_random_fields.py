@@ -18,10 +18,18 @@ from unittest.mock import MagicMock
 
 import numpy as np
 import pytest
+import scipy.linalg
 
 from queens.distributions import Normal
 from queens.parameters.parameters import Parameters
-from queens.parameters.random_fields import Fourier, KarhunenLoeve, PieceWise
+from queens.parameters.random_fields import (
+    CirculantEmbedding,
+    Fourier,
+    KarhunenLoeve,
+    PieceWise,
+)
+from queens.parameters.random_fields.fourier import DimensionMethods2D, DimensionMethods3D
+from queens.utils.config_directories import random_field_cache_directory
 
 
 @pytest.fixture(name="parameters", scope="module")
@@ -333,6 +341,199 @@ def test_sample_as_dict(parameters):
     )
 
 
+def test_expand_random_field_realizations(parameters):
+    """Test that the batch expansion matches the expansion of single samples."""
+    samples = np.random.default_rng(42).normal(size=(5, 29))
+    samples_expanded = parameters.expand_random_field_realizations(samples)
+
+    assert samples_expanded.shape == (5, 27)
+    for sample, sample_expanded in zip(samples, samples_expanded):
+        np.testing.assert_almost_equal(
+            parameters.expand_random_field_realization(sample), sample_expanded
+        )
+
+
+def test_samples_as_dicts(parameters):
+    """Test *samples_as_dicts* method."""
+    samples = np.random.default_rng(42).normal(size=(3, 29))
+    sample_dicts = parameters.samples_as_dicts(samples)
+
+    assert len(sample_dicts) == 3
+    for sample, sample_dict in zip(samples, sample_dicts):
+        np.testing.assert_almost_equal(
+            list(sample_dict.values()), list(parameters.sample_as_dict(sample).values())
+        )
+        assert parameters.sample_as_dict(sample_dict) is sample_dict
+
+
+def test_fourier_basis_3d(tmp_path):
+    """Test the chunked assembly of the 3D Fourier basis."""
+    coordinates = np.random.default_rng(42).uniform(size=(7, 3))
+    number_expansion_terms = 3
+    covariance_index, latent_index, basis_dimension, dimension = DimensionMethods3D.get_dim(
+        4, number_expansion_terms
+    )
+    covariance = DimensionMethods3D.calculate_covariance(number_expansion_terms, 0.2, 1.5)
+    basis_args = (
+        coordinates,
+        basis_dimension,
+        number_expansion_terms,
+        1.5,
+        covariance,
+        latent_index,
+    )
+    basis = DimensionMethods3D.calculate_basis(*basis_args)
+
+    # reference: Kronecker products of the trigonometric factors per coordinate
+    wave_numbers = np.arange(number_expansion_terms) * np.pi / 1.5
+    arguments = coordinates[0, :, np.newaxis] * wave_numbers
+    cos, sin = np.cos(arguments), np.sin(arguments)
+    factors_2d = [(cos[0], cos[1]), (sin[0], sin[1]), (cos[0], sin[1]), (sin[0], cos[1])]
+    terms = [np.kron(np.kron(a, b), cos[2]) for a, b in factors_2d] + [
+        np.kron(np.kron(a, b), sin[2]) for a, b in factors_2d
+    ]
+    reference = np.stack(terms, axis=1) * covariance[:, None]
+    np.testing.assert_almost_equal(basis[0], reference[covariance_index].reshape(-1))
+
+    assert basis.shape == (7, dimension)
+    np.testing.assert_almost_equal(
+        DimensionMethods3D.calculate_basis(*basis_args, chunk_size=2), basis
+    )
+    basis_file = tmp_path / "basis.npy"
+    DimensionMethods3D.calculate_basis(*basis_args, chunk_size=3, basis_file=basis_file)
+    np.testing.assert_almost_equal(np.load(basis_file), basis)
+
+
+def test_karhunen_loeve_sparse_eigensolver():
+    """Test the sparse eigensolver backend of the Karhunen-Loeve expansion."""
+    grid = np.linspace(0, 1, 40).reshape(-1, 1)
+    coords = {"keys": [f"x_{i}" for i in range(40)], "coords": grid}
+    field = KarhunenLoeve(
+        coords,
+        std=0.5,
+        corr_length=0.2,
+        explained_variance=0.95,
+        cut_off=1e-6,
+        eigensolver="sparse",
+    )
+
+    # reference covariance matrix and eigenvalues
+    squared_distance = (grid - grid.T) ** 2
+    covariance = 0.25 * np.exp(-squared_distance / (2 * 0.2**2))
+    covariance[covariance < 1e-6] = 0
+    covariance += field.nugget_variance * np.eye(40)
+    eigenvalues = np.flip(scipy.linalg.eigh(covariance, eigvals_only=True))
+    dimension = (np.cumsum(eigenvalues) / np.sum(eigenvalues) < 0.95).argmin() + 1
+
+    np.testing.assert_almost_equal(field.cov_matrix.toarray(), covariance)
+    assert field.dimension == dimension
+    np.testing.assert_almost_equal(field.eigenvalues, eigenvalues[:dimension])
+    np.testing.assert_almost_equal(
+        covariance @ field.eigenvectors, field.eigenvectors * field.eigenvalues
+    )
+
+
+def test_karhunen_loeve_sparse_eigensolver_requires_cut_off():
+    """Test that the sparse eigensolver requires a positive cut off."""
+    coords = {"keys": ["x_0", "x_1"], "coords": np.array([[0.0], [1.0]])}
+    with pytest.raises(ValueError, match="cut_off"):
+        KarhunenLoeve(coords, latent_dimension=1, eigensolver="sparse")
+
+
+def test_karhunen_loeve_basis_cache(mocker, tmp_path):
+    """Test that the eigendecomposition is loaded from the cache if nothing changed."""
+    coords = {"keys": [f"x_{i}" for i in range(20)], "coords": np.linspace(0, 1, 20)}
+    field_options = {
+        "std": 0.5,
+        "explained_variance": 0.9,
+        "cut_off": 1e-6,
+        "eigensolver": "sparse",
+        "cache_basis": True,
+    }
+    field = KarhunenLoeve(coords, corr_length=0.2, **field_options)
+    assert random_field_cache_directory().parent == tmp_path
+    assert len(list(random_field_cache_directory().glob("KarhunenLoeve_*.npz"))) == 1
+
+    spy = mocker.spy(KarhunenLoeve, "eigendecomp_cov_matrix")
+    cached_field = KarhunenLoeve(coords, corr_length=0.2, **field_options)
+    assert spy.call_count == 0
+    assert cached_field.dimension == field.dimension
+    np.testing.assert_array_equal(cached_field.eigenbasis, field.eigenbasis)
+
+    KarhunenLoeve(coords, corr_length=0.3, **field_options)
+    assert spy.call_count == 1
+
+
+def test_fourier_basis_cache(mocker, pre_processor):
+    """Test that the Fourier basis is loaded from the cache if nothing changed."""
+    coords = pre_processor.coords_dict["field_2"]
+    field_options = {"variability": 0.1, "trunc_threshold": 1, "cache_basis": True}
+    field = Fourier(coords, corr_length=0.3, **field_options)
+
+    spy = mocker.spy(DimensionMethods2D, "calculate_basis")
+    cached_field = Fourier(coords, corr_length=0.3, **field_options)
+    assert spy.call_count == 0
+    np.testing.assert_array_equal(cached_field.basis, field.basis)
+
+
+@pytest.fixture(name="grid_coords")
+def fixture_grid_coords():
+    """Coordinates of a shuffled regular 2D grid."""
+    grid_x, grid_y = np.meshgrid(np.linspace(0, 1, 7), np.linspace(0, 2, 5))
+    coords = np.column_stack([grid_x.ravel(), grid_y.ravel()])
+    coords = coords[np.random.default_rng(42).permutation(len(coords))]
+    return {"keys": [f"field_{i}" for i in range(len(coords))], "coords": coords}
+
+
+def test_circulant_embedding_covariance(grid_coords):
+    """Test that the circulant embedding reproduces the covariance exactly."""
+    field = CirculantEmbedding(grid_coords, mean=1.0, std=2.0, corr_length=0.3)
+    assert field.grid_shape == (7, 5)
+    assert field.dimension == np.prod(field.embedding_shape)
+
+    # expanded representation of all latent unit vectors
+    basis = field.expanded_representation(np.eye(field.dimension)) - 1.0
+    coords = grid_coords["coords"]
+    squared_distance = np.sum((coords[:, np.newaxis] - coords[np.newaxis]) ** 2, axis=2)
+    covariance = 4.0 * np.exp(-squared_distance / (2 * 0.3**2))
+    np.testing.assert_almost_equal(basis.T @ basis, covariance)
+
+    upstream_gradient = np.random.default_rng(0).random((3, len(coords)))
+    np.testing.assert_almost_equal(
+        field.latent_gradient(upstream_gradient), upstream_gradient @ basis.T
+    )
+
+
+def test_circulant_embedding_parameters(grid_coords):
+    """Test the circulant embedding random field within the parameters."""
+    field = CirculantEmbedding(grid_coords, corr_length=0.3)
+    parameters = Parameters(x=Normal(mean=0.0, covariance=1.0), field=field)
+    samples = parameters.draw_samples(4)
+
+    assert samples.shape == (4, field.dimension + 1)
+    expanded_samples = parameters.expand_random_field_realizations(samples)
+    np.testing.assert_array_equal(expanded_samples[:, 0], samples[:, 0])
+    np.testing.assert_almost_equal(
+        expanded_samples[:, 1:], field.expanded_representation(samples[:, 1:])
+    )
+    np.testing.assert_almost_equal(
+        parameters.joint_logpdf(samples),
+        parameters.dict["x"].logpdf(samples[:, :1]) + field.logpdf(samples[:, 1:]),
+    )
+
+
+def test_circulant_embedding_irregular_grid(grid_coords):
+    """Test that coordinates not on a complete regular grid raise an error."""
+    grid_coords["coords"][0, 0] += 0.01
+    with pytest.raises(ValueError, match="regular grid"):
+        CirculantEmbedding(grid_coords)
+
+    grid_coords["coords"] = grid_coords["coords"][1:]
+    grid_coords["keys"] = grid_coords["keys"][1:]
+    with pytest.raises(ValueError, match="complete regular grid"):
+        CirculantEmbedding(grid_coords)
+
+
 def test_to_list(parameters):
     """Test *to_list* method."""
     parameters_list = parameters.to_list()
@@ -0,0 +1,48 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Test-module for the alias table."""
+
+import numpy as np
+import pytest
+
+from queens.utils.alias_table import AliasTable
+
+
+@pytest.mark.parametrize(
+    "probabilities",
+    [np.array([0.1, 0.2, 0.3, 0.4]), np.array([0.0, 0.9, 0.05, 0.05]), np.ones(50) / 50],
+)
+def test_alias_table_probabilities(probabilities):
+    """Test that the table reproduces the probabilities exactly."""
+    alias_table = AliasTable(probabilities)
+    num_events = len(probabilities)
+    reconstructed_probabilities = np.bincount(
+        np.concatenate([np.arange(num_events), alias_table.aliases]),
+        weights=np.concatenate(
+            [alias_table.acceptance_probabilities, 1 - alias_table.acceptance_probabilities]
+        ),
+        minlength=num_events,
+    )
+    np.testing.assert_allclose(reconstructed_probabilities / num_events, probabilities, atol=1e-14)
+
+
+def test_alias_table_draw():
+    """Test the relative frequencies of the drawn indices."""
+    probabilities = np.array([0.5, 0.0, 0.3, 0.2])
+    np.random.seed(42)
+    indices = AliasTable(probabilities).draw(100_000)
+    np.testing.assert_allclose(
+        np.bincount(indices, minlength=4) / len(indices), probabilities, atol=1e-2
+    )
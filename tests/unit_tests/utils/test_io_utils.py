@@ -22,7 +22,12 @@ import pytest
 import yaml
 
 from queens.utils.exceptions import FileTypeError
-from queens.utils.io import load_input_file, write_to_csv
+from queens.utils.io import (
+    load_chunk_results,
+    load_input_file,
+    write_chunk_results,
+    write_to_csv,
+)
 
 
 @pytest.fixture(name="input_dict")
@@ -83,3 +88,21 @@ def test_write_to_csv(tmp_path):
 
     # read the data in again and compare to original data
     np.testing.assert_array_equal(data, read_in_data)
+
+
+def test_chunk_results(tmp_path):
+    """Test writing and loading the results of a chunk of samples."""
+    chunk_file = tmp_path / "chunk_0.npz"
+    samples = np.arange(6.0).reshape(3, 2)
+    response = {"result": samples[:, :1] ** 2, "gradient": np.full(3, None)}
+
+    assert load_chunk_results(chunk_file, samples) is None
+    chunk_output = write_chunk_results(chunk_file, samples, response)
+    assert list(chunk_output) == ["result"]
+
+    loaded_output = load_chunk_results(chunk_file, samples)
+    np.testing.assert_array_equal(loaded_output["result"], response["result"])
+    assert load_chunk_results(chunk_file, samples + 1.0) is None
+
+    chunk_file.write_bytes(b"corrupted")
+    assert load_chunk_results(chunk_file, samples) is None
@@ -0,0 +1,94 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for optimized Latin hypercube designs."""
+
+import numpy as np
+import pytest
+from scipy.spatial.distance import pdist
+
+from queens.utils.latin_hypercube import (
+    CorrelationCriterion,
+    MaximinCriterion,
+    latin_hypercube,
+    optimize_latin_hypercube,
+    optimized_latin_hypercube,
+)
+
+
+def _is_latin_hypercube(samples):
+    """Check that each cell of each dimension contains exactly one sample."""
+    cells = (samples * samples.shape[0]).astype(int)
+    return all(np.array_equal(np.sort(column), np.arange(samples.shape[0])) for column in cells.T)
+
+
+@pytest.mark.parametrize("criterion_class", [MaximinCriterion, CorrelationCriterion])
+def test_incremental_difference(criterion_class):
+    """Test the incremental change of the criteria against a full evaluation."""
+    samples = latin_hypercube(30, 4, rng=np.random.default_rng(2))
+    criterion = criterion_class(samples.copy())
+
+    def full_criterion(design):
+        if criterion_class is MaximinCriterion:
+            return np.sum((pdist(design) ** 2 / criterion.reference_distance) ** (-5))
+        return np.sum(np.corrcoef(design.T) ** 2) - design.shape[1]
+
+    value = full_criterion(criterion.samples)
+    difference = criterion.difference(2, 3, 7)
+    criterion.exchange(2, 3, 7)
+    np.testing.assert_allclose(full_criterion(criterion.samples) - value, difference, rtol=1e-8)
+    assert _is_latin_hypercube(criterion.samples)
+
+
+@pytest.mark.parametrize("criterion", ["maximin", "centermaximin"])
+def test_maximin_improves_minimal_distance(criterion):
+    """Test that the optimization increases the minimal distance of the points."""
+    initial_samples = latin_hypercube(
+        50, 3, centered=criterion == "centermaximin", rng=np.random.default_rng(3)
+    )
+    samples = optimized_latin_hypercube(
+        50, 3, criterion=criterion, num_exchanges=2000, rng=np.random.default_rng(3)
+    )
+    assert _is_latin_hypercube(samples)
+    assert np.min(pdist(samples)) > 2 * np.min(pdist(initial_samples))
+
+
+def test_correlation_reduces_correlation():
+    """Test that the optimization decorrelates the columns."""
+    initial_samples = latin_hypercube(50, 3, rng=np.random.default_rng(3))
+    samples = optimized_latin_hypercube(
+        50, 3, criterion="corr", num_exchanges=2000, rng=np.random.default_rng(3)
+    )
+
+    def max_correlation(design):
+        return np.max(np.abs(np.corrcoef(design.T) - np.eye(design.shape[1])))
+
+    assert _is_latin_hypercube(samples)
+    assert max_correlation(samples) < 0.1 * max_correlation(initial_samples)
+
+
+def test_early_stopping(mocker):
+    """Test that the optimization stops once the design no longer improves."""
+    criterion = MaximinCriterion(latin_hypercube(20, 2, rng=np.random.default_rng(0)))
+    spy = mocker.spy(criterion, "difference")
+    samples = optimize_latin_hypercube(criterion, 10**6, rng=np.random.default_rng(0))
+
+    assert _is_latin_hypercube(samples)
+    assert spy.call_count < 10**4
+
+
+def test_center():
+    """Test that centered designs place the points in the centers of their cells."""
+    samples = optimized_latin_hypercube(10, 2, criterion="c", rng=np.random.default_rng(0))
+    np.testing.assert_allclose(np.sort(samples, axis=0).T, [np.arange(0.05, 1, 0.1)] * 2)
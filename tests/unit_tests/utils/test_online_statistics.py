@@ -0,0 +1,66 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the online statistics."""
+
+import numpy as np
+import pytest
+
+from queens.utils.online_statistics import OnlineMoments, QuantileSketch
+
+
+@pytest.fixture(name="samples")
+def fixture_samples():
+    """Correlated samples."""
+    rng = np.random.default_rng(3)
+    samples = rng.normal(size=(2000, 2))
+    samples[:, 1] += 0.5 * samples[:, 0] + 10.0
+    return samples
+
+
+def test_online_moments(samples):
+    """Test the batched moments against the moments of all samples."""
+    moments = OnlineMoments(track_covariance=True)
+    for batch in np.array_split(samples, [1, 10, 500, 1300]):
+        moments.update(batch)
+
+    assert moments.num_samples == 2000
+    np.testing.assert_allclose(moments.mean, samples.mean(axis=0))
+    np.testing.assert_allclose(moments.covariance, np.cov(samples.T))
+    np.testing.assert_allclose(moments.variance, samples.var(axis=0, ddof=1))
+    np.testing.assert_allclose(moments.standard_error, samples.std(axis=0, ddof=1) / np.sqrt(2000))
+
+
+def test_online_moments_without_covariance(samples):
+    """Test that the covariance is only available if tracked."""
+    moments = OnlineMoments()
+    moments.update(samples[:100])
+    moments.update(samples[100:])
+    np.testing.assert_allclose(moments.variance, samples.var(axis=0, ddof=1))
+    with pytest.raises(ValueError):
+        _ = moments.covariance
+
+
+def test_quantile_sketch(samples):
+    """Test the streaming quantiles against the quantiles of all samples."""
+    sketch = QuantileSketch(max_centroids=100)
+    for batch in np.array_split(samples, 20):
+        sketch.update(batch)
+
+    assert all(len(centroids) <= 100 for centroids in sketch.centroids)
+    np.testing.assert_allclose(
+        sketch.quantiles([0.1, 0.5, 0.9]),
+        np.quantile(samples, [0.1, 0.5, 0.9], axis=0),
+        atol=0.05,
+    )
@@ -0,0 +1,62 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Unit tests for the randomized quasi-Monte Carlo sampling."""
+
+import numpy as np
+import pytest
+
+from queens.distributions.normal import Normal
+from queens.distributions.uniform import Uniform
+from queens.parameters.parameters import Parameters
+from queens.utils.quasi_monte_carlo import draw_rqmc_samples, rqmc_mean_and_standard_error
+
+
+@pytest.fixture(name="parameters")
+def fixture_parameters():
+    """Uniform and normal parameters."""
+    return Parameters(x1=Uniform(lower_bound=0, upper_bound=2), x2=Normal(mean=1, covariance=4))
+
+
+@pytest.mark.parametrize("sequence", ["sobol", "halton"])
+def test_draw_rqmc_samples(parameters, sequence):
+    """Test the shape, reproducibility and accuracy of the samples."""
+    samples, randomization_ids = draw_rqmc_samples(parameters, 512, 4, sequence, seed=2)
+
+    assert samples.shape == (512, 2)
+    np.testing.assert_array_equal(randomization_ids, np.repeat(np.arange(4), 128))
+    np.testing.assert_array_equal(
+        samples, draw_rqmc_samples(parameters, 512, 4, sequence, seed=2)[0]
+    )
+    assert not np.array_equal(samples[:128], samples[128:256])
+    # each randomization is a low-discrepancy set with an accurate mean
+    np.testing.assert_allclose(samples[:128, 0].mean(), 1.0, atol=1e-2)
+
+
+def test_draw_rqmc_samples_indivisible(parameters):
+    """Test the error for numbers of samples not divisible by the randomizations."""
+    with pytest.raises(ValueError, match="divisible"):
+        draw_rqmc_samples(parameters, 10, 3)
+
+
+def test_rqmc_mean_and_standard_error():
+    """Test the estimates from the means of the randomizations."""
+    outputs = np.array([[1.0], [3.0], [2.0], [6.0], [0.0], [2.0]])
+    mean, standard_error = rqmc_mean_and_standard_error(outputs, np.array([0, 0, 1, 1, 2, 2]))
+
+    np.testing.assert_allclose(mean, [7 / 3])
+    np.testing.assert_allclose(standard_error, [np.std([2.0, 4.0, 1.0], ddof=1) / np.sqrt(3)])
+
+    _, standard_error = rqmc_mean_and_standard_error(outputs, np.zeros(6))
+    assert np.isnan(standard_error).all()
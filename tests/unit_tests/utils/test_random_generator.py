@@ -0,0 +1,51 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Test-module for random number generator utils."""
+
+import numpy as np
+
+from queens.utils.random_generator import (
+    get_random_generator,
+    spawn_random_generators,
+    split_into_chunks,
+)
+
+
+def test_get_random_generator():
+    """Test that the global random state is used by default."""
+    np.random.seed(3)
+    expected_samples = np.random.randn(5)
+    np.random.seed(3)
+    np.testing.assert_array_equal(get_random_generator().standard_normal(5), expected_samples)
+
+    rng = np.random.default_rng(3)
+    assert get_random_generator(rng) is rng
+
+
+def test_spawn_random_generators():
+    """Test that spawned streams are reproducible and independent."""
+    first_streams = spawn_random_generators(42, 3)
+    second_streams = spawn_random_generators(np.random.SeedSequence(42), 3)
+    samples = [rng.random(10) for rng in first_streams]
+
+    for sample, rng in zip(samples, second_streams):
+        np.testing.assert_array_equal(sample, rng.random(10))
+    assert not np.allclose(samples[0], samples[1])
+
+
+def test_split_into_chunks():
+    """Test the split of samples into chunks."""
+    np.testing.assert_array_equal(split_into_chunks(10, 4), [3, 3, 2, 2])
+    np.testing.assert_array_equal(split_into_chunks(2, 3), [1, 1, 0])
@@ -0,0 +1,204 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Tests for the re-processing of experiment directories."""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+import yaml
+
+from queens.data_processors.numpy_file import NumpyFile
+from queens.utils.cli import reprocess_experiment_dir_cli
+from queens.utils.exceptions import FileTypeError
+from queens.utils.reprocessing import (
+    data_processor_from_config,
+    data_processor_hash,
+    reprocess_experiment_dir,
+    reprocess_experiment_dir_from_config,
+)
+
+
+@pytest.fixture(name="experiment_dir")
+def fixture_experiment_dir(tmp_path):
+    """Experiment directory with numpy outputs of three jobs."""
+    for job_id in range(3):
+        output_dir = tmp_path / str(job_id) / "output"
+        output_dir.mkdir(parents=True)
+        np.save(output_dir / "result.npy", np.array([job_id, 2.0 * job_id]))
+    return tmp_path
+
+
+@pytest.fixture(name="data_processor")
+def fixture_data_processor():
+    """Numpy data processor."""
+    return NumpyFile(file_name_identifier="result.npy", file_options_dict={})
+
+
+@pytest.fixture(name="data_processor_config_path")
+def fixture_data_processor_config_path(tmp_path):
+    """Path to a numpy data processor configuration."""
+    config_path = tmp_path / "data_processor.yaml"
+    config_path.write_text(
+        yaml.safe_dump(
+            {"type": "numpy", "file_name_identifier": "result.npy", "file_options_dict": {}}
+        )
+    )
+    return config_path
+
+
+def test_reprocess_experiment_dir(experiment_dir, data_processor):
+    """Test that all jobs are processed and written to the output file."""
+    job_ids, data = reprocess_experiment_dir(experiment_dir, data_processor)
+
+    np.testing.assert_array_equal(job_ids, [0, 1, 2])
+    np.testing.assert_array_equal(data, [[0, 0], [1, 2], [2, 4]])
+    with np.load(experiment_dir / "reprocessed_data.npz") as output:
+        np.testing.assert_array_equal(output["job_ids"], job_ids)
+        np.testing.assert_array_equal(output["data"], data)
+
+
+def test_reprocess_experiment_dir_cache(experiment_dir, data_processor, mocker):
+    """Test that unchanged jobs are skipped on repeated runs."""
+    reprocess_experiment_dir(experiment_dir, data_processor)
+
+    output_file = experiment_dir / "1" / "output" / "result.npy"
+    np.save(output_file, np.array([10.0, 20.0]))
+
+    spy = mocker.spy(data_processor, "get_data_from_file")
+    job_ids, data = reprocess_experiment_dir(experiment_dir, data_processor)
+
+    assert spy.call_count == 1
+    assert spy.call_args.args[0] == output_file.parent
+    np.testing.assert_array_equal(job_ids, [0, 1, 2])
+    np.testing.assert_array_equal(data, [[0, 0], [10, 20], [2, 4]])
+
+
+def test_reprocess_experiment_dir_missing_output(experiment_dir, data_processor):
+    """Test that jobs without output are dropped from the cache and the output."""
+    reprocess_experiment_dir(experiment_dir, data_processor)
+    (experiment_dir / "1" / "output" / "result.npy").unlink()
+
+    job_ids, data = reprocess_experiment_dir(experiment_dir, data_processor)
+
+    np.testing.assert_array_equal(job_ids, [0, 2])
+    np.testing.assert_array_equal(data, [[0, 0], [2, 4]])
+
+
+def test_reprocess_experiment_dir_failing_job(experiment_dir, data_processor):
+    """Test that a failing job does not abort the re-processing of the other jobs."""
+    np.save(experiment_dir / "1" / "output" / "result_copy.npy", np.zeros(2))
+    data_processor.file_name_identifier = "result*.npy"
+
+    job_ids, _ = reprocess_experiment_dir(experiment_dir, data_processor)
+
+    np.testing.assert_array_equal(job_ids, [0, 2])
+
+
+def test_reprocess_experiment_dir_ragged_data(experiment_dir, data_processor):
+    """Test that data of different shapes raises an error naming the jobs."""
+    np.save(experiment_dir / "2" / "output" / "result.npy", np.zeros(3))
+
+    with pytest.raises(ValueError, match=r"\(3,\): jobs \[2\]"):
+        reprocess_experiment_dir(experiment_dir, data_processor)
+
+
+@pytest.mark.max_time_for_test(10)
+def test_reprocess_experiment_dir_parallel(experiment_dir, data_processor):
+    """Test the re-processing with multiple workers."""
+    job_ids, data = reprocess_experiment_dir(experiment_dir, data_processor, num_workers=2)
+
+    np.testing.assert_array_equal(job_ids, [0, 1, 2])
+    np.testing.assert_array_equal(data, [[0, 0], [1, 2], [2, 4]])
+
+
+def test_reprocess_experiment_dir_parquet(experiment_dir, data_processor):
+    """Test the parquet output."""
+    output_path = experiment_dir / "data.parquet"
+    reprocess_experiment_dir(experiment_dir, data_processor, output_path=output_path)
+
+    data_frame = pd.read_parquet(output_path)
+    np.testing.assert_array_equal(data_frame["job_id"], [0, 1, 2])
+    np.testing.assert_array_equal(data_frame[["data_0", "data_1"]], [[0, 0], [1, 2], [2, 4]])
+
+
+def test_reprocess_experiment_dir_parquet_empty(tmp_path, data_processor):
+    """Test the parquet output of an experiment directory without jobs."""
+    output_path = tmp_path / "data.parquet"
+    job_ids, _ = reprocess_experiment_dir(tmp_path, data_processor, output_path=output_path)
+
+    assert len(job_ids) == 0
+    assert list(pd.read_parquet(output_path).columns) == ["job_id"]
+
+
+def test_data_processor_from_config_refuses_clean_up():
+    """Test that configurations deleting output files are refused."""
+    config = {
+        "type": "numpy",
+        "file_name_identifier": "result.npy",
+        "file_options_dict": {},
+        "files_to_be_deleted_regex_lst": ["*.npy"],
+    }
+    with pytest.raises(ValueError, match="files_to_be_deleted_regex_lst"):
+        data_processor_from_config(config)
+
+
+def test_data_processor_hash_is_order_independent():
+    """Test that the cache key does not depend on the order of nested options."""
+    config_1 = {"type": "csv", "file_options_dict": {"a": 1, "b": {"c": 2, "d": 3}}}
+    config_2 = {"file_options_dict": {"b": {"d": 3, "c": 2}, "a": 1}, "type": "csv"}
+    assert data_processor_hash(config_1) == data_processor_hash(config_2)
+
+
+def test_reprocess_experiment_dir_cli(experiment_dir, data_processor_config_path, monkeypatch):
+    """Test the CLI entry point."""
+    output_path = experiment_dir / "data.npz"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "queens-reprocess-experiment",
+            "--experiment_dir",
+            str(experiment_dir),
+            "--data_processor",
+            str(data_processor_config_path),
+            "--output_path",
+            str(output_path),
+        ],
+    )
+    reprocess_experiment_dir_cli()
+
+    with np.load(output_path) as output:
+        np.testing.assert_array_equal(output["job_ids"], [0, 1, 2])
+
+
+def test_reprocess_experiment_dir_from_config(experiment_dir, data_processor_config_path):
+    """Test the re-processing with a data processor configuration file."""
+    output_path = experiment_dir / "data.npz"
+    job_ids, _ = reprocess_experiment_dir_from_config(
+        experiment_dir, data_processor_config_path, output_path=output_path
+    )
+
+    np.testing.assert_array_equal(job_ids, [0, 1, 2])
+    assert output_path.is_file()
+
+
+def test_reprocess_experiment_dir_wrong_output_format(experiment_dir, data_processor):
+    """Test that unsupported output formats raise an error."""
+    with pytest.raises(FileTypeError, match="Only npz or parquet"):
+        reprocess_experiment_dir(
+            experiment_dir, data_processor, output_path=experiment_dir / "data.csv"
+        )
@@ -0,0 +1,70 @@
+#
+# SPDX-License-Identifier: LGPL-3.0-or-later
+# Copyright (c) 2024-2025, QUEENS contributors.
+#
+# This file is part of QUEENS.
+#
+# QUEENS is free software: you can redistribute it and/or modify it under the terms of the GNU
+# Lesser General Public License as published by the Free Software Foundation, either version 3 of
+# the License, or (at your option) any later version. QUEENS is distributed in the hope that it will
+# be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more details. You
+# should have received a copy of the GNU Lesser General Public License along with QUEENS. If not,
+# see <https://www.gnu.org/licenses/>.
+#
+"""Test-module for resampling functionality of smc_utils module."""
+
+import numpy as np
+import pytest
+
+from queens.utils import sequential_monte_carlo
+
+
+@pytest.fixture(name="resampling_type", params=sequential_monte_carlo.VALID_RESAMPLING_TYPES)
+def fixture_resampling_type(request):
+    """Return a valid resampling type."""
+    return request.param
+
+
+def test_resampling_unbiased(resampling_type):
+    """Test that the expected number of copies is proportional to the weights."""
+    resampling = sequential_monte_carlo.resampling_factory(resampling_type)
+    weights = np.array([0.5, 3.0, 0.0, 1.5, 5.0])
+    rng = np.random.default_rng(0)
+    num_repetitions = 2000
+
+    counts = np.zeros(len(weights))
+    for _ in range(num_repetitions):
+        indices = resampling(weights, rng=rng)
+        assert len(indices) == len(weights)
+        assert np.all(np.diff(indices) >= 0)
+        counts += np.bincount(indices, minlength=len(weights))
+
+    np.testing.assert_allclose(
+        counts / num_repetitions, len(weights) * weights / np.sum(weights), atol=0.1
+    )
+
+
+@pytest.mark.parametrize("resampling_type", ["systematic", "stratified", "residual"])
+def test_resampling_low_variance(resampling_type):
+    """Test that the low-variance schemes keep at least the integer part of the copies."""
+    resampling = sequential_monte_carlo.resampling_factory(resampling_type)
+    weights = np.array([0.1, 0.45, 0.05, 0.4])
+    counts = np.bincount(resampling(weights, 100, rng=np.random.default_rng(3)), minlength=4)
+    assert np.all(np.abs(counts - 100 * weights) < 2)
+
+
+def test_multinomial_resampling_matches_counts():
+    """Test that multinomial resampling expands the multinomial counts in order."""
+    weights = np.array([0.2, 0.3, 0.5])
+    counts = np.random.default_rng(1).multinomial(6, weights)
+    np.testing.assert_array_equal(
+        sequential_monte_carlo.multinomial_resampling(weights, 6, rng=np.random.default_rng(1)),
+        np.repeat(np.arange(3), counts),
+    )
+
+
+def test_resampling_factory_invalid():
+    """Test the function factory for invalid keyword."""
+    with pytest.raises(ValueError, match=r"Unknown type.*"):
+        sequential_monte_carlo.resampling_factory("invalid")